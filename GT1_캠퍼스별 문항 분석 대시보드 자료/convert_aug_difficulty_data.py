@@ -1,5 +1,9 @@
 import pandas as pd
 import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from lt_data.loader import write_cache
 
 # Define paths
 base_dir = r"c:\Users\user\projects\LT_data_analysis"
@@ -27,6 +31,7 @@ def convert_excel_to_csv():
         
     print(f"Saving to {dest_file}...")
     df.to_csv(dest_file, index=False, encoding='utf-8-sig')
+    write_cache(df, dest_file)
     print("Done.")
 
 if __name__ == "__main__":
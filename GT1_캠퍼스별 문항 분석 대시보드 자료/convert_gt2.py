@@ -1,6 +1,10 @@
 
 import pandas as pd
 import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from lt_data.loader import write_cache
 
 # Define file paths
 input_file = r'c:\Users\user\projects\LT_data_analysis\raw_data\LT_문항데이터_2025년_11월_Gr2.xlsx'
@@ -14,6 +18,7 @@ try:
     
     # Save to CSV
     df.to_csv(output_file, index=False, encoding='utf-8-sig')
+    write_cache(df, output_file)
     print(f"Successfully created CSV: {output_file}")
     
 except Exception as e:
@@ -2,18 +2,26 @@ import pandas as pd
 import glob
 import os
 
-def analyze_campuses():
-    data_dir = r"c:\Users\user\projects\LT_data_analysis\2025_LT_11월_data"
-    all_files = glob.glob(os.path.join(data_dir, "*.csv"))
+from lt_data.catalog import Catalog
+from lt_data.keys import StudentKeys, add_student_ids
+
+def analyze_campuses(campus=None):
+    # 레벨별 파일은 처음 접근할 때 한 번만 읽는다. campus 를 주면 그 캠퍼스만 분석
+    catalog = Catalog(r"c:\Users\user\projects\LT_data_analysis")
+    level_dfs = [catalog.load('2025-11', level=level, campus=campus,
+                              columns=['캠퍼스', '학번', '이름', '교육과정', '스킬', '정답여부'])
+                 for level in catalog.levels('2025-11')]
     
     dfs = []
-    for file in all_files:
+    keys = StudentKeys()
+    for df in level_dfs:
         # We need to calculate scores per student first
-        df = pd.read_csv(file)
         # Group by student to get their score and campus
-        # Score is number of 'Y' in '정답여부'
-        student_scores = df.groupby(['캠퍼스', '학번', '이름', '교육과정']).agg({
-            '정답여부': lambda x: (x == 'Y').sum()
+        # Score is number of True in '정답여부'
+        # Integer student key (학번 -> student_id) instead of the (학번, 이름) pair
+        add_student_ids(df, '2025-11', keys)
+        student_scores = df.groupby(['캠퍼스', 'student_id', '교육과정'], observed=True).agg({
+            '정답여부': 'sum'
         }).reset_index()
         student_scores.rename(columns={'정답여부': 'Score', '교육과정': 'Level'}, inplace=True)
         dfs.append(student_scores)
@@ -23,9 +31,9 @@ def analyze_campuses():
     # Campus Summary
     campus_stats = combined_students.groupby('캠퍼스').agg({
         'Score': 'mean',
-        '학번': 'count'
+        'student_id': 'count'
     }).reset_index()
-    campus_stats.rename(columns={'Score': 'Avg_Score', '학번': 'Student_Count'}, inplace=True)
+    campus_stats.rename(columns={'Score': 'Avg_Score', 'student_id': 'Student_Count'}, inplace=True)
     
     # MAG2 Ratio
     mag2_counts = combined_students[combined_students['Level'] == 'MAG2'].groupby('캠퍼스').size().reset_index(name='MAG2_Count')
@@ -40,10 +48,13 @@ def analyze_campuses():
     
     # Let's also look at Skill performance per campus for "Strengths/Weaknesses"
     # This requires looking at the original long-format data
-    all_raw_data = pd.concat([pd.read_csv(f) for f in all_files])
-    skill_stats = all_raw_data.groupby(['캠퍼스', '스킬']).agg({
-        '정답여부': lambda x: (x == 'Y').mean() * 100
+    all_raw_data = pd.concat([df[['캠퍼스', '스킬', '정답여부']] for df in level_dfs])
+    # Missing answers count against accuracy (share of 'Y' rows)
+    all_raw_data['정답여부'] = all_raw_data['정답여부'].fillna(False).astype(bool)
+    skill_stats = all_raw_data.groupby(['캠퍼스', '스킬'], observed=True).agg({
+        '정답여부': 'mean'
     }).reset_index()
+    skill_stats['정답여부'] *= 100
     skill_stats.rename(columns={'정답여부': 'Accuracy'}, inplace=True)
     
     return campus_stats, skill_stats
@@ -2,26 +2,23 @@ import pandas as pd
 import glob
 import os
 
-# Define grading criteria
-ABSOLUTE_CUTS = [
-    (54, 1), (48, 2), (42, 3), (36, 4), (30, 5), (24, 6), (18, 7), (12, 8), (0, 9)
-]
+from lt_data.grading import load_cuts
+from lt_data.keys import StudentKeys, add_student_ids
+from lt_data.loader import iter_sheet
+from lt_data.ranking import rank
+from lt_data.scorer import StudentScorer
 
-RELATIVE_CUTS = [
-    (4, 1), (11, 2), (23, 3), (40, 4), (60, 5), (77, 6), (89, 7), (96, 8), (100, 9)
-]
+# Define grading criteria (lt_data/grade_cuts.csv)
+CUT_TABLES = load_cuts()
+ABSOLUTE_CUTS = CUT_TABLES['수능_절대_60']
+RELATIVE_CUTS = CUT_TABLES['수능_상대']
 
 def get_absolute_grade(score):
-    for cut, grade in ABSOLUTE_CUTS:
-        if score >= cut:
-            return grade
-    return 9
+    # score: 점수 하나 또는 Series (한 번에 전체 학생)
+    return ABSOLUTE_CUTS.grade(score)
 
 def get_relative_grade(percentile):
-    for cut, grade in RELATIVE_CUTS:
-        if percentile <= cut:
-            return grade
-    return 9
+    return RELATIVE_CUTS.grade(percentile)
 
 def main():
     base_dir = r"c:\Users\user\projects\LT_data_analysis\2025_LT_11월_data"
@@ -33,6 +30,7 @@ def main():
     }
 
     all_students = []
+    keys = StudentKeys()
 
     for level, file_path in files.items():
         if not os.path.exists(file_path):
@@ -40,20 +38,13 @@ def main():
             continue
         
         print(f"Reading {file_path}...")
-        df = pd.read_csv(file_path)
-        
-        # Calculate score per student
-        # Assuming '정답여부' == 'Y' counts as 1 point.
-        # Group by '학번' and '이름' to get unique students
-        student_scores = df[df['정답여부'] == 'Y'].groupby(['학번', '이름']).size().reset_index(name='Score')
-        
-        # We also need to include students who might have got 0 score (if they exist in the file but have no 'Y')
-        # So it's better to group by student first.
-        unique_students = df[['학번', '이름']].drop_duplicates()
-        
-        # Merge scores
-        student_data = pd.merge(unique_students, student_scores, on=['학번', '이름'], how='left')
-        student_data['Score'] = student_data['Score'].fillna(0).astype(int)
+        # Calculate score per student, reading the file in chunks.
+        # Students keyed by integer student_id (학번/이름 stay in the key table); students with no correct answer keep a 0 score.
+        scorer = StudentScorer(key_columns=['student_id'], attribute_columns=[], group_columns=[])
+        for chunk in iter_sheet(file_path, columns=['학번', '이름', '정답여부']):
+            add_student_ids(chunk, '2025-11', keys)
+            scorer.add(chunk)
+        student_data = scorer.totals()[['student_id', 'Score']]
         student_data['Level'] = level
         
         all_students.append(student_data)
@@ -67,7 +58,7 @@ def main():
     print(f"Total Combined Students (National 2nd Grade): {total_students}")
 
     # --- Absolute Grading ---
-    full_df['Abs_Grade'] = full_df['Score'].apply(get_absolute_grade)
+    full_df['Abs_Grade'] = get_absolute_grade(full_df['Score'])
 
     # --- Relative Grading ---
     # Sort by score descending
@@ -77,15 +68,15 @@ def main():
     # Use 'min' for rank to match standard competitive ranking, 
     # but for percentile cutoffs, checks are usually strictly <= N%.
     # Let's calculate percentile based on Rank.
-    full_df['Rank'] = full_df['Score'].rank(method='min', ascending=False)
+    full_df['Rank'] = rank(full_df['Score'], method='min', ascending=False)
     full_df['Percentile'] = (full_df['Rank'] / total_students) * 100
     
-    full_df['Rel_Grade'] = full_df['Percentile'].apply(get_relative_grade)
+    full_df['Rel_Grade'] = get_relative_grade(full_df['Percentile'])
 
     # --- Analysis: Distribution by Level and Grade ---
     
     # Absolute Distribution
-    abs_pivot = full_df.pivot_table(index='Abs_Grade', columns='Level', values='학번', aggfunc='count', fill_value=0)
+    abs_pivot = full_df.pivot_table(index='Abs_Grade', columns='Level', values='student_id', aggfunc='count', fill_value=0)
     # Reorder columns if present
     desired_order = ['GT2', 'MGT2', 'S2', 'MAG2']
     cols = [c for c in desired_order if c in abs_pivot.columns]
@@ -102,14 +93,18 @@ def main():
     print(abs_pivot)
 
     # Relative Distribution
-    rel_pivot = full_df.pivot_table(index='Rel_Grade', columns='Level', values='학번', aggfunc='count', fill_value=0)
+    rel_pivot = full_df.pivot_table(index='Rel_Grade', columns='Level', values='student_id', aggfunc='count', fill_value=0)
     rel_pivot = rel_pivot[cols]
     rel_pivot['Total'] = rel_pivot.sum(axis=1)
 
     print("\n[Relative Evaluation Distribution (Percentile based)]")
     print(rel_pivot)
 
-    # Save detailed data for checking
+    # Save detailed data for checking (학번 / 이름 joined back from the key table)
+    names = keys.attributes(full_df['student_id'], columns=('key', '이름'))
+    full_df = full_df.drop(columns=['student_id'])
+    full_df.insert(0, '이름', names['이름'].to_numpy())
+    full_df.insert(0, '학번', names['key'].to_numpy())
     full_df.to_csv("integrated_grades_detail.csv", index=False)
     print("\nDetailed results saved to integrated_grades_detail.csv")
 
@@ -0,0 +1,4 @@
+"""LT/MT 문항 데이터 공용 모듈 (변환, 캐시, 로더)."""
+
+from lt_data.loader import cache_path, compact_frame, read_levels, read_sheet, star_counts, write_cache
+from lt_data.schema import adapt_schema
@@ -0,0 +1,133 @@
+import numpy as np
+import pandas as pd
+
+from lt_data.grading import cut_table
+
+# 컷 바로 아래 학생 (Quantum Jump 대상)
+# 학생 점수를 (그룹 x 점수) 히스토그램으로 모으고 점수 축 누적합 P (P[:, t] = t 점 미만 인원) 를 한 번 만든다.
+# 컷 c 아래 width 점 이내 (c - width <= 점수 < c) 인원은 P[:, c] - P[:, c - width] 로 모든 그룹 / 모든 컷을 한 번에 구한다.
+# 그룹은 가장 잘게 (시기, 레벨, 캠퍼스, 학급) 만들고, 레벨 / 캠퍼스 합계는 히스토그램 행을 더해서 만든다.
+GROUP_COLUMNS = ['Period', 'Level', '캠퍼스', '학급']
+ALL = '전체'
+
+
+def group_histograms(scores, group_columns=GROUP_COLUMNS, score_column='Score', max_score=None):
+    # 학생별 점수 -> (그룹 x 점수 0..max_score) 인원 표
+    group_columns = [col for col in group_columns if col in scores.columns]
+    values = scores[score_column].to_numpy(dtype=np.int64)
+    max_score = int(values.max()) if max_score is None else max_score
+    codes, groups = pd.MultiIndex.from_frame(scores[group_columns].astype(str)).factorize()
+    width = max_score + 1
+    counts = np.bincount(codes * width + np.minimum(values, max_score), minlength=len(groups) * width)
+    return pd.DataFrame(counts.reshape(len(groups), width), index=pd.MultiIndex.from_tuples(groups, names=group_columns),
+                        columns=pd.RangeIndex(width, name='Score')).sort_index()
+
+
+def rollup(hist, keep):
+    # keep 컬럼만 남기고 나머지 그룹 컬럼은 '전체' 로 합친다
+    names = list(hist.index.names)
+    summed = hist.groupby(level=keep, sort=True).sum() if keep else hist.sum().to_frame().T
+    frame = summed.index.to_frame(index=False) if keep else pd.DataFrame(index=[0])
+    for col in names:
+        if col not in keep:
+            frame[col] = ALL
+    summed.index = pd.MultiIndex.from_frame(frame[names])
+    return summed
+
+
+def score_cuts(table, hist, max_score):
+    # 컷 표 -> [(등급, 컷 점수), ...] (가장 낮은 등급의 0 컷 제외)
+    # absolute: 표의 만점에서 max_score 로 환산. 정수 점수이므로 컷 c 이상 = ceil(c) 이상
+    # relative: hist 전체 (모든 그룹 합) 의 석차 백분위로 등급을 매겨서 등급마다 가장 낮은 점수
+    if table.kind == 'absolute':
+        scale = table.scale or max_score
+        cuts = np.ceil(table.bounds * max_score / scale - 1e-9).astype(np.int64)
+        pairs = list(zip(table.grades, cuts))
+    else:
+        counts = hist.to_numpy(dtype=np.int64).sum(axis=0)
+        above = counts[::-1].cumsum()[::-1] - counts
+        grades = table.grade((above + 1) / counts.sum() * 100)
+        present = counts > 0
+        pairs = []
+        for label in table.grades:
+            reached = np.flatnonzero(present & (grades == label))
+            if len(reached):
+                pairs.append((label, int(reached.min())))
+    return sorted([(g, c) for g, c in pairs if c > 0], key=lambda pair: -pair[1])
+
+
+def near_cut_counts(hist, cuts, width=3):
+    # (그룹 x 점수) 히스토그램 -> (그룹 x 컷) 컷 아래 width 점 이내 인원
+    counts = hist.to_numpy(dtype=np.int64)
+    prefix = np.zeros((counts.shape[0], counts.shape[1] + 1), dtype=np.int64)
+    np.cumsum(counts, axis=1, out=prefix[:, 1:])
+    cuts = np.clip(np.asarray(cuts, dtype=np.int64), 0, counts.shape[1])
+    return prefix[:, cuts] - prefix[:, np.maximum(cuts - width, 0)]
+
+
+def borderline(hist, table, width=3, max_score=None, rollups=None):
+    # tidy 표: 그룹 컬럼, Grade, Cut, Window, N, Near_N, Near_%
+    # rollups: 합계를 낼 그룹 컬럼 목록들 (기본: 시기별 레벨 / 레벨+캠퍼스 / 레벨+캠퍼스+학급)
+    # relative 표는 시기마다 그 시기 전체 학생으로 컷 점수를 정한다
+    # max_score: 만점 (absolute 컷 환산용). {시기: 만점} 으로 시기마다 다르게 줄 수 있다 (2024 20문항 / 2025 60문항)
+    names = list(hist.index.names)
+    if rollups is None:
+        rollups = [names[:i] for i in range(min(2, len(names)), len(names) + 1)]
+    frames = []
+    period_level = 'Period' if 'Period' in names else None
+    periods = hist.index.get_level_values(period_level).unique() if period_level else [None]
+    for period in periods:
+        part = hist.xs(period, level=period_level, drop_level=False) if period_level else hist
+        full = max_score.get(period) if isinstance(max_score, dict) else max_score
+        cuts = score_cuts(table, part, hist.columns.max() if full is None else full)
+        labels = [grade for grade, _ in cuts]
+        cut_scores = np.array([cut for _, cut in cuts], dtype=np.int64)
+        for keep in rollups:
+            summed = rollup(part, keep)
+            near = near_cut_counts(summed, cut_scores, width)
+            total = summed.sum(axis=1).to_numpy()
+            groups = summed.index.to_frame(index=False)
+            n_groups, n_cuts = near.shape
+            frame = groups.loc[groups.index.repeat(n_cuts)].reset_index(drop=True)
+            frame['Grade'] = np.tile(labels, n_groups)
+            frame['Cut'] = np.tile(cut_scores, n_groups)
+            frame['Window'] = [f'{max(c - width, 0)}-{c - 1}' for c in frame['Cut']]
+            frame['N'] = np.repeat(total, n_cuts)
+            frame['Near_N'] = near.reshape(-1)
+            with np.errstate(invalid='ignore', divide='ignore'):
+                frame['Near_%'] = frame['Near_N'] / frame['N'] * 100
+            frames.append(frame)
+    return pd.concat(frames, ignore_index=True)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    from lt_data.scorer import StudentScorer
+
+    parser = argparse.ArgumentParser(description='등급 컷 바로 아래 학생 (시기 / 레벨 / 캠퍼스 / 학급)')
+    parser.add_argument('periods', nargs='+', help='시기=학생문항별결과 CSV (예: 2025-11=2025_LT_11월_data/2025_11월_GT2.csv)')
+    parser.add_argument('--scheme', default='수능_절대_60', help='grade_cuts.csv 의 기준 이름')
+    parser.add_argument('--width', type=int, default=3, help='컷 아래 몇 점까지')
+    parser.add_argument('--max-score', type=int, default=None, help='만점 (기본: 시기별 문항 수)')
+    parser.add_argument('--out', default=None, help='결과 CSV 경로')
+    args = parser.parse_args()
+
+    frames, full_marks = [], {}
+    for period, path in (p.split('=', 1) for p in args.periods):
+        scorer = StudentScorer(attribute_columns=['교육과정', '캠퍼스', '학급'], group_columns=[]).consume(path)
+        totals = scorer.totals()
+        # 만점을 주지 않으면 시기마다 문항 수 (학생별 응답 수 최대)
+        full_marks[period] = args.max_score or int(totals['응답 수'].max())
+        frames.append(totals.rename(columns={'교육과정': 'Level'}).assign(Period=period))
+    scores = pd.concat(frames, ignore_index=True)
+    hist = group_histograms(scores, max_score=max(full_marks.values()))
+    result = borderline(hist, cut_table(args.scheme), width=args.width, max_score=full_marks)
+
+    level_rows = result[result['캠퍼스'] == ALL] if '캠퍼스' in result.columns else result
+    for period, rows in level_rows.groupby('Period', sort=False):
+        print(f"\n=== {period} (만점 {full_marks[period]}, 컷 아래 {args.width}점, %) ===")
+        print(rows.pivot_table(index='Level', columns=['Grade', 'Window'], values='Near_%', sort=False).round(1).to_string())
+    if args.out:
+        result.to_csv(args.out, index=False, encoding='utf-8-sig')
+        print(f"\nSaved {args.out}")
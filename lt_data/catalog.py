@@ -0,0 +1,166 @@
+import os
+import re
+from collections import OrderedDict
+
+import pandas as pd
+
+from lt_data.loader import concat_levels, read_sheet
+
+# 시기 카탈로그
+# 데이터 폴더를 훑어서 (시기, 시험, 레벨, 파일 종류) 목록만 만들고 파일은 읽지 않는다.
+# 실제 데이터는 load() 로 처음 접근할 때 읽고, 최근에 쓴 파티션은 메모리 상한이 있는 LRU 캐시에 둔다.
+#
+# 폴더 이름:  2024_11월_data, 2025_LT_11월_data, 2025_MT_10월_data (시험 표기가 없으면 LT)
+# 파일 이름:  2024_11월_학생문항별결과.csv (전체 레벨이 한 파일), 2025_11월_GT2.csv (레벨별 학생문항별결과)
+DATA_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+FOLDER_PATTERN = re.compile(r'^(\d{4})_(?:(LT|MT)_)?(\d{1,2})월_data$')
+FILE_PATTERN = re.compile(r'^(\d{4})_(\d{1,2})월_+(.+)$')
+KINDS = {
+    '학생문항별결과': 'items',
+    '학생별구간분류': 'students',
+    '문항난이도별결과': 'difficulty',
+    '기준점': 'cutoffs',
+}
+ENTRY_COLUMNS = ['period', 'test', 'level', 'kind', 'path']
+CACHE_BYTES = 512 * 1024 * 1024
+
+
+def period_label(year, month):
+    return f'{int(year)}-{int(month):02d}'
+
+
+def scan_folder(folder, test='LT'):
+    # 폴더 안의 CSV (또는 CSV 없이 남은 parquet 캐시) 를 종류별로 분류한다
+    entries = []
+    stems = sorted({os.path.splitext(name)[0] for name in os.listdir(folder)
+                    if name.endswith('.csv') or name.endswith('.parquet')})
+    for stem in stems:
+        match = FILE_PATTERN.match(stem)
+        if not match:
+            continue
+        year, month, rest = match.groups()
+        if rest in KINDS:
+            kind, level = KINDS[rest], None
+        elif '_' not in rest:
+            # 레벨별 시트 (2025_11월_GT2)
+            kind, level = 'items', rest
+        else:
+            continue
+        entries.append({
+            'period': period_label(year, month),
+            'test': test,
+            'level': level,
+            'kind': kind,
+            'path': os.path.join(folder, stem + '.csv'),
+        })
+    return entries
+
+
+class Catalog:
+
+    def __init__(self, root=DATA_ROOT, cache_bytes=CACHE_BYTES):
+        self.root = root
+        self.cache_bytes = cache_bytes
+        self._cache = OrderedDict()
+        self._cache_sizes = {}
+        entries = []
+        for name in sorted(os.listdir(root)):
+            match = FOLDER_PATTERN.match(name)
+            folder = os.path.join(root, name)
+            if match and os.path.isdir(folder):
+                entries += scan_folder(folder, test=match.group(2) or 'LT')
+        self.entries = pd.DataFrame(entries, columns=ENTRY_COLUMNS)
+
+    # ------------------------------------------------------------------
+    # 목록 (파일을 읽지 않는다)
+
+    def periods(self, test=None):
+        entries = self.entries if test is None else self.entries[self.entries['test'] == test]
+        return sorted(entries['period'].unique())
+
+    def find(self, period=None, kind=None, test=None, level=None):
+        entries = self.entries
+        for column, value in [('period', period), ('kind', kind), ('test', test)]:
+            if value is not None:
+                entries = entries[entries[column] == value]
+        if level is not None:
+            # 레벨별 파일이 있으면 그것만, 없으면 전체 레벨 파일
+            exact = entries[entries['level'] == level]
+            entries = exact if len(exact) else entries[entries['level'].isna()]
+        return entries
+
+    def levels(self, period, test='LT'):
+        # 레벨별 파일이 있는 시기만 파일 이름으로 알 수 있다. 전체 레벨 파일은 읽어야 알 수 있으므로 빈 목록
+        levels = self.find(period, kind='items', test=test)['level'].dropna()
+        return list(levels)
+
+    # ------------------------------------------------------------------
+    # 로드 (LRU 캐시)
+
+    def load(self, period, kind='items', level=None, test='LT', campus=None, columns=None):
+        # 예: load('2024-11', 'items', level='GT1') -> 2024-11 GT1 학생문항별결과
+        # 전체 레벨 파일이면 교육과정으로, campus 를 주면 캠퍼스로 거른다
+        entries = self.find(period, kind=kind, test=test, level=level)
+        if entries.empty:
+            raise FileNotFoundError(f"No {kind} data for {test} {period} {level or ''}".rstrip())
+        read_columns = None if columns is None else list(columns)
+        if read_columns is not None and campus is not None and '캠퍼스' not in read_columns:
+            read_columns.append('캠퍼스')
+        frames = [self._partition(path, level if pd.isna(entry_level) else None, read_columns)
+                  for path, entry_level in entries[['path', 'level']].itertuples(index=False)]
+        # 캐시된 프레임에 컬럼을 추가해도 캐시가 바뀌지 않도록 얕은 복사
+        df = frames[0].copy(deep=False) if len(frames) == 1 else pd.concat(frames, ignore_index=True)
+        if campus is not None:
+            df = df[df['캠퍼스'] == campus].reset_index(drop=True)
+        return df if columns is None else df[list(columns)]
+
+    def load_levels(self, period, levels=None, kind='items', test='LT', campus=None, columns=None, level_column='Level'):
+        # 여러 레벨을 한 프레임으로 (read_levels 와 같은 모양). 데이터가 없는 레벨은 건너뛴다
+        if levels is None:
+            levels = self.levels(period, test=test)
+        frames = {level: self.load(period, kind, level=level, test=test, campus=campus, columns=columns)
+                  for level in levels if not self.find(period, kind=kind, test=test, level=level).empty}
+        return concat_levels(frames, level_column, levels=list(levels))
+
+    def _partition(self, path, filter_level, read_columns):
+        # filter_level: 전체 레벨 파일에서 골라낼 교육과정 (레벨별 파일이면 None)
+        if read_columns is not None and filter_level is not None and '교육과정' not in read_columns:
+            read_columns = read_columns + ['교육과정']
+        key = (path, filter_level, None if read_columns is None else tuple(read_columns))
+        if key in self._cache:
+            self._cache.move_to_end(key)
+            return self._cache[key]
+
+        df = read_sheet(path, columns=read_columns)
+        if filter_level is not None:
+            df = df[df['교육과정'] == filter_level].reset_index(drop=True)
+            df['교육과정'] = df['교육과정'].cat.remove_unused_categories()
+        self._remember(key, df)
+        return df
+
+    def _remember(self, key, df):
+        self._cache[key] = df
+        self._cache_sizes[key] = int(df.memory_usage(deep=True).sum())
+        # 상한을 넘으면 가장 오래 안 쓴 파티션부터 버린다 (방금 읽은 것은 남긴다)
+        while self.cached_bytes() > self.cache_bytes and len(self._cache) > 1:
+            old_key, _ = self._cache.popitem(last=False)
+            del self._cache_sizes[old_key]
+
+    def cached_bytes(self):
+        return sum(self._cache_sizes.values())
+
+    def clear(self):
+        self._cache.clear()
+        self._cache_sizes.clear()
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description='시기/레벨/파일 종류 목록')
+    parser.add_argument('--root', default=DATA_ROOT)
+    args = parser.parse_args()
+
+    catalog = Catalog(args.root)
+    print(catalog.entries.assign(path=catalog.entries['path'].map(lambda p: os.path.relpath(p, args.root)))
+          .to_string(index=False))
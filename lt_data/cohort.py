@@ -0,0 +1,219 @@
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+from lt_data.grading import load_cuts
+from lt_data.keys import StudentKeys
+from lt_data.loader import read_sheet
+
+# 전국 상대평가 상태 (늦게 들어오는 캠퍼스 결과 반영용)
+# 상대 등급은 점수만의 함수이다: 석차(min, 내림차순) = 나보다 높은 점수 인원 + 1, 백분위 = 석차 / 전체 * 100.
+# 그래서 점수별 인원 히스토그램만 있으면 점수 -> 등급 표를 바로 만들 수 있고,
+# 학생을 추가/삭제한 뒤에는 등급 표에서 바뀐 점수의 학생만 다시 보면 된다.
+#
+# 학생은 (시기, 학번) 의 student_id 로 다룬다 (analyze_integrated_grades 와 같은 StudentKeys 키). Level 은 학생 표의 속성 컬럼이고,
+# 학번 / 이름은 출력할 때만 keys 표에서 붙인다.
+#
+# 저장 폴더: students.csv (학생별 Level, 점수), histogram.csv (점수별 인원), keys.csv (student_id 표),
+#           state.json (등급 기준, 키 컬럼, 시기)
+KEY_COLUMNS = ['student_id']
+ATTRIBUTE_COLUMNS = ['Level']
+SCHEME = '수능_상대'
+PERIOD = '2025-11'
+
+
+class CohortState:
+
+    def __init__(self, students=None, key_columns=KEY_COLUMNS, scheme=SCHEME, keys=None, period=PERIOD):
+        self.key_columns = list(key_columns)
+        self.columns = self.key_columns + [col for col in ATTRIBUTE_COLUMNS if col not in self.key_columns] + ['Score']
+        self.scheme = scheme
+        self.period = period
+        self.keys = StudentKeys() if keys is None else keys
+        self.cuts = load_cuts()[scheme]
+        if students is None:
+            students = pd.DataFrame(columns=self.columns)
+        self.students = students[self.columns].reset_index(drop=True)
+        self.students['Score'] = self.students['Score'].astype(np.int64)
+        self.counts = np.bincount(self.students['Score'].to_numpy(), minlength=1)
+
+    @property
+    def total(self):
+        return int(self.counts.sum())
+
+    def _resize(self, max_score):
+        if max_score >= len(self.counts):
+            self.counts = np.concatenate([self.counts, np.zeros(max_score + 1 - len(self.counts), dtype=self.counts.dtype)])
+
+    # ------------------------------------------------------------------
+    # 점수 -> 석차 / 백분위 / 등급 표
+
+    def rank_table(self):
+        # 점수별 석차 (method='min', ascending=False)
+        above = self.counts[::-1].cumsum()[::-1] - self.counts
+        return above + 1
+
+    def percentile_table(self):
+        total = self.total
+        return self.rank_table() / total * 100 if total else np.full(len(self.counts), np.nan)
+
+    def grade_table(self):
+        return self.cuts.grade(self.percentile_table())
+
+    def grades(self):
+        # analyze_integrated_grades 와 같은 Rank / Percentile / Rel_Grade 컬럼
+        scores = self.students['Score'].to_numpy()
+        df = self.students.copy()
+        df['Rank'] = self.rank_table()[scores].astype(np.float64)
+        df['Percentile'] = self.percentile_table()[scores]
+        df['Rel_Grade'] = self.grade_table()[scores]
+        return df
+
+    def labelled(self, df):
+        # student_id -> 학번 / 이름 (출력용, Level 다음 자리)
+        if 'student_id' not in df.columns:
+            return df
+        names = self.keys.attributes(df['student_id'], columns=('key', '이름'))
+        out = df.drop(columns=['student_id'])
+        position = 1 if out.columns[:1].tolist() == ['Level'] else 0
+        out.insert(position, '이름', names['이름'].to_numpy())
+        out.insert(position, '학번', names['key'].to_numpy())
+        return out
+
+    # ------------------------------------------------------------------
+    # 추가 / 삭제
+
+    def _key_index(self, df):
+        return pd.MultiIndex.from_frame(df[self.key_columns].astype(str))
+
+    def apply(self, added=None, removed=None):
+        # added: 새 학생 (같은 키가 있으면 점수 정정), removed: 뺄 학생 (키 컬럼만 있으면 된다)
+        # 반환: 상대 등급이 바뀐 학생 (Change: added / removed / updated / changed)
+        added = pd.DataFrame(columns=self.columns) if added is None else added[self.columns]
+        added = added.astype({'Score': np.int64})
+        removed_keys = self._key_index(added)
+        if removed is not None:
+            removed_keys = removed_keys.append(self._key_index(removed))
+
+        old_table = self.grade_table()
+        current_keys = self._key_index(self.students)
+        out_mask = current_keys.isin(removed_keys)
+        outgoing = self.students[out_mask]
+        keep = self.students[~out_mask]
+
+        if len(added):
+            self._resize(int(added['Score'].max()))
+        np.subtract.at(self.counts, outgoing['Score'].to_numpy(), 1)
+        np.add.at(self.counts, added['Score'].to_numpy(), 1)
+        self.students = pd.concat([keep, added], ignore_index=True)
+
+        new_table = self.grade_table()
+        if len(old_table) < len(new_table):
+            old_table = np.concatenate([old_table, np.full(len(new_table) - len(old_table), old_table[-1])])
+        changed_scores = np.flatnonzero(old_table != new_table)
+
+        # 그대로 남은 학생 중 등급 표가 바뀐 점수의 학생만
+        affected = keep[keep['Score'].isin(changed_scores)].copy()
+        affected['Old_Grade'] = old_table[affected['Score'].to_numpy()]
+        affected['New_Grade'] = new_table[affected['Score'].to_numpy()]
+        affected['Change'] = 'changed'
+
+        added_keys = self._key_index(added)
+        outgoing_keys = self._key_index(outgoing)
+        gone = outgoing[~outgoing_keys.isin(added_keys)].copy()
+        gone['Old_Grade'] = old_table[gone['Score'].to_numpy()]
+        gone['New_Grade'] = np.nan
+        gone['Change'] = 'removed'
+
+        arrived = added.copy()
+        arrived['Old_Grade'] = np.nan
+        previous = outgoing.set_index(outgoing_keys)['Score']
+        was_present = added_keys.isin(outgoing_keys)
+        arrived.loc[was_present, 'Old_Grade'] = old_table[previous.reindex(added_keys[was_present]).to_numpy()]
+        arrived['New_Grade'] = new_table[arrived['Score'].to_numpy()]
+        arrived['Change'] = np.where(was_present, 'updated', 'added')
+        arrived = arrived[arrived['Old_Grade'] != arrived['New_Grade']]
+
+        return pd.concat([arrived, gone, affected], ignore_index=True)
+
+    # ------------------------------------------------------------------
+    # 저장 / 로드
+
+    def save(self, state_dir):
+        os.makedirs(state_dir, exist_ok=True)
+        self.students.to_csv(os.path.join(state_dir, 'students.csv'), index=False, encoding='utf-8-sig')
+        pd.DataFrame({'Score': np.arange(len(self.counts)), 'Count': self.counts}).to_csv(
+            os.path.join(state_dir, 'histogram.csv'), index=False, encoding='utf-8-sig')
+        self.keys.save(os.path.join(state_dir, 'keys.csv'))
+        with open(os.path.join(state_dir, 'state.json'), 'w', encoding='utf-8') as f:
+            json.dump({'scheme': self.scheme, 'key_columns': self.key_columns, 'period': self.period, 'total': self.total},
+                      f, ensure_ascii=False, indent=2)
+
+    @classmethod
+    def load(cls, state_dir):
+        with open(os.path.join(state_dir, 'state.json'), encoding='utf-8') as f:
+            meta = json.load(f)
+        students = pd.read_csv(os.path.join(state_dir, 'students.csv'), encoding='utf-8-sig',
+                               dtype={col: np.int32 if col == 'student_id' else str for col in meta['key_columns'] + ATTRIBUTE_COLUMNS})
+        keys = StudentKeys.load(os.path.join(state_dir, 'keys.csv'))
+        state = cls(students, key_columns=meta['key_columns'], scheme=meta['scheme'], keys=keys,
+                    period=meta.get('period', PERIOD))
+        # 저장된 히스토그램과 학생 목록이 어긋나면 알린다
+        saved = pd.read_csv(os.path.join(state_dir, 'histogram.csv'), encoding='utf-8-sig')['Count'].to_numpy()
+        state._resize(len(saved) - 1)
+        if not np.array_equal(np.pad(saved, (0, len(state.counts) - len(saved))), state.counts):
+            raise ValueError(f"histogram.csv does not match students.csv in {state_dir}")
+        return state
+
+
+def campus_scores(csv_path, level, keys, period=PERIOD):
+    # 레벨 시트 (또는 캠퍼스 CSV) -> 학생별 student_id, Level, Score (0점 학생 포함, analyze_integrated_grades 와 같은 방식)
+    df = read_sheet(csv_path, columns=['학번', '이름', '정답여부'])
+    df['student_id'] = keys.assign(df, period)
+    scores = df.groupby('student_id', sort=False)['정답여부'].sum().rename('Score').reset_index()
+    scores.insert(1, 'Level', level)
+    return scores
+
+
+def detail_scores(detail, keys, period=PERIOD):
+    # integrated_grades_detail.csv (학번, 이름, Score, Level, ...) -> student_id, Level, Score
+    scores = detail[['Level', 'Score']].copy()
+    scores.insert(0, 'student_id', keys.assign(detail, period))
+    return scores
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description='전국 상대평가 상태 갱신 (늦게 들어온 캠퍼스 결과)')
+    parser.add_argument('state_dir')
+    sub = parser.add_subparsers(dest='command', required=True)
+    p_init = sub.add_parser('init', help='integrated_grades_detail.csv 로 상태 만들기')
+    p_init.add_argument('detail_csv')
+    p_init.add_argument('--period', default=PERIOD, help='시기 (student_id 키)')
+    p_init.add_argument('--keys', default=None, help='학생 키 레지스트리 CSV (python -m lt_data.keys 와 같은 id 를 쓴다)')
+    for name in ['add', 'remove']:
+        p = sub.add_parser(name, help=f'캠퍼스 CSV 학생 {"추가 (같은 학생은 점수 정정)" if name == "add" else "삭제"}')
+        p.add_argument('csv_path')
+        p.add_argument('--level', required=True)
+        p.add_argument('--delta', default=None, help='바뀐 학생 목록 CSV 경로')
+    args = parser.parse_args()
+
+    if args.command == 'init':
+        detail = pd.read_csv(args.detail_csv, encoding='utf-8-sig', dtype={'이름': str, 'Level': str})
+        keys = StudentKeys.load(args.keys) if args.keys else StudentKeys()
+        state = CohortState(detail_scores(detail, keys, args.period), keys=keys, period=args.period)
+        delta = None
+    else:
+        state = CohortState.load(args.state_dir)
+        batch = campus_scores(args.csv_path, args.level, state.keys, state.period)
+        delta = state.apply(added=batch) if args.command == 'add' else state.apply(removed=batch)
+    state.save(args.state_dir)
+    print(f"{state.total:,} students in cohort")
+    if delta is not None:
+        print(delta['Change'].value_counts().to_string() if len(delta) else "No relative grade changes")
+        if args.delta is not None:
+            state.labelled(delta).to_csv(args.delta, index=False, encoding='utf-8-sig')
+            print(f"Saved {args.delta}")
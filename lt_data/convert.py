@@ -0,0 +1,200 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+import numpy as np
+import openpyxl
+import pandas as pd
+from pandas.io.parsers import TextParser
+
+from lt_data.loader import DICTIONARY_COLUMNS, cache_path, compact_frame, write_cache
+
+# 집계 통합문서(GR1)는 시트 위쪽에 제목/요약 표가 있으므로
+# 아래 컬럼명이 처음 나오는 행을 헤더로 사용한다
+HEADER_MARKERS = ('결과코드', 'COURSE_CODE', '학번')
+
+# 스트리밍 변환 시 한 번에 메모리에 두는 행 수
+CHUNK_ROWS = 50000
+
+
+def find_header(input_file, sheet_name, max_rows=50):
+    # 반환: (헤더 행 번호, 사용할 컬럼 수). 찾지 못하면 (0, None)
+    wb = openpyxl.load_workbook(input_file, read_only=True, data_only=True)
+    try:
+        ws = wb[sheet_name]
+        for i, row in enumerate(ws.iter_rows(max_row=max_rows, values_only=True)):
+            if any(v in HEADER_MARKERS for v in row):
+                # 헤더 오른쪽의 빈 칸 이후는 별도 표(예: 기준점 시트의 문항 난이도)이므로 제외
+                width = len(row)
+                for j, v in enumerate(row):
+                    if v is None and j > 0:
+                        width = j
+                        break
+                return i, width
+    finally:
+        wb.close()
+    return 0, None
+
+
+def convert_sheet(input_file, sheet_name, output_path, stream=False, chunk_rows=CHUNK_ROWS):
+    if stream:
+        return stream_sheet(input_file, sheet_name, output_path, chunk_rows=chunk_rows)
+    header, width = find_header(input_file, sheet_name)
+    usecols = list(range(width)) if width else None
+    df = pd.read_excel(input_file, sheet_name=sheet_name, header=header, usecols=usecols)
+    df.to_csv(output_path, index=False, encoding='utf-8-sig')
+    write_cache(df, output_path)
+    return len(df)
+
+
+class _ChunkCacheWriter:
+    # 청크 단위로 parquet 캐시를 이어 쓴다
+    # 첫 청크의 스키마를 기준으로 하며, 이후 청크를 그 스키마로 맞출 수 없으면 캐시를 포기한다
+    # (로더는 캐시가 없으면 CSV를 읽는다)
+    # categories: {컬럼: 시트 전체의 카테고리}. 모든 청크가 같은 사전을 쓰므로 write_cache 와 같은 카테고리 순서가 된다
+
+    def __init__(self, output_path, categories=None):
+        self.path = cache_path(output_path)
+        self.categories = categories or {}
+        self.schema = None
+        self.writer = None
+        self.failed = False
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+    def write(self, chunk):
+        if self.failed:
+            return
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+
+            chunk = compact_frame(chunk)
+            for col, categories in self.categories.items():
+                chunk[col] = chunk[col].cat.set_categories(categories)
+            if self.schema is None:
+                schema = pa.Schema.from_pandas(chunk, preserve_index=False)
+                fields = []
+                for field in schema:
+                    if pa.types.is_dictionary(field.type):
+                        # 청크마다 카테고리 수가 달라도 같은 인덱스 타입을 쓰도록 고정
+                        field = field.with_type(pa.dictionary(pa.int32(), field.type.value_type))
+                    elif pa.types.is_null(field.type):
+                        field = field.with_type(pa.string())
+                    fields.append(field)
+                self.schema = pa.schema(fields, metadata=schema.metadata)
+                self.writer = pq.ParquetWriter(self.path, self.schema)
+            self.writer.write_table(pa.Table.from_pandas(chunk, schema=self.schema, preserve_index=False))
+        except ImportError as e:
+            print(f"Skipping parquet cache ({e})")
+            self.failed = True
+        except (pa.ArrowInvalid, pa.ArrowTypeError, TypeError, ValueError) as e:
+            print(f"Skipping parquet cache for {os.path.basename(self.path)} ({e})")
+            self.close()
+            if os.path.exists(self.path):
+                os.remove(self.path)
+            self.failed = True
+
+    def close(self):
+        if self.writer is not None:
+            self.writer.close()
+            self.writer = None
+
+
+def _cell_value(cell):
+    # read_excel (openpyxl) 과 같은 셀 값: 빈 칸은 '', 오류는 NaN, 정수로 떨어지는 숫자는 int
+    if cell.value is None:
+        return ''
+    if cell.data_type == 'e':
+        return np.nan
+    if cell.data_type == 'n':
+        value = int(cell.value)
+        return value if value == cell.value else float(cell.value)
+    return cell.value
+
+
+def _row_chunks(input_file, sheet_name, header, width, chunk_rows):
+    # (헤더 행, 데이터 행 목록) 을 chunk_rows 행씩 돌려준다
+    # 중간의 빈 행은 유지하고 끝부분의 빈 행은 버린다 (read_excel 과 동일)
+    wb = openpyxl.load_workbook(input_file, read_only=True, data_only=True)
+    try:
+        names = None
+        rows = []
+        blank = 0
+        sent = False
+        for i, row in enumerate(wb[sheet_name].iter_rows()):
+            if i < header:
+                continue
+            row = [_cell_value(cell) for cell in row]
+            if names is None:
+                names = row[:width] if width else row
+                continue
+            row = row[:len(names)] + [''] * (len(names) - len(row))
+            if all(v == '' for v in row):
+                blank += 1
+                continue
+            rows.extend([[''] * len(names) for _ in range(blank)])
+            blank = 0
+            rows.append(row)
+            if len(rows) >= chunk_rows:
+                yield names, rows
+                sent = True
+                rows = []
+        if rows or not sent:
+            yield names or [], rows
+    finally:
+        wb.close()
+
+
+def _parse_rows(names, rows, dtype=None):
+    # read_excel 과 같은 파서 (헤더 이름 정리, 기본 NA 값 '' / 'NULL' / 'N/A' ... -> NaN, 컬럼별 타입 추론)
+    return TextParser([names] + rows, header=0, skip_blank_lines=False, dtype=dtype).read()
+
+
+def stream_sheet(input_file, sheet_name, output_path, chunk_rows=CHUNK_ROWS):
+    # read_only 모드로 행을 순회하면서 chunk_rows 행씩 CSV/캐시에 이어 쓴다
+    # 메모리 사용량은 시트 크기와 관계없이 청크 크기로 제한된다
+    # 청크마다 타입을 추론하면 같은 컬럼이 청크마다 60 / 60.0 처럼 달라지므로,
+    # 먼저 시트를 한 번 훑어 컬럼 타입을 정하고 (청크 타입들을 합친 것 = 시트 전체를 읽은 read_excel 의 타입)
+    # 두 번째 순회에서 모든 청크를 그 타입으로 맞춘다
+    header, width = find_header(input_file, sheet_name)
+    dtypes = None
+    values = {}
+    for names, rows in _row_chunks(input_file, sheet_name, header, width, chunk_rows):
+        chunk = _parse_rows(names, rows)
+        dtypes = chunk.iloc[:0] if dtypes is None else pd.concat([dtypes, chunk.iloc[:0]])
+        for col in chunk.columns.intersection(DICTIONARY_COLUMNS):
+            values[col] = pd.concat([values.get(col, chunk[col].iloc[:0]), chunk[col]]).drop_duplicates()
+    dtypes = dtypes.dtypes
+    categories = {col: unique.astype(dtypes[col]).astype('category').cat.categories for col, unique in values.items()}
+    # 숫자와 문자가 섞인 컬럼은 read_excel 처럼 셀 값을 그대로 둔다 (숫자 청크의 2 가 2.0 이 되지 않도록)
+    raw = {col: object for col, dtype in dtypes.items() if dtype == object}
+
+    cache = _ChunkCacheWriter(output_path, categories)
+    total = 0
+    try:
+        with open(output_path, 'w', encoding='utf-8-sig', newline='') as f:
+            for names, rows in _row_chunks(input_file, sheet_name, header, width, chunk_rows):
+                chunk = _parse_rows(names, rows, dtype=raw).astype(dtypes)
+                chunk.to_csv(f, index=False, header=(total == 0))
+                cache.write(chunk)
+                total += len(chunk)
+    finally:
+        cache.close()
+    return total
+
+
+def convert_jobs(jobs, workers=None, stream=False, chunk_rows=CHUNK_ROWS):
+    # jobs: [(input_file, sheet_name, output_path), ...]
+    # 시트 단위로 프로세스 풀에서 변환한다. 결과는 jobs 순서대로 반환 (workers=1 이면 순차 실행)
+    if not jobs:
+        return []
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = max(1, min(workers, len(jobs)))
+    args = list(zip(*jobs))
+    convert = partial(convert_sheet, stream=stream, chunk_rows=chunk_rows)
+    if workers == 1:
+        return list(map(convert, *args))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(convert, *args))
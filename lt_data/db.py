@@ -0,0 +1,204 @@
+import datetime
+import os
+import sqlite3
+
+import pandas as pd
+
+from lt_data.store import PROFILE_COLUMNS, build_store, period_sources
+
+# 단일 파일 분석용 DB (sqlite3, 서버 없음)
+# lt_data.store 의 정규화 테이블을 시기별로 적재하고,
+# 캠퍼스 x 문항 x 시기 집계는 적재 시점에 campus_item_stats 로 미리 계산해 둔다.
+SCHEMA = f'''
+CREATE TABLE IF NOT EXISTS period (
+    period TEXT PRIMARY KEY,
+    source TEXT,
+    ingested_at TEXT
+);
+CREATE TABLE IF NOT EXISTS campus (
+    campus_id INTEGER PRIMARY KEY,
+    "캠퍼스" TEXT UNIQUE NOT NULL
+);
+CREATE TABLE IF NOT EXISTS student (
+    student_id INTEGER PRIMARY KEY,
+    period TEXT NOT NULL,
+    "교육과정" TEXT,
+    campus_id INTEGER,
+    "학급" TEXT,
+    "학번" INTEGER,
+    "이름" TEXT,
+    "결과코드" INTEGER,
+    {", ".join(f'"{c}"' for c in PROFILE_COLUMNS)}
+);
+CREATE INDEX IF NOT EXISTS ix_student_partition ON student (period, "교육과정", campus_id, student_id);
+CREATE TABLE IF NOT EXISTS item (
+    item_id INTEGER PRIMARY KEY,
+    period TEXT NOT NULL,
+    "교육과정" TEXT,
+    "문항 순번" INTEGER,
+    "시험과목" TEXT,
+    "스킬" TEXT,
+    "문항 유형" TEXT,
+    "문항난이도" TEXT
+);
+CREATE INDEX IF NOT EXISTS ix_item_position ON item (period, "교육과정", "문항 순번");
+CREATE TABLE IF NOT EXISTS response (
+    student_id INTEGER NOT NULL,
+    item_id INTEGER NOT NULL,
+    "정답여부" INTEGER NOT NULL,
+    PRIMARY KEY (student_id, item_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS ix_response_item ON response (item_id);
+CREATE TABLE IF NOT EXISTS difficulty (
+    student_id INTEGER NOT NULL,
+    "문항난이도" TEXT,
+    "퀴즈 수" INTEGER,
+    "정답 수" INTEGER
+);
+CREATE INDEX IF NOT EXISTS ix_difficulty_student ON difficulty (student_id);
+CREATE TABLE IF NOT EXISTS campus_item_stats (
+    period TEXT NOT NULL,
+    "교육과정" TEXT NOT NULL,
+    campus_id INTEGER NOT NULL,
+    item_id INTEGER NOT NULL,
+    "문항 순번" INTEGER,
+    "응시인원" INTEGER,
+    "정답인원" INTEGER,
+    PRIMARY KEY (period, "교육과정", campus_id, item_id)
+) WITHOUT ROWID;
+'''
+
+STUDENT_COLUMNS = ['student_id', 'period', '교육과정', 'campus_id', '학급', '학번', '이름', '결과코드'] + PROFILE_COLUMNS
+ITEM_COLUMNS = ['item_id', 'period', '교육과정', '문항 순번', '시험과목', '스킬', '문항 유형', '문항난이도']
+DIFFICULTY_COLUMNS = ['student_id', '문항난이도', '퀴즈 수', '정답 수']
+
+
+def connect(db_path):
+    conn = sqlite3.connect(db_path)
+    conn.executescript(SCHEMA)
+    return conn
+
+
+def _next_id(conn, table, column):
+    return conn.execute(f'SELECT COALESCE(MAX({column}) + 1, 0) FROM {table}').fetchone()[0]
+
+
+def delete_period(conn, period):
+    conn.execute('DELETE FROM response WHERE student_id IN (SELECT student_id FROM student WHERE period = ?)', (period,))
+    conn.execute('DELETE FROM difficulty WHERE student_id IN (SELECT student_id FROM student WHERE period = ?)', (period,))
+    for table in ['campus_item_stats', 'student', 'item', 'period']:
+        conn.execute(f'DELETE FROM {table} WHERE period = ?', (period,))
+
+
+def ingest(conn, period, data_dir):
+    # 한 시기 폴더를 적재한다. 같은 시기를 다시 적재하면 기존 행을 지우고 바꾼다
+    _, files = period_sources(data_dir, period)
+    if not files:
+        raise FileNotFoundError(f"No 학생문항별결과 (전체 또는 레벨별)/학생별구간분류/문항난이도별결과 CSV in {data_dir}")
+    tables = build_store([(period, files)])
+
+    with conn:
+        delete_period(conn, period)
+
+        # 캠퍼스 id 는 DB 전체에서 공유
+        conn.executemany('INSERT OR IGNORE INTO campus ("캠퍼스") VALUES (?)',
+                         [(name,) for name in tables['campus']['캠퍼스']])
+        global_ids = dict(conn.execute('SELECT "캠퍼스", campus_id FROM campus').fetchall())
+        campus_map = {row.campus_id: global_ids[row.캠퍼스] for row in tables['campus'].itertuples()}
+
+        id_shift = _next_id(conn, 'student', 'student_id')
+        student = tables['student'].reindex(columns=STUDENT_COLUMNS)
+        student['student_id'] = student['student_id'].astype('int64') + id_shift
+        student['campus_id'] = student['campus_id'].map(campus_map)
+        student.astype(object).to_sql('student', conn, if_exists='append', index=False)
+
+        if 'item' in tables:
+            item = tables['item'].reindex(columns=ITEM_COLUMNS)
+            item_shift = _next_id(conn, 'item', 'item_id')
+            item['item_id'] = item['item_id'].astype('int64') + item_shift
+            item.astype(object).to_sql('item', conn, if_exists='append', index=False)
+
+            response = tables['response'].copy()
+            response['student_id'] = response['student_id'].astype('int64') + id_shift
+            response['item_id'] = response['item_id'].astype('int64') + item_shift
+            response['정답여부'] = response['정답여부'].astype(int)
+            response.to_sql('response', conn, if_exists='append', index=False)
+
+        if 'difficulty' in tables:
+            difficulty = tables['difficulty'].reindex(columns=DIFFICULTY_COLUMNS)
+            difficulty['student_id'] = difficulty['student_id'].astype('int64') + id_shift
+            difficulty.astype(object).to_sql('difficulty', conn, if_exists='append', index=False)
+
+        refresh_stats(conn, period)
+        conn.execute('INSERT INTO period VALUES (?, ?, ?)',
+                     (period, os.path.basename(os.path.normpath(data_dir)),
+                      datetime.datetime.now().isoformat(timespec='seconds')))
+    return {name: len(df) for name, df in tables.items()}
+
+
+def refresh_stats(conn, period):
+    # 캠퍼스 x 문항 집계를 미리 계산 (조회는 기본키 범위 검색)
+    conn.execute('DELETE FROM campus_item_stats WHERE period = ?', (period,))
+    conn.execute('''
+        INSERT INTO campus_item_stats
+        SELECT s.period, s."교육과정", s.campus_id, r.item_id, i."문항 순번",
+               COUNT(*), SUM(r."정답여부")
+        FROM student s
+        JOIN response r ON r.student_id = s.student_id
+        JOIN item i ON i.item_id = r.item_id
+        WHERE s.period = ?
+        GROUP BY s.period, s."교육과정", s.campus_id, r.item_id
+    ''', (period,))
+
+
+def query(conn, sql, params=()):
+    return pd.read_sql_query(sql, conn, params=params)
+
+
+def periods(conn):
+    return query(conn, 'SELECT * FROM period ORDER BY period')
+
+
+def campus_item_stats(conn, period=None, level=None, campus=None):
+    # 캠퍼스 x 문항 x 시기 정답률
+    conditions = []
+    params = []
+    for column, value in [('c.period', period), ('c."교육과정"', level), ('m."캠퍼스"', campus)]:
+        if value is not None:
+            conditions.append(f'{column} = ?')
+            params.append(value)
+    where = f"WHERE {' AND '.join(conditions)}" if conditions else ''
+    df = query(conn, f'''
+        SELECT c.period, c."교육과정", m."캠퍼스", c."문항 순번", c."응시인원", c."정답인원"
+        FROM campus_item_stats c
+        JOIN campus m ON m.campus_id = c.campus_id
+        {where}
+        ORDER BY c.period, c."교육과정", m."캠퍼스", c."문항 순번"
+    ''', params)
+    df['정답률'] = df['정답인원'] / df['응시인원'] * 100
+    return df
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description='LT 분석 DB (sqlite)')
+    parser.add_argument('db_path')
+    sub = parser.add_subparsers(dest='command', required=True)
+    p_ingest = sub.add_parser('ingest', help='시기 폴더 적재 (예: ingest 2024-11 2024_11월_data)')
+    p_ingest.add_argument('period')
+    p_ingest.add_argument('data_dir')
+    sub.add_parser('periods', help='적재된 시기 목록')
+    p_sql = sub.add_parser('sql', help='SQL 실행')
+    p_sql.add_argument('sql')
+    args = parser.parse_args()
+
+    conn = connect(args.db_path)
+    if args.command == 'ingest':
+        counts = ingest(conn, args.period, args.data_dir)
+        print(f"Ingested {args.period}: " + ', '.join(f"{name} {n:,}" for name, n in counts.items()))
+    elif args.command == 'periods':
+        print(periods(conn).to_string(index=False))
+    else:
+        print(query(conn, args.sql).to_string(index=False))
+    conn.close()
@@ -0,0 +1,115 @@
+import numpy as np
+import pandas as pd
+
+from lt_data.borderline import ALL
+
+# 문항 위치 효과 (후반 집중력 저하)
+# ResponseMatrix 의 열은 문항 순번 순서이므로 (학생 x 위치) 행렬에서 바로 계산한다.
+# - 위치별 정답률: ResponseMatrix.group_item_counts (그룹 (캠퍼스 등) 번호 행에 학생 행을 더한다) -> (그룹 x 위치) 정답 수 / 응답 수
+# - 학생별 기울기: 응답한 문항의 (위치, 정답) 최소제곱 기울기. n, Σx, Σx², Σy, Σxy 를 행렬-벡터 곱으로 구한다
+#   기울기 단위는 문항 하나당 정답 확률 변화 (Slope_10 = 10문항당 %p)
+# 학생 행은 block_rows 씩 풀어서 메모리를 제한한다.
+
+
+def _blocks(matrix, block_rows):
+    for start in range(0, matrix.n_students, block_rows):
+        rows = slice(start, start + block_rows)
+        yield rows, matrix.dense(rows), matrix.dense_answered(rows)
+
+
+def student_slopes(matrix, block_rows=65536):
+    # 학생 사이드카 + N, Accuracy_%, First_%, Second_% (앞/뒤 절반), Slope, Slope_10
+    positions = matrix.items['문항 순번'].to_numpy(dtype=np.float64)
+    first_half = positions <= np.median(positions)
+    stats = np.zeros((matrix.n_students, 7))
+    for rows, correct, answered in _blocks(matrix, block_rows):
+        a = answered.astype(np.float64)
+        y = correct.astype(np.float64)
+        stats[rows] = np.column_stack([
+            a.sum(axis=1), a @ positions, a @ positions ** 2, y.sum(axis=1), y @ positions,
+            a @ first_half, y @ first_half,
+        ])
+    n, sx, sxx, sy, sxy, n_first, y_first = stats.T
+    with np.errstate(invalid='ignore', divide='ignore'):
+        slope = (n * sxy - sx * sy) / (n * sxx - sx ** 2)
+        result = matrix.students.copy()
+        result['N'] = n.astype(np.int64)
+        result['Accuracy_%'] = sy / n * 100
+        result['First_%'] = y_first / n_first * 100
+        result['Second_%'] = (sy - y_first) / (n - n_first) * 100
+    result['Slope'] = slope
+    result['Slope_10'] = slope * 10 * 100
+    return result
+
+
+def position_curves(matrix, group_columns=('캠퍼스',), block_rows=65536, total=True):
+    # (그룹 x 위치) tidy 표: 그룹 컬럼, Position, Answered, Correct, Accuracy_%
+    # total=True 이면 그룹 컬럼이 '전체' 인 합계 곡선도 함께
+    group_columns = [col for col in group_columns if col in matrix.students.columns]
+    if group_columns:
+        codes, groups = pd.MultiIndex.from_frame(matrix.students[group_columns].astype(str)).factorize()
+        groups = pd.DataFrame(list(groups), columns=group_columns)
+    else:
+        codes, groups = np.zeros(matrix.n_students, dtype=np.int64), pd.DataFrame(index=[0])
+    correct_sum, answered_sum = matrix.group_item_counts(codes, len(groups), block_rows)
+    if total and group_columns:
+        correct_sum = np.vstack([correct_sum, correct_sum.sum(axis=0)])
+        answered_sum = np.vstack([answered_sum, answered_sum.sum(axis=0)])
+        groups = pd.concat([groups, pd.DataFrame([[ALL] * len(group_columns)], columns=group_columns)], ignore_index=True)
+
+    n_groups, n_items = correct_sum.shape
+    result = groups.loc[groups.index.repeat(n_items)].reset_index(drop=True)
+    result['Position'] = np.tile(matrix.items['문항 순번'].to_numpy(), n_groups)
+    result['Answered'] = answered_sum.reshape(-1)
+    result['Correct'] = correct_sum.reshape(-1)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        result['Accuracy_%'] = result['Correct'] / result['Answered'] * 100
+    return result
+
+
+def curve_slopes(curves, group_columns):
+    # 위치별 정답률 곡선 -> 그룹별 최소제곱 기울기 (10문항당 %p)
+    def fit(group):
+        valid = group['Answered'] > 0
+        x = group.loc[valid, 'Position'].to_numpy(dtype=np.float64)
+        y = group.loc[valid, 'Accuracy_%'].to_numpy()
+        return np.polyfit(x, y, 1)[0] * 10 if len(x) > 1 else np.nan
+    return curves.groupby(group_columns, sort=False)[['Position', 'Answered', 'Accuracy_%']].apply(fit).rename('Curve_Slope_10')
+
+
+if __name__ == "__main__":
+    import argparse
+    import os
+
+    from lt_data.loader import read_sheet
+    from lt_data.matrix import build_matrices
+
+    parser = argparse.ArgumentParser(description='문항 위치별 정답률 / 학생별 기울기 (시기, 레벨, 캠퍼스)')
+    parser.add_argument('periods', nargs='+', help='시기=학생문항별결과 CSV (예: 2024-11=2024_11월_data/2024_11월_학생문항별결과.csv)')
+    parser.add_argument('--out', default=None, help='결과 폴더 (position_curves.csv, student_slopes.csv)')
+    args = parser.parse_args()
+
+    curves, slopes = [], []
+    for period, path in (p.split('=', 1) for p in args.periods):
+        for level, matrix in build_matrices(read_sheet(path), period).items():
+            curve = position_curves(matrix)
+            student = student_slopes(matrix)
+            for df in (curve, student):
+                df.insert(0, 'Level', level)
+                df.insert(0, 'Period', period)
+            curves.append(curve)
+            slopes.append(student)
+    curves = pd.concat(curves, ignore_index=True)
+    slopes = pd.concat(slopes, ignore_index=True)
+
+    national = curves[curves['캠퍼스'] == ALL] if '캠퍼스' in curves.columns else curves
+    summary = slopes.groupby(['Period', 'Level'], sort=False).agg(
+        Students=('N', 'size'), First_pct=('First_%', 'mean'), Second_pct=('Second_%', 'mean'),
+        Student_Slope_10=('Slope_10', 'mean'), Negative_pct=('Slope', lambda s: (s < 0).mean() * 100))
+    summary = summary.join(curve_slopes(national, ['Period', 'Level']))
+    print(summary.round(2).to_string())
+    if args.out:
+        os.makedirs(args.out, exist_ok=True)
+        curves.to_csv(os.path.join(args.out, 'position_curves.csv'), index=False, encoding='utf-8-sig')
+        slopes.to_csv(os.path.join(args.out, 'student_slopes.csv'), index=False, encoding='utf-8-sig')
+        print(f"\nSaved {args.out}")
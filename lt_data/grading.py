@@ -0,0 +1,226 @@
+import os
+import re
+
+import numpy as np
+import pandas as pd
+
+# 등급 산출
+# 컷 표는 코드가 아니라 데이터 (grade_cuts.csv: SCHEME, KIND, SCALE, ORDER, GRADE, CUT)
+# grade_cuts.csv 는 등급컷(60문항)기준.md, 등급컷.md 순서로 두 문서의 표에서 만든다 (compile_markdown, 행 순서는 문서 순서)
+# - absolute: 점수 >= CUT 인 첫 등급 (CUT 내림차순)
+# - relative: 백분위 <= CUT 인 첫 등급 (CUT 오름차순, 백분위는 상위 %)
+# 컷 표를 정렬된 경계 배열로 바꿔 두고 np.searchsorted 한 번으로 전체 학생의 등급을 구한다.
+CUTS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'grade_cuts.csv')
+
+
+def _grade_array(grades):
+    # 숫자 등급(1~9)은 int, 문자 등급(A~E)은 object 로 둔다
+    values = pd.to_numeric(pd.Series(grades), errors='coerce')
+    if values.notna().all():
+        return values.to_numpy(dtype=np.int64)
+    return np.asarray(grades, dtype=object)
+
+
+class CutTable:
+
+    def __init__(self, kind, cuts, default=None, scale=None):
+        # cuts: [(CUT, 등급), ...] 적용 순서대로 (기존 ABSOLUTE_CUTS / RELATIVE_CUTS 와 같은 모양)
+        # default: 어느 컷에도 걸리지 않을 때 (결측 포함) 의 등급. 없으면 마지막 등급
+        # scale: absolute 컷의 만점 (60점 / 100점). 다른 만점의 점수는 grade_schemes 에서 환산한다
+        if kind not in ('absolute', 'relative'):
+            raise ValueError(f"Unknown cut kind: {kind}")
+        self.kind = kind
+        self.scale = scale
+        self.cuts = list(cuts)
+        bounds = np.array([cut for cut, _ in self.cuts], dtype=np.float64)
+        grades = _grade_array([grade for _, grade in self.cuts])
+        self.default = grades[-1] if default is None else default
+        # 오름차순 경계
+        # absolute: bounds[i] <= 점수 < bounds[i+1] 이면 grades[i]
+        # relative: bounds[i-1] < 백분위 <= bounds[i] 이면 grades[i]
+        order = np.argsort(bounds, kind='stable')
+        self.bounds = bounds[order]
+        self.grades = grades[order]
+
+    def grade(self, values):
+        # 스칼라, 배열, Series 모두 받는다. Series 는 같은 인덱스의 Series 로 돌려준다
+        scalar = np.ndim(values) == 0
+        x = np.atleast_1d(np.asarray(values, dtype=np.float64))
+        if self.kind == 'absolute':
+            idx = np.searchsorted(self.bounds, x, side='right') - 1
+            hit = idx >= 0
+        else:
+            idx = np.searchsorted(self.bounds, x, side='left')
+            hit = idx < len(self.bounds)
+        hit &= ~np.isnan(x)
+        out = np.full(len(x), self.default, dtype=self.grades.dtype)
+        out[hit] = self.grades[idx[hit]]
+        if scalar:
+            return out[0].item() if out.dtype != object else out[0]
+        if isinstance(values, pd.Series):
+            return pd.Series(out, index=values.index, name=values.name)
+        return out
+
+    __call__ = grade
+
+
+def load_cuts(path=CUTS_PATH):
+    # {SCHEME: CutTable}
+    df = pd.read_csv(path, encoding='utf-8-sig', dtype={'GRADE': str})
+    if 'SCALE' not in df.columns:
+        df['SCALE'] = np.nan
+    tables = {}
+    for scheme, rows in df.sort_values('ORDER', kind='stable').groupby('SCHEME', sort=False):
+        kinds = rows['KIND'].unique()
+        if len(kinds) != 1:
+            raise ValueError(f"Mixed cut kinds in scheme {scheme}: {list(kinds)}")
+        scale = rows['SCALE'].iloc[0]
+        tables[scheme] = CutTable(kinds[0], zip(rows['CUT'], rows['GRADE']),
+                                  scale=None if pd.isna(scale) else int(scale))
+    return tables
+
+
+def cut_table(scheme, path=CUTS_PATH):
+    tables = load_cuts(path)
+    if scheme not in tables:
+        raise KeyError(f"Unknown grade scheme {scheme!r} (available: {', '.join(tables)})")
+    return tables[scheme]
+
+
+# ----------------------------------------------------------------------
+# 등급컷 문서 (markdown) -> 컷 표
+
+_NUMBER = re.compile(r'(\d+(?:\.\d+)?)')
+
+
+def _scheme_name(heading, scale):
+    # '수능 영어 등급컷 기준 (절대평가 · 60점 만점)' -> 수능_절대_60
+    # '수능 영어 등급컷 기준 (상대평가)' -> 수능_상대 (석차 비율이므로 만점과 무관)
+    # '중학교 내신 영어 성취도 기준 (절대평가)' -> 내신_성취도_100
+    exam = '수능' if '수능' in heading else '내신_성취도' if '내신' in heading else heading.split()[0]
+    if '상대' in heading:
+        return f'{exam}_상대'
+    return f'{exam}_절대_{scale}' if exam == '수능' else f'{exam}_{scale}'
+
+
+def parse_cut_markdown(path):
+    # '# 제목' 아래의 '| 등급 | 기준 | ... |' 표를 읽는다 -> [(이름, 종류, 만점, [(CUT, 등급), ...]), ...]
+    # - 'N% 이내' 가 있으면 relative (상위 누적 비율 N)
+    # - 'N점 이상' / 'N점 ~ M점' 은 absolute (CUT = N), 'N점 미만' 은 마지막 등급 (CUT = 0)
+    with open(path, encoding='utf-8') as f:
+        lines = f.read().splitlines()
+    schemes = []
+    heading, rows = None, []
+
+    def flush():
+        if heading is None or not rows:
+            return
+        scale_match = re.search(r'(\d+)점 만점', heading)
+        scale = int(scale_match.group(1)) if scale_match else 100
+        kind = 'relative' if any('%' in criterion for _, criterion in rows) else 'absolute'
+        cuts = []
+        for label, criterion in rows:
+            grade = label.replace('등급', '').strip()
+            if kind == 'relative':
+                cut = float(re.search(r'(\d+(?:\.\d+)?)\s*%', criterion).group(1))
+            elif '미만' in criterion and '이상' not in criterion:
+                cut = 0.0
+            else:
+                cut = float(_NUMBER.search(criterion).group(1))
+            cuts.append((cut, grade))
+        schemes.append((_scheme_name(heading, scale), kind, None if kind == 'relative' else scale, cuts))
+
+    in_table = False
+    for line in lines:
+        line = line.strip()
+        is_row = line.startswith('|')
+        if line.startswith('# '):
+            flush()
+            heading, rows = line[2:].strip(), []
+        elif is_row and heading is not None and in_table:
+            cells = [cell.replace('*', '').strip() for cell in line.strip('|').split('|')]
+            if len(cells) < 2 or set(cells[0]) <= set(':- ') or not _NUMBER.search(cells[1]):
+                continue  # 구분선
+            rows.append((cells[0], cells[1]))
+        in_table = is_row  # 표의 첫 줄은 머리글
+    flush()
+    return schemes
+
+
+def compile_markdown(paths, out_path=CUTS_PATH):
+    # 여러 문서의 표를 하나의 grade_cuts.csv 로. 같은 이름의 표가 여러 번 나오면 내용이 같아야 한다
+    records = {}
+    for path in paths:
+        for name, kind, scale, cuts in parse_cut_markdown(path):
+            if name in records and records[name] != (kind, scale, cuts):
+                raise ValueError(f"Scheme {name} differs between documents ({path})")
+            records[name] = (kind, scale, cuts)
+    rows = [{'SCHEME': name, 'KIND': kind, 'SCALE': scale, 'ORDER': order, 'GRADE': grade, 'CUT': cut}
+            for name, (kind, scale, cuts) in records.items()
+            for order, (cut, grade) in enumerate(cuts, start=1)]
+    df = pd.DataFrame(rows, columns=['SCHEME', 'KIND', 'SCALE', 'ORDER', 'GRADE', 'CUT'])
+    df['SCALE'] = df['SCALE'].astype('Int64')
+    df['CUT'] = df['CUT'].map(lambda c: int(c) if float(c).is_integer() else c)
+    df.to_csv(out_path, index=False, encoding='utf-8-sig')
+    return df
+
+
+def grade_schemes(scores, max_score, tables=None, schemes=None):
+    # 모든 학생을 모든 기준으로 한 번에 등급 매긴다 -> (학생 x 기준) 표
+    # absolute: 점수를 기준의 만점으로 환산 (점수 * SCALE / max_score)
+    # relative: 백분위 = 석차(min, 내림차순) / 전체 * 100 (analyze_integrated_grades 와 같다)
+    # 등급은 점수만의 함수이므로 고유 점수에서만 계산하고 펼친다
+    from lt_data.ranking import rank
+
+    tables = load_cuts() if tables is None else tables
+    schemes = list(tables) if schemes is None else list(schemes)
+    index = scores.index if isinstance(scores, pd.Series) else None
+    values = np.asarray(scores, dtype=np.float64)
+    unique, inverse = np.unique(values, return_inverse=True)
+    counts = np.bincount(inverse)
+    # 고유 점수별 석차: 더 높은 점수 인원 + 1
+    higher = counts[::-1].cumsum()[::-1] - counts
+    unique_percentile = (higher + 1) / len(values) * 100
+    result = {'Percentile': unique_percentile[inverse]}
+    for name in schemes:
+        table = tables[name]
+        if table.kind == 'relative':
+            graded = table.grade(unique_percentile)
+        else:
+            scale = table.scale or max_score
+            graded = table.grade(unique * scale / max_score)
+        result[name] = graded[inverse]
+    return pd.DataFrame(result, index=index)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description='등급컷 문서 컴파일 / 여러 기준 동시 등급 비교')
+    sub = parser.add_subparsers(dest='command', required=True)
+    p_compile = sub.add_parser('compile', help='등급컷 md -> grade_cuts.csv')
+    p_compile.add_argument('markdown', nargs='+')
+    p_compile.add_argument('--out', default=CUTS_PATH)
+    p_compare = sub.add_parser('compare', help='학생 점수 CSV (Score 컬럼) 를 모든 기준으로 등급')
+    p_compare.add_argument('scores_csv')
+    p_compare.add_argument('--max-score', type=int, default=60)
+    p_compare.add_argument('--schemes', default=None, help='쉼표로 구분 (기본: 전체)')
+    p_compare.add_argument('--out', default=None, help='학생별 wide 표 CSV')
+    args = parser.parse_args()
+
+    if args.command == 'compile':
+        df = compile_markdown(args.markdown, args.out)
+        print(df.groupby('SCHEME', sort=False).size().to_string())
+        print(f"Saved {args.out}")
+    else:
+        students = pd.read_csv(args.scores_csv, encoding='utf-8-sig')
+        schemes = args.schemes.split(',') if args.schemes else None
+        wide = grade_schemes(students['Score'], args.max_score, schemes=schemes)
+        keep = [c for c in students.columns if c not in wide.columns and c not in ('Abs_Grade', 'Rel_Grade', 'Rank')]
+        wide = pd.concat([students[keep], wide], axis=1)
+        for name in wide.columns[len(keep) + 1:]:
+            print(f"\n[{name}]")
+            print(wide[name].value_counts().sort_index().to_string())
+        if args.out:
+            wide.to_csv(args.out, index=False, encoding='utf-8-sig')
+            print(f"\nSaved {args.out}")
@@ -0,0 +1,138 @@
+import numpy as np
+import pandas as pd
+
+from lt_data.loader import star_counts
+
+# 문항 분석 (고전 검사 이론)
+# ResponseMatrix 하나 (한 시기, 한 레벨) 의 모든 문항을 열 합 몇 개로 한 번에 계산한다.
+# 총점 T 는 비트 행렬 popcount, 나머지는 학생 블록마다 Σx, Σx·T, 상위/하위 집단 Σx 를 더한다.
+# - P_Value:          정답 수 / 응답 수 (ResponseMatrix.p_values 와 같다)
+# - Discrimination:   상위 27% 정답률 - 하위 27% 정답률 (총점 순, 동점은 학생 순서)
+# - Point_Biserial:   문항 점수와 (총점 - 그 문항) 의 상관 (corrected item-total)
+# - Alpha_If_Deleted: 그 문항을 뺀 Cronbach alpha
+# 신뢰도 계산에서는 응답하지 않은 문항을 오답 (0) 으로 본다.
+GROUP_FRACTION = 0.27
+SPLIT_COLUMNS = ['문항 유형', '문항난이도']
+
+
+def cronbach_alpha(item_var, total_var, n_items):
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return n_items / (n_items - 1) * (1 - item_var / total_var)
+
+
+def item_statistics(matrix, fraction=GROUP_FRACTION, block_rows=65536):
+    # 문항 사이드카 + 통계 (문항 순서). attrs['alpha'] 에 전체 alpha
+    n, k = matrix.n_students, matrix.n_items
+    total = matrix.scores().astype(np.float64)
+    order = np.argsort(-total, kind='stable')
+    group = max(int(round(n * fraction)), 1)
+    membership = np.zeros(n, dtype=np.int8)           # 1 = 상위, -1 = 하위
+    membership[order[-group:]] = -1
+    membership[order[:group]] = 1
+
+    sum_x = np.zeros(k)
+    sum_xt = np.zeros(k)
+    upper = np.zeros(k)
+    lower = np.zeros(k)
+    for start in range(0, n, block_rows):
+        rows = slice(start, start + block_rows)
+        x = matrix.dense(rows).astype(np.float64)
+        t = total[rows]
+        m = membership[rows]
+        sum_x += x.sum(axis=0)
+        sum_xt += t @ x
+        upper += (m == 1) @ x
+        lower += (m == -1) @ x
+    correct, answered = matrix.item_counts(block_rows=block_rows)
+
+    # 모분산 / 공분산 (ddof=0). 문항은 0/1 이므로 Σx² = Σx
+    mean = sum_x / n
+    item_var = mean - mean ** 2
+    total_var = total.var()
+    cov = sum_xt / n - mean * total.mean()
+    rest_var = total_var - 2 * cov + item_var           # var(T - x_j)
+
+    result = matrix.items.copy()
+    result['Answered'] = answered
+    result['Correct'] = correct
+    with np.errstate(invalid='ignore', divide='ignore'):
+        result['P_Value'] = correct / answered
+        result['Upper_P'] = upper / group
+        result['Lower_P'] = lower / group
+        result['Discrimination'] = result['Upper_P'] - result['Lower_P']
+        result['Point_Biserial'] = (cov - item_var) / np.sqrt(item_var * rest_var)
+    result['Alpha_If_Deleted'] = cronbach_alpha(item_var.sum() - item_var, rest_var, k - 1)
+    result.attrs['alpha'] = float(cronbach_alpha(item_var.sum(), total_var, k))
+    result.attrs['students'] = n
+    return result
+
+
+def split_summary(stats, columns=SPLIT_COLUMNS, keys=()):
+    # 문항 유형 / 난이도별 평균 통계 (tidy: keys..., Split, Value, Items, ...)
+    frames = []
+    for col in columns:
+        if col not in stats.columns:
+            continue
+        values = star_counts(stats[col]) if col == '문항난이도' else stats[col].astype(str)
+        summary = stats.groupby([*keys, values.rename('Value')], observed=True, sort=True).agg(
+            Items=('문항 순번', 'size'), P_Value=('P_Value', 'mean'), Discrimination=('Discrimination', 'mean'),
+            Point_Biserial=('Point_Biserial', 'mean'),
+        ).reset_index()
+        summary.insert(len(keys), 'Split', col)
+        frames.append(summary)
+    return pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+
+
+def item_report(matrices, period=None, **kwargs):
+    # {레벨: ResponseMatrix} -> (문항 표, 레벨별 alpha 표)
+    items, reliability = [], []
+    for level, matrix in matrices.items():
+        stats = item_statistics(matrix, **kwargs)
+        stats.insert(0, 'Level', level)
+        if period is not None:
+            stats.insert(0, 'Period', period)
+        items.append(stats)
+        reliability.append({'Period': period, 'Level': level, 'Students': stats.attrs['students'],
+                            'Items': matrix.n_items, 'Alpha': stats.attrs['alpha']})
+    return pd.concat(items, ignore_index=True), pd.DataFrame(reliability)
+
+
+if __name__ == "__main__":
+    import argparse
+    import os
+    import time
+
+    from lt_data.loader import read_sheet
+    from lt_data.matrix import build_matrices
+
+    parser = argparse.ArgumentParser(description='문항 분석 (정답률, 변별도, 점이연 상관, 문항 제거 시 alpha)')
+    parser.add_argument('periods', nargs='+', help='시기=학생문항별결과 CSV (예: 2024-11=2024_11월_data/2024_11월_학생문항별결과.csv)')
+    parser.add_argument('--out', default=None, help='결과 폴더 (item_stats.csv, item_splits.csv, reliability.csv)')
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    items, reliability = [], []
+    for period, path in (p.split('=', 1) for p in args.periods):
+        stats, alpha = item_report(build_matrices(read_sheet(path), period), period=period)
+        items.append(stats)
+        reliability.append(alpha)
+    items = pd.concat(items, ignore_index=True)
+    reliability = pd.concat(reliability, ignore_index=True)
+    splits = split_summary(items, keys=['Period', 'Level'])
+    print(f"{len(items):,} items in {time.perf_counter() - start:.2f}s")
+
+    print("\n=== 신뢰도 (Cronbach alpha) ===")
+    print(reliability.round(3).to_string(index=False))
+    flagged = items.merge(reliability[['Period', 'Level', 'Alpha']], on=['Period', 'Level'])
+    flagged = flagged[(flagged['Point_Biserial'] < 0.2) | (flagged['Alpha_If_Deleted'] > flagged['Alpha'])]
+    print(f"\n=== 검토 문항 (점이연 < 0.2 또는 제거 시 alpha 상승): {len(flagged)} ===")
+    print(flagged[['Period', 'Level', '문항 순번', 'P_Value', 'Discrimination', 'Point_Biserial', 'Alpha_If_Deleted']]
+          .round(3).to_string(index=False))
+    print("\n=== 문항 유형 / 난이도별 평균 ===")
+    print(splits.round(3).to_string(index=False))
+    if args.out:
+        os.makedirs(args.out, exist_ok=True)
+        items.to_csv(os.path.join(args.out, 'item_stats.csv'), index=False, encoding='utf-8-sig')
+        splits.to_csv(os.path.join(args.out, 'item_splits.csv'), index=False, encoding='utf-8-sig')
+        reliability.to_csv(os.path.join(args.out, 'reliability.csv'), index=False, encoding='utf-8-sig')
+        print(f"\nSaved {args.out}")
@@ -0,0 +1,94 @@
+import os
+
+import numpy as np
+import pandas as pd
+
+# 학생 대리키 (int32 student_id)
+# (period, 학생 키) 마다 정수 id 를 하나 붙인다. 학생 키는 결과코드가 있으면 결과코드, 없으면 학번.
+# 이름 같은 속성은 dimension 표에만 두고, groupby / merge 는 student_id 로 한다.
+# 레지스트리를 CSV 로 저장해 두면 같은 학생은 다음 적재에서도 같은 id 를 받는다 (새 학생은 뒤에 붙는다).
+DIMENSION_COLUMNS = ['이름', '교육과정', '캠퍼스', '학급']
+
+
+def student_key(df):
+    return '결과코드' if '결과코드' in df.columns else '학번'
+
+
+class StudentKeys:
+
+    def __init__(self, dimension=None):
+        # dimension: student_id, period, key, (이름, 교육과정, ...) 표
+        if dimension is None:
+            dimension = pd.DataFrame({'student_id': np.array([], dtype=np.int32),
+                                      'period': np.array([], dtype=object),
+                                      'key': np.array([], dtype=np.int64)})
+        self.dimension = dimension.reset_index(drop=True)
+        self._index = pd.MultiIndex.from_arrays([self.dimension['period'].astype(str),
+                                                 self.dimension['key'].astype(np.int64)])
+
+    def __len__(self):
+        return len(self.dimension)
+
+    def assign(self, df, period, key=None):
+        # df 의 행마다 student_id (int32). 처음 보는 학생은 키 순서대로 새 id 를 받는다
+        key = key or student_key(df)
+        keys = df[key].to_numpy(dtype=np.int64)
+        lookup = pd.MultiIndex.from_arrays([np.full(len(keys), str(period), dtype=object), keys])
+        ids = self._index.get_indexer(lookup)
+        new = ids < 0
+        if new.any():
+            new_keys, first = np.unique(keys[new], return_index=True)
+            rows = df[new].iloc[first]
+            added = pd.DataFrame({
+                'student_id': np.arange(len(self), len(self) + len(new_keys), dtype=np.int32),
+                'period': str(period),
+                'key': new_keys,
+            })
+            for col in DIMENSION_COLUMNS:
+                if col in df.columns:
+                    added[col] = rows[col].astype(str).to_numpy()
+            self.dimension = pd.concat([self.dimension, added], ignore_index=True)
+            self._index = self._index.append(pd.MultiIndex.from_arrays([added['period'], added['key']]))
+            ids[new] = self._index.get_indexer(lookup[new])
+        return ids.astype(np.int32)
+
+    def attributes(self, student_ids, columns=('이름',)):
+        # student_id -> 속성 (dimension 표에서)
+        dim = self.dimension.set_index('student_id')
+        return dim.loc[np.asarray(student_ids), list(columns)].reset_index()
+
+    def save(self, path):
+        self.dimension.to_csv(path, index=False, encoding='utf-8-sig')
+
+    @classmethod
+    def load(cls, path):
+        if not os.path.exists(path):
+            return cls()
+        dim = pd.read_csv(path, encoding='utf-8-sig', dtype={'period': str, **{c: str for c in DIMENSION_COLUMNS}})
+        dim['student_id'] = dim['student_id'].astype(np.int32)
+        return cls(dim)
+
+
+def add_student_ids(df, period, keys=None):
+    # df 에 student_id 컬럼을 넣고 레지스트리를 돌려준다 (없으면 새로 만든다)
+    keys = StudentKeys() if keys is None else keys
+    df['student_id'] = keys.assign(df, period)
+    return keys
+
+
+if __name__ == "__main__":
+    import argparse
+
+    from lt_data.loader import read_sheet
+
+    parser = argparse.ArgumentParser(description='학생 대리키 레지스트리 갱신')
+    parser.add_argument('registry', help='레지스트리 CSV (없으면 새로 만든다)')
+    parser.add_argument('periods', nargs='+', help='시기=CSV (예: 2024-11=2024_11월_data/2024_11월_학생문항별결과.csv)')
+    args = parser.parse_args()
+
+    keys = StudentKeys.load(args.registry)
+    before = len(keys)
+    for period, path in (p.split('=', 1) for p in args.periods):
+        keys.assign(read_sheet(path), period)
+    keys.save(args.registry)
+    print(f"{len(keys) - before:,} new students, {len(keys):,} total -> {args.registry}")
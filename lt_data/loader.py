@@ -0,0 +1,174 @@
+import os
+
+import numpy as np
+import pandas as pd
+
+from lt_data.schema import adapt_schema, canonical_names, physical_names
+
+# 컬럼 캐시 (CSV 옆에 같은 이름의 .parquet 파일로 저장)
+# - 반복되는 문자열 컬럼은 dictionary(category)로 저장
+# - 정답여부 Y/N 은 nullable boolean 으로 저장 (Y True / N False / 그 밖의 값, 빈 칸은 <NA>)
+# - 문항 순번은 int8, 학생 키(학번/결과코드)는 int32 로 저장
+DICTIONARY_COLUMNS = [
+    '캠퍼스', '교육과정', '스킬', '레벨', '학급', '시험과목',
+    '문항 유형', '문항난이도', '난이도', '구간',
+]
+BOOL_COLUMNS = ['정답여부', '정답 여부']
+SMALL_INT_COLUMNS = ['문항 순번']
+KEY_COLUMNS = ['학번', '결과코드']
+
+_INT32_MAX = np.iinfo(np.int32).max
+
+
+def cache_path(csv_path):
+    return os.path.splitext(csv_path)[0] + '.parquet'
+
+
+def compact_frame(df):
+    # CSV에서 읽은 프레임과 캐시에서 읽은 프레임이 같은 dtype을 갖도록 맞춘다 (여러 번 호출해도 같은 결과)
+    for col in df.columns:
+        if col in DICTIONARY_COLUMNS:
+            if not isinstance(df[col].dtype, pd.CategoricalDtype):
+                df[col] = df[col].astype('category')
+        elif col in BOOL_COLUMNS and not isinstance(df[col].dtype, pd.BooleanDtype):
+            if df[col].dtype == bool:
+                df[col] = df[col].astype('boolean')
+            else:
+                values = df[col]
+                df[col] = pd.Series(values == 'Y', index=df.index, dtype='boolean')
+                df.loc[~values.isin(['Y', 'N']), col] = pd.NA
+        elif col in SMALL_INT_COLUMNS:
+            values = pd.to_numeric(df[col], errors='coerce')
+            df[col] = values.astype('Int8' if values.isna().any() else 'int8')
+        elif col in KEY_COLUMNS and df[col].dtype != np.int32:
+            # 숫자가 아닌 키가 섞여 있으면 원래 값을 유지한다
+            values = pd.to_numeric(df[col], errors='coerce')
+            if not values.isna().any() and values.between(0, _INT32_MAX).all():
+                df[col] = values.astype('int32')
+    return df
+
+
+def star_counts(series):
+    # '★★' 같은 난이도 문자열 -> 별 개수 (int8)
+    # 카테고리 값마다 한 번만 세고 코드로 펼치므로 행 단위 apply 가 필요 없다
+    if not isinstance(series.dtype, pd.CategoricalDtype):
+        series = series.astype('category')
+    per_category = np.array([str(c).count('★') for c in series.cat.categories] + [0], dtype='int8')
+    # 결측값(code -1)은 마지막 원소(0)를 가리킨다
+    return pd.Series(per_category[series.cat.codes.to_numpy()], index=series.index, name=series.name)
+
+
+def write_cache(df, csv_path):
+    # pyarrow 가 없으면 캐시 없이 CSV만 사용한다
+    path = cache_path(csv_path)
+    try:
+        compact_frame(df.copy()).to_parquet(path, index=False)
+    except ImportError as e:
+        print(f"Skipping parquet cache ({e})")
+        return None
+    print(f"Saved cache {os.path.basename(path)}")
+    return path
+
+
+def _fresh_cache(csv_path):
+    # CSV보다 최신인 캐시 경로 (없으면 None)
+    path = cache_path(csv_path)
+    if os.path.exists(path) and (
+        not os.path.exists(csv_path) or os.path.getmtime(path) >= os.path.getmtime(csv_path)
+    ):
+        return path
+    return None
+
+
+def read_sheet(csv_path, columns=None, adapt=True):
+    # 캐시가 CSV보다 최신이면 필요한 컬럼만 캐시에서 읽는다
+    # adapt=True 이면 2024/2025 컬럼명을 표준 스키마로 맞춘다 (columns 도 표준 이름으로 지정)
+    path = _fresh_cache(csv_path)
+    df = None
+    if path is not None:
+        try:
+            import pyarrow.parquet as pq
+
+            file_columns = pq.read_schema(path).names
+            usecols = physical_names(file_columns, columns) if adapt and columns else columns
+            df = pd.read_parquet(path, columns=usecols)
+        except ImportError:
+            pass
+    if df is None:
+        usecols = columns
+        if adapt and columns:
+            file_columns = pd.read_csv(csv_path, nrows=0, encoding='utf-8-sig').columns
+            usecols = physical_names(file_columns, columns)
+        df = pd.read_csv(csv_path, usecols=usecols, encoding='utf-8-sig')
+        if usecols is not None:
+            df = df[usecols]
+    if adapt:
+        adapt_schema(df, source=os.path.basename(csv_path))
+    return compact_frame(df)
+
+
+def sheet_columns(csv_path):
+    # 파일을 읽지 않고 표준 컬럼 이름 목록만 (캐시 스키마 또는 CSV 헤더)
+    path = _fresh_cache(csv_path)
+    if path is not None:
+        try:
+            import pyarrow.parquet as pq
+
+            return canonical_names(pq.read_schema(path).names)
+        except ImportError:
+            pass
+    return canonical_names(list(pd.read_csv(csv_path, nrows=0, encoding='utf-8-sig').columns))
+
+
+def iter_sheet(csv_path, columns=None, chunk_rows=50000):
+    # read_sheet 와 같은 dtype 의 프레임을 chunk_rows 행씩 돌려준다 (캐시가 있으면 parquet 배치, 없으면 CSV chunksize)
+    path = _fresh_cache(csv_path)
+    source = os.path.basename(csv_path)
+    if path is not None:
+        try:
+            import pyarrow.parquet as pq
+
+            parquet = pq.ParquetFile(path)
+            usecols = physical_names(parquet.schema_arrow.names, columns) if columns else None
+            for batch in parquet.iter_batches(batch_size=chunk_rows, columns=usecols):
+                df = batch.to_pandas()
+                adapt_schema(df, source=source)
+                yield compact_frame(df)
+            return
+        except ImportError:
+            pass
+    usecols = None
+    if columns:
+        usecols = physical_names(pd.read_csv(csv_path, nrows=0, encoding='utf-8-sig').columns, columns)
+    for df in pd.read_csv(csv_path, usecols=usecols, encoding='utf-8-sig', chunksize=chunk_rows):
+        if usecols is not None:
+            df = df[usecols]
+        adapt_schema(df, source=source)
+        yield compact_frame(df)
+
+
+def read_levels(files, columns=None, level_column='Level'):
+    # files: {레벨: CSV 경로}. 없는 파일은 건너뛴다
+    frames = {}
+    for level, path in files.items():
+        if not os.path.exists(path) and not os.path.exists(cache_path(path)):
+            continue
+        frames[level] = read_sheet(path, columns=columns)
+    return concat_levels(frames, level_column, levels=list(files))
+
+
+def concat_levels(frames, level_column='Level', levels=None):
+    # frames: {레벨: DataFrame}
+    # 레벨별 프레임을 하나로 합치되 category 컬럼은 category 그대로 유지한다
+    if not frames:
+        return None
+    frames = {level: df.assign(**{level_column: level}) for level, df in frames.items()}
+    first = next(iter(frames.values()))
+    for col in first.columns:
+        if all(isinstance(df[col].dtype, pd.CategoricalDtype) for df in frames.values()):
+            categories = pd.Index(pd.unique(np.concatenate([df[col].cat.categories.to_numpy(dtype=object) for df in frames.values()])))
+            for df in frames.values():
+                df[col] = df[col].cat.set_categories(categories)
+    full_df = pd.concat(frames.values(), ignore_index=True)
+    full_df[level_column] = pd.Categorical(full_df[level_column], categories=levels or list(frames))
+    return full_df
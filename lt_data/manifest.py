@@ -0,0 +1,128 @@
+import hashlib
+import json
+import os
+import posixpath
+import zipfile
+import xml.etree.ElementTree as ET
+
+# 변환 매니페스트: 출력 파일별로 원본 파일 해시, 시트 이름, 시트 내용 해시, 출력 파일 해시를 저장
+MANIFEST_NAME = '_conversion_manifest.json'
+
+_MAIN_NS = '{http://schemas.openxmlformats.org/spreadsheetml/2006/main}'
+_REL_NS = '{http://schemas.openxmlformats.org/officeDocument/2006/relationships}'
+_PKG_REL_NS = '{http://schemas.openxmlformats.org/package/2006/relationships}'
+
+
+def file_hash(path, chunk_size=1 << 20):
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _shared_strings(zf):
+    if 'xl/sharedStrings.xml' not in zf.namelist():
+        return []
+    root = ET.fromstring(zf.read('xl/sharedStrings.xml'))
+    return [''.join(si.itertext()) for si in root.iter(f'{_MAIN_NS}si')]
+
+
+def _sheet_members(zf):
+    # 시트 이름 -> zip 내부 XML 경로 (workbook.xml 순서 유지)
+    workbook = ET.fromstring(zf.read('xl/workbook.xml'))
+    rels = ET.fromstring(zf.read('xl/_rels/workbook.xml.rels'))
+    targets = {rel.get('Id'): rel.get('Target') for rel in rels.iter(f'{_PKG_REL_NS}Relationship')}
+    members = {}
+    for sheet in workbook.iter(f'{_MAIN_NS}sheet'):
+        target = targets[sheet.get(f'{_REL_NS}id')]
+        if target.startswith('/'):
+            members[sheet.get('name')] = target.lstrip('/')
+        else:
+            members[sheet.get('name')] = posixpath.normpath(posixpath.join('xl', target))
+    return members
+
+
+def sheet_hashes(xlsx_path):
+    # 시트별 내용 해시
+    # sharedStrings 인덱스를 실제 문자열로 풀어서 해시하므로
+    # 다른 시트 수정으로 sharedStrings.xml 이 바뀌어도 이 시트의 해시는 유지된다
+    if not zipfile.is_zipfile(xlsx_path):
+        return {None: file_hash(xlsx_path)}
+
+    with zipfile.ZipFile(xlsx_path) as zf:
+        shared = _shared_strings(zf)
+        digests = {}
+        for name, member in _sheet_members(zf).items():
+            h = hashlib.sha256()
+            with zf.open(member) as f:
+                for _, elem in ET.iterparse(f):
+                    if elem.tag == f'{_MAIN_NS}c':
+                        value = ''.join(elem.itertext())
+                        if elem.get('t') == 's' and value:
+                            value = shared[int(value)]
+                        h.update(f"{elem.get('r')}\t{value}\n".encode('utf-8'))
+                        elem.clear()
+                    elif elem.tag == f'{_MAIN_NS}row':
+                        elem.clear()
+            digests[name] = h.hexdigest()
+    return digests
+
+
+def load_manifest(output_dir):
+    path = os.path.join(output_dir, MANIFEST_NAME)
+    if not os.path.exists(path):
+        return {}
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def save_manifest(output_dir, manifest):
+    path = os.path.join(output_dir, MANIFEST_NAME)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2, sort_keys=True)
+
+
+def _output_intact(entry, output_path):
+    return os.path.exists(output_path) and file_hash(output_path) == entry.get('output_hash')
+
+
+def stale_sheets(input_file, outputs, manifest, force=False):
+    # outputs: {시트 이름: 출력 CSV 경로}
+    # 반환: (원본 해시, {시트 이름: 시트 해시}, 다시 변환해야 할 시트 목록)
+    source_hash = file_hash(input_file)
+    current = {}
+
+    def sheet_hash(sheet_name):
+        # 통합문서가 바뀐 경우에만 시트 해시를 계산한다 (한 번만)
+        if not current:
+            current.update(sheet_hashes(input_file))
+        return current.get(sheet_name, current.get(None))
+
+    digests = {}
+    stale = []
+    for sheet_name, output_path in outputs.items():
+        entry = manifest.get(os.path.basename(output_path))
+        if not force and entry and entry.get('sheet') == sheet_name and _output_intact(entry, output_path):
+            if entry.get('source_hash') == source_hash:
+                digests[sheet_name] = entry.get('sheet_hash')
+                continue
+            digests[sheet_name] = sheet_hash(sheet_name)
+            if digests[sheet_name] == entry.get('sheet_hash'):
+                # 다른 시트만 수정된 경우: 출력은 그대로 두고 원본 해시만 갱신
+                entry['source_hash'] = source_hash
+                continue
+        else:
+            digests[sheet_name] = sheet_hash(sheet_name)
+        stale.append(sheet_name)
+    return source_hash, digests, stale
+
+
+def record(manifest, input_file, source_hash, sheet_name, sheet_hash, output_path):
+    manifest[os.path.basename(output_path)] = {
+        'source': os.path.basename(input_file),
+        'source_hash': source_hash,
+        'sheet': sheet_name,
+        'sheet_hash': sheet_hash,
+        'output_hash': file_hash(output_path),
+    }
@@ -0,0 +1,189 @@
+import os
+
+import numpy as np
+import pandas as pd
+
+# 학생 x 문항 정답 행렬 (비트 압축)
+# - bits:     (학생 수, ceil(문항 수 / 8)) uint8, 문항 j 는 바이트 j // 8 의 비트 j % 8 (little bit order)
+# - answered: 같은 모양. 응답 행이 있는 칸만 1 (결측 응답은 오답으로도, 미응시로도 셀 수 있게 따로 둔다)
+# - students: 행 인덱스 사이드카 (학생 키와 속성)
+# - items:    열 인덱스 사이드카 (문항 순번과 속성)
+STUDENT_ATTRIBUTES = ['결과코드', '학번', '이름', '캠퍼스', '학급', '교육과정']
+ITEM_ATTRIBUTES = ['시험과목', '스킬', '문항 유형', '문항난이도']
+
+_POPCOUNT = np.array([bin(i).count('1') for i in range(256)], dtype=np.uint8)
+
+
+def popcount(bits, axis=1):
+    # 바이트별 1 비트 수를 더한다
+    if hasattr(np, 'bitwise_count'):
+        counts = np.bitwise_count(bits)
+    else:
+        counts = _POPCOUNT[bits]
+    return counts.sum(axis=axis, dtype=np.int64)
+
+
+def _pack(dense):
+    return np.packbits(dense, axis=1, bitorder='little')
+
+
+def _unpack(bits, n_items):
+    return np.unpackbits(bits, axis=1, count=n_items, bitorder='little').astype(bool)
+
+
+class ResponseMatrix:
+
+    def __init__(self, bits, answered, students, items):
+        self.bits = bits
+        self.answered = answered
+        self.students = students
+        self.items = items
+
+    @property
+    def n_students(self):
+        return len(self.students)
+
+    @property
+    def n_items(self):
+        return len(self.items)
+
+    @classmethod
+    def from_frame(cls, df, student_key=None):
+        # df: 표준 스키마의 학생문항별결과 (한 레벨, 한 시기)
+        if student_key is None:
+            student_key = '결과코드' if '결과코드' in df.columns else '학번'
+        s_idx, s_keys = pd.factorize(df[student_key], sort=True)
+        i_idx, i_keys = pd.factorize(df['문항 순번'], sort=True)
+
+        correct = np.zeros((len(s_keys), len(i_keys)), dtype=bool)
+        answered = np.zeros_like(correct)
+        correct[s_idx, i_idx] = df['정답여부'].to_numpy(dtype=bool, na_value=False)
+        answered[s_idx, i_idx] = True
+
+        first_rows = np.unique(s_idx, return_index=True)[1]
+        student_cols = [c for c in STUDENT_ATTRIBUTES if c in df.columns and c != student_key]
+        students = df.iloc[first_rows][[student_key] + student_cols].reset_index(drop=True)
+
+        first_rows = np.unique(i_idx, return_index=True)[1]
+        item_cols = [c for c in ITEM_ATTRIBUTES if c in df.columns]
+        items = df.iloc[first_rows][['문항 순번'] + item_cols].reset_index(drop=True)
+        return cls(_pack(correct), _pack(answered), students, items)
+
+    # ------------------------------------------------------------------
+    # 저장 / 로드 (bits 는 .npy 로 저장되어 mmap 으로 열 수 있다)
+
+    def save(self, prefix):
+        os.makedirs(os.path.dirname(prefix) or '.', exist_ok=True)
+        np.save(prefix + '.bits.npy', self.bits)
+        np.save(prefix + '.answered.npy', self.answered)
+        self.students.to_csv(prefix + '.students.csv', index=False, encoding='utf-8-sig')
+        self.items.to_csv(prefix + '.items.csv', index=False, encoding='utf-8-sig')
+
+    @classmethod
+    def load(cls, prefix, mmap=True):
+        mode = 'r' if mmap else None
+        bits = np.load(prefix + '.bits.npy', mmap_mode=mode)
+        answered = np.load(prefix + '.answered.npy', mmap_mode=mode)
+        students = pd.read_csv(prefix + '.students.csv', encoding='utf-8-sig')
+        items = pd.read_csv(prefix + '.items.csv', encoding='utf-8-sig')
+        return cls(bits, answered, students, items)
+
+    # ------------------------------------------------------------------
+    # 집계
+
+    def dense(self, rows=None):
+        bits = self.bits if rows is None else self.bits[rows]
+        return _unpack(np.asarray(bits), self.n_items)
+
+    def dense_answered(self, rows=None):
+        answered = self.answered if rows is None else self.answered[rows]
+        return _unpack(np.asarray(answered), self.n_items)
+
+    def column(self, item):
+        # 문항 하나의 정답 여부 (bool, 학생 수 길이). item 은 열 번호
+        return (np.asarray(self.bits[:, item // 8]) >> (item % 8)) & 1 == 1
+
+    def scores(self, item_mask=None):
+        # 학생별 정답 수. item_mask 로 일부 문항만 셀 수 있다 (예: Q1-10)
+        bits = np.asarray(self.bits)
+        if item_mask is not None:
+            bits = bits & _pack(np.asarray(item_mask, dtype=bool)[None, :])
+        return popcount(bits)
+
+    def item_counts(self, block_rows=65536):
+        # 문항별 (정답 수, 응답 수). 행 블록 단위로 풀어서 메모리를 제한한다
+        correct = np.zeros(self.n_items, dtype=np.int64)
+        answered = np.zeros(self.n_items, dtype=np.int64)
+        for start in range(0, self.n_students, block_rows):
+            rows = slice(start, start + block_rows)
+            correct += _unpack(np.asarray(self.bits[rows]), self.n_items).sum(axis=0)
+            answered += _unpack(np.asarray(self.answered[rows]), self.n_items).sum(axis=0)
+        return correct, answered
+
+    def group_item_counts(self, codes, n_groups, block_rows=65536):
+        # 학생별 그룹 번호 codes (0..n_groups-1) -> (그룹 수 x 문항 수) 정답 수, 응답 수
+        # 블록마다 학생 행을 그 그룹 행에 np.add.at 으로 더한다
+        correct = np.zeros((n_groups, self.n_items), dtype=np.int64)
+        answered = np.zeros_like(correct)
+        for start in range(0, self.n_students, block_rows):
+            rows = slice(start, start + block_rows)
+            np.add.at(correct, codes[rows], self.dense(rows).astype(np.int64))
+            np.add.at(answered, codes[rows], self.dense_answered(rows).astype(np.int64))
+        return correct, answered
+
+    def p_values(self):
+        correct, answered = self.item_counts()
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return pd.Series(correct / answered, index=self.items['문항 순번'], name='p_value')
+
+    def position_curve(self, group_column=None, block_rows=65536):
+        # (위치 1..마지막 문항 순번 x 그룹) 정답률 %. 시험에 없는 위치는 NaN
+        # group_column (예: 캠퍼스) 이 없으면 'Accuracy_%' 한 열
+        if group_column is None:
+            codes, groups = np.zeros(self.n_students, dtype=np.int64), pd.Index(['Accuracy_%'])
+        else:
+            codes, groups = pd.factorize(self.students[group_column].astype(str), sort=True)
+        correct, answered = self.group_item_counts(codes, len(groups), block_rows)
+        positions = self.items['문항 순번'].to_numpy(dtype=np.int64)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            curve = pd.DataFrame((correct / answered * 100).T, index=pd.Index(positions, name='Position'),
+                                 columns=pd.Index(groups, name=group_column))
+        return curve.reindex(pd.RangeIndex(1, positions.max() + 1, name='Position'))
+
+    def co_miss(self):
+        # (문항 수 x 문항 수) 두 문항을 모두 틀린 학생 수
+        missed = (~self.dense() & self.dense_answered()).astype(np.int32)
+        labels = self.items['문항 순번']
+        return pd.DataFrame(missed.T @ missed, index=labels, columns=labels)
+
+
+def matrix_prefix(out_dir, period, level):
+    return os.path.join(out_dir, f'{period}_{level}')
+
+
+def build_matrices(df, period, out_dir=None, level_column='교육과정'):
+    # 레벨별 ResponseMatrix 를 만든다. out_dir 을 주면 {period}_{level}.* 로 저장
+    matrices = {}
+    for level, sub_df in df.groupby(level_column, observed=True, sort=False):
+        matrix = ResponseMatrix.from_frame(sub_df)
+        if out_dir is not None:
+            matrix.save(matrix_prefix(out_dir, period, level))
+        matrices[level] = matrix
+    return matrices
+
+
+if __name__ == "__main__":
+    import argparse
+
+    from lt_data.loader import read_sheet
+
+    parser = argparse.ArgumentParser(description='학생문항별결과 CSV -> 레벨별 비트 압축 정답 행렬')
+    parser.add_argument('csv_path')
+    parser.add_argument('period', help='예: 2024-11')
+    parser.add_argument('--out', default=None, help='저장 폴더 (기본: CSV 폴더/_matrix)')
+    args = parser.parse_args()
+
+    out_dir = args.out or os.path.join(os.path.dirname(args.csv_path), '_matrix')
+    df = read_sheet(args.csv_path)
+    for level, matrix in build_matrices(df, args.period, out_dir=out_dir).items():
+        print(f"{level}: {matrix.n_students:,} students x {matrix.n_items} items -> {matrix_prefix(out_dir, args.period, level)}.*")
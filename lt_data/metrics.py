@@ -0,0 +1,124 @@
+import numpy as np
+import pandas as pd
+
+from lt_data.loader import star_counts
+
+# 레벨별 지표 (check_hypotheses Part 1-3)
+# 응답 행을 한 번만 훑어서 두 개의 작은 표를 만든다.
+# - 문항 표: (레벨 x 문항 순번 x 별 개수) 응답 수 / 정답 수
+# - 점수 표: (레벨 x 점수) 학생 수
+# 지표는 모두 이 두 표에서 계산하는 함수이므로, 지표를 더해도 원자료를 다시 읽지 않는다 (METRICS 에 추가).
+NEAR_CUTS = {'Near_1G': (51, 53), 'Near_2G': (45, 47), 'Near_3G': (39, 41)}
+
+
+class LevelSummary:
+
+    def __init__(self, levels, answered, correct, score_hist):
+        self.levels = list(levels)
+        self.answered = answered          # (레벨, 문항 순번, 별 개수)
+        self.correct = correct
+        self.score_hist = score_hist      # (레벨, 점수)
+
+    @classmethod
+    def from_frame(cls, df, level_column='Level', student_column='student_id'):
+        # df: 표준 스키마 응답 행 (문항 순번, 정답여부, 문항난이도 또는 Difficulty)
+        levels = df[level_column]
+        if not isinstance(levels.dtype, pd.CategoricalDtype):
+            levels = levels.astype('category')
+        levels = levels.cat.remove_unused_categories()
+        level = levels.cat.codes.to_numpy(dtype=np.int64)
+        position = df['문항 순번'].to_numpy(dtype=np.int64)
+        stars = (df['Difficulty'] if 'Difficulty' in df.columns else star_counts(df['문항난이도'])).to_numpy(dtype=np.int64)
+        correct = df['정답여부'].to_numpy(dtype=bool, na_value=False)
+
+        n_levels = len(levels.cat.categories)
+        shape = (n_levels, int(position.max()) + 1, int(stars.max()) + 1)
+        cell = np.ravel_multi_index((level, position, stars), shape)
+        answered = np.bincount(cell, minlength=np.prod(shape)).reshape(shape)
+        right = np.bincount(cell, weights=correct, minlength=np.prod(shape)).reshape(shape).astype(np.int64)
+
+        # 학생 점수 -> 레벨별 점수 히스토그램 (student_id 는 레벨 안에서 유일한 정수 키)
+        student = df[student_column].to_numpy(dtype=np.int64)
+        pair = level * (int(student.max()) + 1) + student
+        pairs, inverse = np.unique(pair, return_inverse=True)
+        scores = np.bincount(inverse, weights=correct).astype(np.int64)
+        pair_level = pairs // (int(student.max()) + 1)
+        score_hist = np.zeros((n_levels, int(scores.max()) + 1), dtype=np.int64)
+        np.add.at(score_hist, (pair_level, scores), 1)
+        return cls(levels.cat.categories, answered, right, score_hist)
+
+    # ------------------------------------------------------------------
+    # 문항 표 / 점수 표에서 레벨별 값 (레벨 수 길이 배열)
+
+    def accuracy(self, positions=None, stars=None):
+        # 정답률 (%). positions / stars 는 (MIN, MAX) 범위 (양끝 포함), None 은 전체
+        answered = self.answered
+        correct = self.correct
+        if positions is not None:
+            lo, hi = positions
+            answered = answered[:, lo:hi + 1]
+            correct = correct[:, lo:hi + 1]
+        if stars is not None:
+            lo, hi = stars
+            answered = answered[:, :, lo:hi + 1]
+            correct = correct[:, :, lo:hi + 1]
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return correct.sum(axis=(1, 2)) / answered.sum(axis=(1, 2)) * 100
+
+    def n_students(self):
+        return self.score_hist.sum(axis=1)
+
+    def score_share(self, lo, hi):
+        # 점수 [lo, hi] 학생 수
+        return self.score_hist[:, lo:hi + 1].sum(axis=1)
+
+    def std(self):
+        # 표본 표준편차 (Series.std 와 같은 ddof=1)
+        n = self.n_students().astype(np.float64)
+        values = np.arange(self.score_hist.shape[1])
+        mean = self.score_hist @ values / n
+        squares = self.score_hist @ (values ** 2) - n * mean ** 2
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return np.sqrt(np.maximum(squares, 0) / (n - 1))
+
+    def mode_share(self):
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return self.score_hist.max(axis=1) / self.n_students() * 100
+
+
+def _near(lo, hi, share):
+    if share:
+        return lambda s: s.score_share(lo, hi) / s.n_students() * 100
+    return lambda s: s.score_share(lo, hi)
+
+
+# 지표 이름 -> LevelSummary 함수. Part 1-3 출력 순서대로
+METRICS = {
+    'N': lambda s: s.n_students(),
+    'StdDev': lambda s: s.std(),
+    'Mode_%': lambda s: s.mode_share(),
+    'Acc_Q1-10': lambda s: s.accuracy(positions=(0, 10)),
+    'Acc_Q11-20': lambda s: s.accuracy(positions=(11, s.answered.shape[1] - 1)),
+    'Drop': lambda s: s.accuracy(positions=(0, 10)) - s.accuracy(positions=(11, s.answered.shape[1] - 1)),
+    'Acc_Easy': lambda s: s.accuracy(stars=(1, 2)),
+    'Acc_Hard': lambda s: s.accuracy(stars=(4, 5)),
+    'Gap': lambda s: s.accuracy(stars=(1, 2)) - s.accuracy(stars=(4, 5)),
+}
+for _name, (_lo, _hi) in NEAR_CUTS.items():
+    METRICS[f'{_name}_N'] = _near(_lo, _hi, share=False)
+    METRICS[f'{_name}_%'] = _near(_lo, _hi, share=True)
+
+
+def level_metrics(summary, metrics=None):
+    # tidy 표: Level, Metric, Value
+    metrics = METRICS if metrics is None else metrics
+    frames = [pd.DataFrame({'Level': summary.levels, 'Metric': name, 'Value': np.asarray(func(summary), dtype=np.float64)})
+              for name, func in metrics.items()]
+    return pd.concat(frames, ignore_index=True)
+
+
+def metrics_table(df, level_column='Level', student_column='student_id', metrics=None):
+    # 응답 행 -> (레벨 x 지표) 표
+    tidy = level_metrics(LevelSummary.from_frame(df, level_column, student_column), metrics)
+    table = tidy.pivot(index='Level', columns='Metric', values='Value')
+    return table[list(tidy['Metric'].unique())]
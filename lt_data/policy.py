@@ -0,0 +1,170 @@
+import json
+import os
+from abc import ABC, abstractmethod
+
+import numpy as np
+import pandas as pd
+
+# 구간(segment) 정책
+# 정책 정의는 segment_policies.json (또는 기준점.csv) 에 두고, 정책마다 NumPy 연산으로 컴파일한다.
+# - cuts:    한 필드를 경계 배열로 나눈다 (np.searchsorted). upper 가 inclusive 이면 값 <= 경계, exclusive 이면 값 < 경계
+# - ranges:  구간마다 필드별 [MIN, MAX] 조건을 and/or 로 묶는다. 앞 구간부터 처음 맞는 구간, 없으면 default
+# - combine: 다른 정책들의 결과를 구간 순서(labels 순)로 min/max
+# 결과는 labels 의 번호(code)로 계산하고, default 는 len(labels) 번이다.
+POLICIES_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'segment_policies.json')
+SEGMENT_ORDER = ['below2', 'below1', 'on', 'above1', 'above2']
+
+
+def _interval_mask(values, lo, hi, closed='both'):
+    # closed: both [lo, hi] / left [lo, hi) / right (lo, hi] / neither (lo, hi). None 은 제한 없음
+    mask = np.ones(len(values), dtype=bool)
+    if lo is not None:
+        mask &= values >= lo if closed in ('both', 'left') else values > lo
+    if hi is not None:
+        mask &= values <= hi if closed in ('both', 'right') else values < hi
+    return mask
+
+
+class SegmentPolicy(ABC):
+
+    def __init__(self, name, labels, default=None, description=''):
+        self.name = name
+        self.labels = list(labels)
+        self.default = default
+        self.description = description
+
+    @abstractmethod
+    def codes(self, fields, cache=None):
+        # fields: {필드: float 배열} -> 구간 번호 배열 (default 는 len(labels))
+        ...
+
+    def classify(self, cache=None, **fields):
+        # fields: score=..., percentile=... (배열 또는 Series). 라벨 배열 (object) 을 돌려준다
+        index = next((v.index for v in fields.values() if isinstance(v, pd.Series)), None)
+        arrays = {k: np.asarray(v, dtype=np.float64) for k, v in fields.items()}
+        labels = np.array(self.labels + [self.default], dtype=object)[self.codes(arrays, cache)]
+        return labels if index is None else pd.Series(labels, index=index, name=self.name)
+
+
+class CutPolicy(SegmentPolicy):
+
+    def __init__(self, name, field, labels, bounds, upper='inclusive', **kwargs):
+        super().__init__(name, labels, **kwargs)
+        if len(bounds) != len(self.labels) - 1:
+            raise ValueError(f"{name}: {len(self.labels)} labels need {len(self.labels) - 1} bounds, got {len(bounds)}")
+        if upper not in ('inclusive', 'exclusive'):
+            raise ValueError(f"{name}: upper must be inclusive or exclusive, got {upper!r}")
+        self.field = field
+        self.bounds = np.asarray(bounds, dtype=np.float64)
+        if np.any(np.diff(self.bounds) < 0):
+            raise ValueError(f"{name}: bounds must be ascending")
+        # inclusive: 값 <= bounds[i] 인 첫 i  / exclusive: 값 < bounds[i] 인 첫 i
+        self.side = 'left' if upper == 'inclusive' else 'right'
+
+    def codes(self, fields, cache=None):
+        return np.searchsorted(self.bounds, fields[self.field], side=self.side)
+
+
+class RangePolicy(SegmentPolicy):
+
+    def __init__(self, name, segments, combine='and', default='unclassified', **kwargs):
+        # segments: [{'label': ..., 필드: [MIN, MAX(, closed)]}, ...]
+        if combine not in ('and', 'or'):
+            raise ValueError(f"{name}: combine must be and/or, got {combine!r}")
+        super().__init__(name, [seg['label'] for seg in segments], default=default, **kwargs)
+        self.combine = combine
+        self.conditions = [{k: tuple(v) for k, v in seg.items() if k != 'label'} for seg in segments]
+
+    def codes(self, fields, cache=None):
+        n = len(next(iter(fields.values())))
+        out = np.full(n, len(self.labels), dtype=np.intp)
+        unassigned = np.ones(n, dtype=bool)
+        for code, conditions in enumerate(self.conditions):
+            masks = [_interval_mask(fields[field], *bounds) for field, bounds in conditions.items()]
+            hit = np.logical_and.reduce(masks) if self.combine == 'and' else np.logical_or.reduce(masks)
+            hit &= unassigned
+            out[hit] = code
+            unassigned &= ~hit
+        return out
+
+
+class CombinedPolicy(SegmentPolicy):
+
+    def __init__(self, name, policies, rule='min', **kwargs):
+        # policies: 같은 labels 를 쓰는 정책들
+        if rule not in ('min', 'max'):
+            raise ValueError(f"{name}: rule must be min/max, got {rule!r}")
+        labels = policies[0].labels
+        for policy in policies[1:]:
+            if policy.labels != labels:
+                raise ValueError(f"{name}: {policy.name} labels {policy.labels} differ from {labels}")
+        super().__init__(name, labels, default=kwargs.pop('default', policies[0].default), **kwargs)
+        self.policies = policies
+        self.rule = rule
+
+    def codes(self, fields, cache=None):
+        parts = np.stack([_cached_codes(policy, fields, cache) for policy in self.policies])
+        missing = (parts == len(self.labels)).any(axis=0)
+        out = parts.min(axis=0) if self.rule == 'min' else parts.max(axis=0)
+        out[missing] = len(self.labels)
+        return out
+
+
+def _cached_codes(policy, fields, cache):
+    # 여러 정책이 같은 하위 정책을 쓰면 한 번만 계산
+    if cache is None:
+        return policy.codes(fields)
+    if policy.name not in cache:
+        cache[policy.name] = policy.codes(fields, cache)
+    return cache[policy.name]
+
+
+def compile_policies(specs):
+    # specs: {이름: 정의} (segment_policies.json 과 같은 모양). combine 은 앞서 정의된 정책을 참조한다
+    policies = {}
+    for name, spec in specs.items():
+        spec = dict(spec)
+        kind = spec.pop('type')
+        if kind == 'cuts':
+            policies[name] = CutPolicy(name, **spec)
+        elif kind == 'ranges':
+            policies[name] = RangePolicy(name, **spec)
+        elif kind == 'combine':
+            parts = [policies[part] for part in spec.pop('policies')]
+            policies[name] = CombinedPolicy(name, parts, **spec)
+        else:
+            raise ValueError(f"{name}: unknown policy type {kind!r}")
+    return policies
+
+
+def load_policies(path=POLICIES_PATH):
+    with open(path, encoding='utf-8') as f:
+        return compile_policies(json.load(f))
+
+
+def policy_from_cutoffs(cutoffs, course, name=None):
+    # 기준점.csv (COURSE_NAME, ORDER, LABEL, MIN, MAX) 의 한 과정 -> 점수 구간 정책 (MIN/MAX 모두 포함)
+    rows = cutoffs[cutoffs['COURSE_NAME'] == course].sort_values('ORDER')
+    if rows.empty:
+        raise KeyError(f"No cutoffs for course {course!r}")
+    segments = [{'label': row.LABEL, 'score': [row.MIN, row.MAX]} for row in rows.itertuples()]
+    return RangePolicy(name or f'기준점_{course}', segments, description=f'기준점.csv {course}')
+
+
+def evaluate_policies(policies, names=None, **fields):
+    # 같은 점수/백분위에 여러 정책을 한 번에 적용한다 -> 정책별 라벨 컬럼의 DataFrame
+    # 필드 값의 조합은 몇 개뿐이므로 (점수 0~20 등) 고유 조합에서만 계산하고 펼친다
+    names = list(policies) if names is None else list(names)
+    index = next((v.index for v in fields.values() if isinstance(v, pd.Series)), None)
+    keys = list(fields)
+    stacked = np.column_stack([np.asarray(fields[k], dtype=np.float64) for k in keys])
+    unique, inverse = np.unique(stacked, axis=0, return_inverse=True)
+    inverse = inverse.reshape(-1)
+    unique_fields = {k: unique[:, i] for i, k in enumerate(keys)}
+    cache = {}
+    result = {}
+    for name in names:
+        policy = policies[name]
+        labels = np.array(policy.labels + [policy.default], dtype=object)
+        result[name] = labels[_cached_codes(policy, unique_fields, cache)][inverse]
+    return pd.DataFrame(result, index=index)
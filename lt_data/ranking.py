@@ -0,0 +1,54 @@
+import numpy as np
+import pandas as pd
+
+# 계수 정렬 방식의 순위 / 백분위
+# 점수는 작은 정수 범위이므로 점수별 인원 (np.bincount) 의 누적합 하나로 모든 동점 처리 방식의 순위를 구한다 (O(n)).
+# 결과는 pandas Series.rank 와 같은 값 (float64, 결측은 NaN 유지) 이다.
+# 정수가 아닌 값이 섞여 있거나 값 범위가 너무 넓으면 Series.rank 로 계산한다.
+METHODS = ('average', 'min', 'max', 'dense', 'first')
+
+
+def rank(values, method='average', ascending=True, pct=False):
+    if method not in METHODS:
+        raise ValueError(f"method must be one of {METHODS}, got {method!r}")
+    series = values if isinstance(values, pd.Series) else pd.Series(values)
+    x = series.to_numpy(dtype=np.float64, na_value=np.nan)
+    valid = ~np.isnan(x)
+    v = x[valid]
+    # 값 범위가 인원보다 훨씬 넓으면 (학번 등) 히스토그램이 커지므로 pandas 로 계산한다
+    if len(v) and (not np.array_equal(v, np.round(v)) or v.max() - v.min() > 4 * len(v) + 1024):
+        ranks = series.rank(method=method, ascending=ascending, pct=pct)
+        return ranks if isinstance(values, pd.Series) else ranks.to_numpy()
+
+    out = np.full(len(x), np.nan)
+    if len(v):
+        low = v.min()
+        codes = (v - low).astype(np.int64)
+        if not ascending:
+            codes = codes.max() - codes
+        counts = np.bincount(codes)
+        below = np.cumsum(counts) - counts            # 더 앞 순위인 인원
+        if method == 'min':
+            r = below[codes] + 1.0
+        elif method == 'max':
+            r = (below + counts)[codes].astype(np.float64)
+        elif method == 'average':
+            r = below[codes] + (counts[codes] + 1) / 2
+        elif method == 'dense':
+            r = np.cumsum(counts > 0)[codes].astype(np.float64)
+        else:
+            # 동점은 원래 순서대로. 작은 정수 키의 안정 정렬 (기수 정렬)
+            order = np.argsort(codes, kind='stable')
+            r = np.empty(len(codes), dtype=np.float64)
+            r[order] = np.arange(1, len(codes) + 1)
+        if pct:
+            r = r / (np.count_nonzero(counts) if method == 'dense' else len(v))
+        out[valid] = r
+    if isinstance(values, pd.Series):
+        return pd.Series(out, index=values.index, name=values.name)
+    return out
+
+
+def percentile(values, ascending=True):
+    # rank(pct=True) * 100 (GT1 스크립트의 백분위)
+    return rank(values, pct=True, ascending=ascending) * 100
@@ -0,0 +1,133 @@
+import numpy as np
+import pandas as pd
+
+from lt_data.borderline import ALL, group_histograms, rollup
+
+# 레벨 역전 (아래 레벨 상위권 vs 위 레벨 하위권)
+# 점수는 정수이므로 레벨별 점수 히스토그램이 정확한 분위수 스케치이다. 캠퍼스 히스토그램을 더하면 전국 히스토그램이 된다.
+# 분위수 / 꼬리 평균 / 두 레벨 점수 비교는 모두 히스토그램 누적합에서 계산하고, 모든 레벨 쌍을 한 번에 만든다.
+# - 분위수는 Series.quantile (linear) 과 같은 값
+# - Top 꼬리 = 점수 >= 상위 분위수, Bottom 꼬리 = 점수 <= 하위 분위수 (check_hypotheses 와 같다)
+# - P_Gt = 무작위 A 학생 점수 > 무작위 B 학생 점수 확률 (동점은 절반)
+
+
+def hist_quantile(counts, q):
+    # (행 x 점수) 인원 -> 행별 q 분위수 (linear 보간)
+    counts = np.asarray(counts, dtype=np.int64)
+    cum = counts.cumsum(axis=1)
+    n = cum[:, -1]
+    position = (n - 1) * q
+    lo = np.floor(position).astype(np.int64)
+    hi = np.minimum(lo + 1, np.maximum(n - 1, 0))
+    # k 번째 (0부터) 정렬 값 = 누적 인원이 k 를 넘는 첫 점수
+    value_lo = (cum <= lo[:, None]).sum(axis=1)
+    value_hi = (cum <= hi[:, None]).sum(axis=1)
+    # np.quantile 과 같은 보간식 (t >= 0.5 이면 위 값에서 뺀다) 이라 출력 값이 비트 단위로 같다
+    t = position - lo
+    diff = value_hi - value_lo
+    result = np.where(t >= 0.5, value_hi - diff * (1 - t), value_lo + diff * t)
+    return np.where(n > 0, result, np.nan)
+
+
+def tail_mean(counts, cut, upper=True):
+    # 행별 점수 >= cut (upper) 또는 <= cut 인 학생의 평균
+    counts = np.asarray(counts, dtype=np.float64)
+    scores = np.arange(counts.shape[1])
+    mask = scores[None, :] >= cut[:, None] if upper else scores[None, :] <= cut[:, None]
+    tail = counts * mask
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return tail @ scores / tail.sum(axis=1)
+
+
+def prob_greater(counts):
+    # (레벨 x 레벨) P(A > B) + P(A = B) / 2
+    counts = np.asarray(counts, dtype=np.float64)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        share = counts / counts.sum(axis=1, keepdims=True)
+    below = share.cumsum(axis=1) - share
+    return share @ (below + share / 2).T
+
+
+def level_pairs(hist, top=0.9, bottom=0.2):
+    # hist: 한 그룹의 (레벨 x 점수). 모든 순서쌍 (A, B): A 상위 top 꼬리 vs B 하위 bottom 꼬리
+    counts = hist.to_numpy(dtype=np.int64)
+    levels = hist.index.get_level_values(-1).to_numpy(dtype=object)
+    top_cut = hist_quantile(counts, top)
+    bottom_cut = hist_quantile(counts, bottom)
+    top_mean = tail_mean(counts, top_cut, upper=True)
+    bottom_mean = tail_mean(counts, bottom_cut, upper=False)
+    p_gt = prob_greater(counts)
+    # A 학생 중 B 하위 분위수 이상 비율 (A x B)
+    scores = np.arange(counts.shape[1])
+    at_least = (scores[None, None, :] >= bottom_cut[None, :, None]) * counts[:, None, :]
+    with np.errstate(invalid='ignore', divide='ignore'):
+        overlap = at_least.sum(axis=2) / counts.sum(axis=1)[:, None] * 100
+
+    a, b = np.meshgrid(np.arange(len(levels)), np.arange(len(levels)), indexing='ij')
+    pairs = a != b
+    a, b = a[pairs], b[pairs]
+    return pd.DataFrame({
+        'Level_A': levels[a],
+        'Level_B': levels[b],
+        'N_A': counts.sum(axis=1)[a],
+        'N_B': counts.sum(axis=1)[b],
+        'A_Top_Cut': top_cut[a],
+        'A_Top_Mean': top_mean[a],
+        'B_Bottom_Cut': bottom_cut[b],
+        'B_Bottom_Mean': bottom_mean[b],
+        'Reversal': top_mean[a] > bottom_mean[b],
+        'A_Over_B_Bottom_%': overlap[a, b],
+        'P_Gt': p_gt[a, b],
+    })
+
+
+def reversal_matrix(scores, top=0.9, bottom=0.2, group_columns=('Period', '캠퍼스'), level_column='Level',
+                    score_column='Score', national=True):
+    # 학생별 점수 -> 그룹 (시기, 캠퍼스) 마다 모든 레벨 쌍. national=True 이면 캠퍼스 '전체' (전국) 도 함께
+    group_columns = [col for col in group_columns if col in scores.columns]
+    hist = group_histograms(scores, group_columns + [level_column], score_column=score_column)
+    parts = [hist]
+    if national and '캠퍼스' in group_columns:
+        keep = [col for col in group_columns if col != '캠퍼스'] + [level_column]
+        parts.insert(0, rollup(hist, keep))
+    frames = []
+    for part in parts:
+        groups = part.groupby(level=group_columns, sort=False) if group_columns else [((), part)]
+        for key, sub in groups:
+            pairs = level_pairs(sub.droplevel(group_columns) if group_columns else sub, top=top, bottom=bottom)
+            key = key if isinstance(key, tuple) else (key,)
+            for col, value in zip(group_columns, key):
+                pairs.insert(group_columns.index(col), col, value)
+            frames.append(pairs)
+    return pd.concat(frames, ignore_index=True)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    from lt_data.scorer import StudentScorer
+
+    parser = argparse.ArgumentParser(description='모든 레벨 쌍 역전 (전국 / 캠퍼스별)')
+    parser.add_argument('periods', nargs='+', help='시기=학생문항별결과 CSV (예: 2024-11=2024_11월_data/2024_11월_학생문항별결과.csv)')
+    parser.add_argument('--top', type=float, default=0.9, help='A 상위 꼬리 분위수')
+    parser.add_argument('--bottom', type=float, default=0.2, help='B 하위 꼬리 분위수')
+    parser.add_argument('--out', default=None, help='결과 CSV 경로')
+    args = parser.parse_args()
+
+    frames = []
+    for period, path in (p.split('=', 1) for p in args.periods):
+        scorer = StudentScorer(attribute_columns=['교육과정', '캠퍼스'], group_columns=[]).consume(path)
+        frames.append(scorer.totals().rename(columns={'교육과정': 'Level'}).assign(Period=period))
+    result = reversal_matrix(pd.concat(frames, ignore_index=True), top=args.top, bottom=args.bottom)
+
+    national = result[result['캠퍼스'] == ALL]
+    for period, rows in national.groupby('Period', sort=False):
+        print(f"\n=== {period} 전국: A 상위 {1 - args.top:.0%} 평균 > B 하위 {args.bottom:.0%} 평균 (행 A, 열 B) ===")
+        print(rows.pivot(index='Level_A', columns='Level_B', values='Reversal').fillna('-').to_string())
+        print("\nP(A > B):")
+        print(rows.pivot(index='Level_A', columns='Level_B', values='P_Gt').round(3).to_string())
+    campus = result[result['캠퍼스'] != ALL]
+    print(f"\n캠퍼스별 역전 쌍: {int(campus['Reversal'].sum()):,} / {len(campus):,}")
+    if args.out:
+        result.to_csv(args.out, index=False, encoding='utf-8-sig')
+        print(f"\nSaved {args.out}")
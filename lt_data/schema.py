@@ -0,0 +1,62 @@
+import warnings
+
+import pandas as pd
+
+# 표준 컬럼명 -> 파일마다 다르게 쓰인 이름들
+# 2024년 파일: 정답 여부 / 학생명 / 레벨(level)
+# 2025년 파일: 정답여부 / 이름 / 교육과정(Level)
+ALIASES = {
+    '교육과정': ['레벨', 'Level', 'level'],
+    '이름': ['학생명'],
+    '정답여부': ['정답 여부'],
+    '문항난이도': ['난이도'],
+}
+
+# 알려진 표준 컬럼 (학생문항별결과 / 문항난이도별결과 / 학생별구간분류 / 기준점 / 2025 레벨별 시트)
+CANONICAL_COLUMNS = [
+    '결과코드', '교육과정', '캠퍼스', '학급', '학번', '이름',
+    '시험과목', '문항 순번', '정답여부', '스킬', '문항 유형', '문항난이도',
+    '퀴즈 수', '정답 수', '정답율', '구간',
+    '전체 퀴즈 수', '전체 정답 수',
+    '전체 문항수', '전체정답수', 'AT_RISK 여부', 'PASS_DROP_SCALE',
+    'MONTHLY_TEST_SCORE1', 'MONTHLY_TEST_SCORE2', 'ENGLISH 문항 수', 'ENGLISH 정답 수',
+    'COURSE_CODE', 'COURSE_NAME', 'ORDER', 'LABEL', 'MIN', 'MAX',
+]
+
+_TO_CANONICAL = {alias: name for name, aliases in ALIASES.items() for alias in aliases}
+
+
+class UnknownColumnsWarning(UserWarning):
+    pass
+
+
+def canonical_names(columns):
+    # 파일 컬럼 목록 -> 표준 컬럼 목록
+    # 표준 이름이 이미 있으면 별칭은 바꾸지 않는다 (중복 컬럼 방지)
+    present = set(columns)
+    names = []
+    for col in columns:
+        name = _TO_CANONICAL.get(col, col)
+        names.append(col if name != col and name in present else name)
+    return names
+
+
+def physical_names(file_columns, columns):
+    # 표준 컬럼 목록 -> 이 파일에서 실제로 쓰인 컬럼 이름 (usecols 용)
+    mapping = dict(zip(canonical_names(list(file_columns)), file_columns))
+    return [mapping.get(col, col) for col in columns]
+
+
+def unknown_columns(columns):
+    known = set(CANONICAL_COLUMNS) | set(_TO_CANONICAL)
+    return [col for col in columns if col not in known]
+
+
+def adapt_schema(df, source=None):
+    # 컬럼 라벨만 바꾸므로 데이터는 복사하지 않는다. 모르는 컬럼은 경고로 알려 준다
+    df.columns = pd.Index(canonical_names(list(df.columns)))
+    unknown = unknown_columns(df.columns)
+    if unknown:
+        where = f" in {source}" if source else ""
+        warnings.warn(f"Unknown columns{where}: {unknown}", UnknownColumnsWarning, stacklevel=2)
+    return unknown
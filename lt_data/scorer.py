@@ -0,0 +1,152 @@
+import numpy as np
+import pandas as pd
+
+from lt_data.loader import iter_sheet, sheet_columns
+
+# 청크 단위 학생별 점수 집계
+# 응답 파일을 chunk_rows 행씩 읽어 학생 정수 id 로 바꾸고, id 별 배열에 응답 수 / 정답 수 / 그룹별 정답 수를 더한다.
+# 메모리는 행 수가 아니라 학생 수 (x 그룹 수) 에 비례한다.
+# 응답 행이 있는 학생은 정답이 하나도 없어도 0점으로 남는다 (groupby 후 merge 로 0점 학생을 되살릴 필요가 없다).
+ATTRIBUTE_COLUMNS = ['이름', '교육과정', '캠퍼스', '학급']
+GROUP_COLUMNS = ['시험과목', '문항난이도']
+
+
+class StudentScorer:
+
+    def __init__(self, key_columns=None, attribute_columns=ATTRIBUTE_COLUMNS, group_columns=GROUP_COLUMNS):
+        # key_columns 가 없으면 첫 청크에서 결과코드, 없으면 학번을 키로 쓴다
+        self.key_columns = None if key_columns is None else list(key_columns)
+        self.attribute_columns = list(attribute_columns)
+        self.group_columns = list(group_columns)
+        self._keys = None                  # 알려진 학생 키 (MultiIndex, id 순서)
+        self._key_frames = []              # 새로 나온 학생의 키 + 속성 (처음 나온 행)
+        self.answered = np.zeros(0, dtype=np.int32)
+        self.correct = np.zeros(0, dtype=np.int32)
+        self.group_labels = {}             # 그룹 컬럼 -> [라벨, ...]
+        self.group_correct = {}            # 그룹 컬럼 -> (학생 수 x 라벨 수) 정답 수
+        self.group_answered = {}
+
+    @property
+    def n_students(self):
+        return len(self.answered)
+
+    def columns_for(self, file_columns):
+        # 이 파일에서 읽을 표준 컬럼
+        if self.key_columns is None:
+            self.key_columns = ['결과코드'] if '결과코드' in file_columns else ['학번']
+        wanted = self.key_columns + self.attribute_columns + ['정답여부'] + self.group_columns
+        return [col for col in dict.fromkeys(wanted) if col in file_columns]
+
+    def _student_ids(self, chunk):
+        keys = pd.MultiIndex.from_frame(chunk[self.key_columns])
+        if self._keys is None:
+            ids = np.full(len(keys), -1, dtype=np.int64)
+        else:
+            ids = self._keys.get_indexer(keys)
+        new = ids < 0
+        if new.any():
+            first = ~keys[new].duplicated()
+            new_rows = chunk[new][first]
+            attrs = [c for c in self.attribute_columns if c in chunk.columns and c not in self.key_columns]
+            self._key_frames.append(new_rows[self.key_columns + attrs].reset_index(drop=True))
+            new_keys = pd.MultiIndex.from_frame(new_rows[self.key_columns])
+            self._keys = new_keys if self._keys is None else self._keys.append(new_keys)
+            ids[new] = self._keys.get_indexer(keys[new])
+            self._grow(len(self._keys))
+        return ids
+
+    def _grow(self, n):
+        extra = n - len(self.answered)
+        self.answered = np.concatenate([self.answered, np.zeros(extra, dtype=np.int32)])
+        self.correct = np.concatenate([self.correct, np.zeros(extra, dtype=np.int32)])
+        for col in self.group_correct:
+            pad = np.zeros((extra, self.group_correct[col].shape[1]), dtype=np.int32)
+            self.group_correct[col] = np.vstack([self.group_correct[col], pad])
+            self.group_answered[col] = np.vstack([self.group_answered[col], pad])
+
+    def _group_codes(self, col, values):
+        # 청크마다 category 가 달라도 같은 라벨은 같은 열로
+        labels = self.group_labels.setdefault(col, [])
+        if not isinstance(values.dtype, pd.CategoricalDtype):
+            values = values.astype('category')
+        chunk_labels = [str(c) for c in values.cat.categories]
+        unseen = [label for label in chunk_labels if label not in labels]
+        if unseen or col not in self.group_correct:
+            labels += unseen
+            shape = (self.n_students, len(labels))
+            for store in (self.group_correct, self.group_answered):
+                old = store.get(col, np.zeros((self.n_students, 0), dtype=np.int32))
+                store[col] = np.hstack([old, np.zeros((shape[0], shape[1] - old.shape[1]), dtype=np.int32)])
+        lookup = np.array([labels.index(label) for label in chunk_labels] + [-1], dtype=np.int64)
+        return lookup[values.cat.codes.to_numpy()]
+
+    def add(self, chunk):
+        # 표준 스키마 청크 하나 (정답여부 bool) 를 더한다
+        ids = self._student_ids(chunk)
+        correct = chunk['정답여부'].to_numpy(dtype=bool, na_value=False)
+        n = self.n_students
+        self.answered += np.bincount(ids, minlength=n).astype(np.int32)
+        self.correct += np.bincount(ids, weights=correct, minlength=n).astype(np.int32)
+        for col in self.group_columns:
+            if col not in chunk.columns:
+                continue
+            codes = self._group_codes(col, chunk[col])
+            valid = codes >= 0
+            width = len(self.group_labels[col])
+            flat = ids[valid] * width + codes[valid]
+            self.group_answered[col] += np.bincount(flat, minlength=n * width).reshape(n, width).astype(np.int32)
+            self.group_correct[col] += np.bincount(flat, weights=correct[valid], minlength=n * width).reshape(n, width).astype(np.int32)
+
+    def consume(self, csv_path, chunk_rows=50000):
+        columns = self.columns_for(sheet_columns(csv_path))
+        for chunk in iter_sheet(csv_path, columns=columns, chunk_rows=chunk_rows):
+            self.add(chunk)
+        return self
+
+    # ------------------------------------------------------------------
+    # 결과
+
+    def students(self):
+        # 학생 키 + 속성 (처음 나온 순서 = id 순서)
+        if not self._key_frames:
+            return pd.DataFrame(columns=(self.key_columns or []))
+        return pd.concat(self._key_frames, ignore_index=True)
+
+    def totals(self):
+        # 학생별 응답 수 / 점수 (정답 수)
+        df = self.students()
+        df['응답 수'] = self.answered.astype(np.int64)
+        df['Score'] = self.correct.astype(np.int64)
+        return df
+
+    def subtotals(self, column, answered=False):
+        # 학생 x 그룹 라벨 정답 수 (answered=True 이면 응답 수)
+        store = self.group_answered if answered else self.group_correct
+        keys = self.students()[self.key_columns]
+        table = pd.DataFrame(store[column].astype(np.int64), columns=pd.Index(self.group_labels[column], name=column))
+        return pd.concat([keys, table], axis=1)
+
+
+def score_file(csv_path, key_columns=None, chunk_rows=50000, **kwargs):
+    return StudentScorer(key_columns=key_columns, **kwargs).consume(csv_path, chunk_rows=chunk_rows)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description='학생문항별결과 -> 학생별 점수 (청크 단위)')
+    parser.add_argument('csv_paths', nargs='+')
+    parser.add_argument('--out', required=True, help='결과 CSV 경로')
+    parser.add_argument('--chunk-rows', type=int, default=50000)
+    args = parser.parse_args()
+
+    scorer = StudentScorer()
+    for path in args.csv_paths:
+        scorer.consume(path, chunk_rows=args.chunk_rows)
+    result = scorer.totals()
+    for col in scorer.group_columns:
+        if col in scorer.group_labels:
+            sub = scorer.subtotals(col).drop(columns=scorer.key_columns)
+            result = pd.concat([result, sub.add_prefix(f'{col}_')], axis=1)
+    result.to_csv(args.out, index=False, encoding='utf-8-sig')
+    print(f"{scorer.n_students:,} students -> {args.out}")
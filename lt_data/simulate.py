@@ -0,0 +1,128 @@
+import itertools
+
+import numpy as np
+import pandas as pd
+
+# 컷 what-if 시뮬레이터
+# 점수는 작은 정수 (GT1 0~20, Gr2 0~60) 이므로 레벨별 점수 히스토그램만 있으면 된다.
+# 후보 컷 벡터마다 점수 -> 구간 번호 표 (후보 수 x 점수 수) 를 만들고, 히스토그램과 곱해서
+# 레벨별 구간 인원 / 현재 정책 대비 이동 인원 / 교차표를 구한다. 원자료 행은 다시 읽지 않는다.
+#
+# 컷 벡터: 오름차순 경계. 구간 번호 = 경계를 넘은 개수 (0 = 가장 낮은 구간)
+# - lower: 점수 >= 경계 이면 넘은 것 (ABSOLUTE_CUTS 의 54/48/42... 와 같은 방식)
+# - upper: 점수 > 경계 이면 넘은 것 (classify_a 의 6/11/15/17 '이하' 와 같은 방식)
+
+
+def student_scores(df, level_column='교육과정', student_column=None):
+    # 학생문항별결과 -> 학생별 (레벨, 점수)
+    if student_column is None:
+        student_column = '결과코드' if '결과코드' in df.columns else '학번'
+    return (df.groupby([level_column, student_column], observed=True)['정답여부'].sum()
+            .rename('Score').reset_index().rename(columns={level_column: 'Level'}))
+
+
+def score_histograms(scores, level_column='Level', score_column='Score', max_score=None):
+    # 학생별 점수 -> (레벨 x 점수 0..max_score) 인원 표
+    if max_score is None:
+        max_score = int(scores[score_column].max())
+    hist = {}
+    for level, values in scores.groupby(level_column, observed=True, sort=False)[score_column]:
+        hist[level] = np.bincount(values.to_numpy(dtype=np.int64), minlength=max_score + 1)[:max_score + 1]
+    return pd.DataFrame.from_dict(hist, orient='index', columns=pd.RangeIndex(max_score + 1, name='Score'))
+
+
+def candidate_grid(center, spread=2, step=1):
+    # 현재 컷 주변 (각 경계 ± spread) 의 모든 오름차순 컷 벡터 (후보 수 x 경계 수)
+    offsets = np.arange(-spread, spread + 1, step)
+    grid = np.array(list(itertools.product(*[c + offsets for c in center])), dtype=np.float64)
+    return grid[np.all(np.diff(grid, axis=1) > 0, axis=1)] if grid.shape[1] > 1 else grid
+
+
+class CutSimulator:
+
+    def __init__(self, hist, current, side='lower', labels=None):
+        # hist: score_histograms 결과. current: 현재 컷 벡터. labels: 구간 번호 0..len(current) 의 이름
+        if side not in ('lower', 'upper'):
+            raise ValueError(f"side must be lower or upper, got {side!r}")
+        self.hist = hist
+        self.levels = list(hist.index)
+        self.score_values = hist.columns.to_numpy(dtype=np.float64)
+        self.counts_by_score = hist.to_numpy(dtype=np.int64)
+        self.side = side
+        self.current = np.asarray(current, dtype=np.float64)
+        self.n_segments = len(self.current) + 1
+        self.labels = list(range(self.n_segments)) if labels is None else list(labels)
+        if len(self.labels) != self.n_segments:
+            raise ValueError(f"{len(self.current)} cuts need {self.n_segments} labels, got {len(self.labels)}")
+        self.current_codes = self.codes(self.current[None, :])[0]
+
+    def codes(self, candidates):
+        # (후보 수 x 경계 수) -> (후보 수 x 점수 수) 구간 번호
+        candidates = np.asarray(candidates, dtype=np.float64)
+        scores = self.score_values[None, None, :]
+        cuts = candidates[:, :, None]
+        passed = scores >= cuts if self.side == 'lower' else scores > cuts
+        return passed.sum(axis=1)
+
+    def run(self, candidates, batch=4096):
+        # 반환: counts (후보 x 레벨 x 구간), moved (후보 x 레벨)
+        candidates = np.asarray(candidates, dtype=np.float64)
+        counts = np.empty((len(candidates), len(self.levels), self.n_segments), dtype=np.int64)
+        moved = np.empty((len(candidates), len(self.levels)), dtype=np.int64)
+        segments = np.arange(self.n_segments)
+        for start in range(0, len(candidates), batch):
+            codes = self.codes(candidates[start:start + batch])
+            onehot = (codes[:, :, None] == segments).astype(np.int64)
+            counts[start:start + batch] = np.einsum('ls,ksg->klg', self.counts_by_score, onehot)
+            changed = (codes != self.current_codes).astype(np.int64)
+            moved[start:start + batch] = changed @ self.counts_by_score.T
+        return counts, moved
+
+    def summary(self, candidates, batch=4096):
+        # 후보 x 레벨 한 행: 컷, 구간별 인원, 이동 인원
+        candidates = np.asarray(candidates, dtype=np.float64)
+        counts, moved = self.run(candidates, batch=batch)
+        n_cand, n_level = moved.shape
+        df = pd.DataFrame({
+            'Candidate': np.repeat(np.arange(n_cand), n_level),
+            'Cuts': np.repeat(['/'.join(f'{c:g}' for c in row) for row in candidates], n_level),
+            'Level': np.tile(self.levels, n_cand),
+        })
+        df[self.labels] = counts.reshape(n_cand * n_level, self.n_segments)
+        df['Moved'] = moved.reshape(-1)
+        df['Moved_%'] = df['Moved'] / self.counts_by_score.sum(axis=1)[np.tile(np.arange(n_level), n_cand)] * 100
+        return df
+
+    def crosstab(self, cuts, level=None):
+        # 현재 정책(행) x 후보 컷(열) 인원 표. level 이 없으면 전체 레벨 합
+        codes = self.codes(np.asarray(cuts, dtype=np.float64)[None, :])[0]
+        counts = self.counts_by_score if level is None else self.counts_by_score[[self.levels.index(level)]]
+        table = np.zeros((self.n_segments, self.n_segments), dtype=np.int64)
+        np.add.at(table, (self.current_codes, codes), counts.sum(axis=0))
+        return pd.DataFrame(table, index=pd.Index(self.labels, name='Current'), columns=pd.Index(self.labels, name='Candidate'))
+
+
+if __name__ == "__main__":
+    import argparse
+    import time
+
+    from lt_data.loader import read_sheet
+
+    parser = argparse.ArgumentParser(description='컷 후보 what-if (학생문항별결과 CSV)')
+    parser.add_argument('csv_path')
+    parser.add_argument('--cuts', required=True, help='현재 컷 (예: 6,11,15,17)')
+    parser.add_argument('--side', default='upper', choices=['lower', 'upper'],
+                        help='upper: 점수 <= 컷 이 아래 구간 (classify_a), lower: 점수 >= 컷 이 위 구간 (ABSOLUTE_CUTS)')
+    parser.add_argument('--spread', type=int, default=2)
+    parser.add_argument('--top', type=int, default=10)
+    args = parser.parse_args()
+
+    current = [float(c) for c in args.cuts.split(',')]
+    hist = score_histograms(student_scores(read_sheet(args.csv_path)))
+    simulator = CutSimulator(hist, current, side=args.side)
+    candidates = candidate_grid(current, spread=args.spread)
+    start = time.perf_counter()
+    summary = simulator.summary(candidates)
+    print(f"{len(candidates):,} candidates x {len(hist)} levels in {time.perf_counter() - start:.2f}s")
+    totals = summary.groupby(['Candidate', 'Cuts'])['Moved'].sum().sort_values()
+    print(totals.head(args.top).to_string())
@@ -0,0 +1,107 @@
+import numpy as np
+import pandas as pd
+
+# 목표 비율 -> 정수 점수 컷
+# 목표는 아래에서부터의 누적 비율(%) 로 준다. 예: classify_b_new 의 30/55/75/85 (백분위 이하)
+# RELATIVE_CUTS 처럼 상위 누적 비율(4/11/23...)은 from_top() 으로 바꿔서 넣는다.
+# 컷 t 는 lower 방식 (점수 >= t 이면 위 구간) 이며, 컷 아래 비율은 누적 히스토그램에서 바로 읽는다.
+#
+# 동점 처리 (같은 점수의 학생은 같은 구간에 들어가므로 목표를 정확히 맞출 수 없을 때):
+# - nearest: 목표와 가장 가까운 컷 (같으면 under)
+# - under:   컷 아래 비율이 목표를 넘지 않는 가장 큰 컷
+# - over:    컷 아래 비율이 목표 이상인 가장 작은 컷
+TIE_RULES = ('nearest', 'under', 'over')
+
+
+def from_top(top_shares):
+    # 상위 누적 비율 (예: 4, 11, 23, ..., 96) -> 아래에서부터의 누적 비율 (오름차순)
+    return [100 - share for share in reversed(top_shares) if 0 < share < 100]
+
+
+def _below_counts(hist):
+    # (행 x 점수) 인원 -> (행 x 컷 후보) 컷 아래 인원. 컷 후보는 점수 값들과 최고점 + 1
+    counts = hist.to_numpy(dtype=np.int64)
+    below = np.zeros((counts.shape[0], counts.shape[1] + 1), dtype=np.int64)
+    np.cumsum(counts, axis=1, out=below[:, 1:])
+    scores = hist.columns.to_numpy(dtype=np.int64)
+    thresholds = np.append(scores, scores[-1] + 1)
+    return below, thresholds
+
+
+def _target_matrix(index, targets):
+    # targets: 모든 행에 같은 목록, {레벨: 목록}, 또는 행 인덱스와 같은 DataFrame
+    if isinstance(targets, pd.DataFrame):
+        return targets.reindex(index).to_numpy(dtype=np.float64)
+    if isinstance(targets, dict):
+        levels = index.get_level_values(-1)
+        return np.array([targets[level] for level in levels], dtype=np.float64)
+    return np.tile(np.asarray(targets, dtype=np.float64), (len(index), 1))
+
+
+def solve_cuts(hist, targets, tie='nearest', labels=None):
+    # hist: (행 x 점수) 인원. 행은 레벨 또는 (시기, 레벨) 등 무엇이든 한 번에 푼다
+    # 반환: 행마다 Cut1.., 목표/달성 누적 비율(%), 구간별 달성 비율(%)
+    if tie not in TIE_RULES:
+        raise ValueError(f"tie must be one of {TIE_RULES}, got {tie!r}")
+    hist = hist.fillna(0)
+    below, thresholds = _below_counts(hist)
+    total = below[:, -1:].astype(np.float64)
+    target = _target_matrix(hist.index, targets)
+    if np.any(np.diff(target, axis=1) < 0):
+        raise ValueError("targets must be ascending cumulative shares")
+    target_count = target / 100 * total                                   # (행 x 컷)
+
+    # 컷 후보별 아래 인원과 목표 인원을 비교 (행 x 컷 x 후보)
+    below_3d = below[:, None, :]
+    goal = target_count[:, :, None]
+    under_idx = (below_3d <= goal + 1e-9).sum(axis=2) - 1
+    over_idx = np.minimum((below_3d < goal - 1e-9).sum(axis=2), below.shape[1] - 1)
+    if tie == 'under':
+        idx = under_idx
+    elif tie == 'over':
+        idx = over_idx
+    else:
+        rows = np.arange(len(below))[:, None]
+        under_gap = np.abs(below[rows, under_idx] - target_count)
+        over_gap = np.abs(below[rows, over_idx] - target_count)
+        idx = np.where(over_gap < under_gap, over_idx, under_idx)
+    idx = np.maximum(idx, 0)
+
+    rows = np.arange(len(below))[:, None]
+    achieved = np.divide(below[rows, idx] * 100, total, out=np.zeros(idx.shape), where=total > 0)
+    n_cuts = target.shape[1]
+    labels = list(range(n_cuts + 1)) if labels is None else list(labels)
+    shares = np.diff(np.column_stack([np.zeros(len(idx)), achieved, np.full(len(idx), 100.0)]), axis=1)
+
+    result = pd.DataFrame(index=hist.index)
+    for j in range(n_cuts):
+        result[f'Cut{j + 1}'] = thresholds[idx[:, j]]
+    for j in range(n_cuts):
+        result[f'Target{j + 1}_%'] = target[:, j]
+        result[f'Achieved{j + 1}_%'] = achieved[:, j]
+    for j, label in enumerate(labels):
+        result[f'Share_{label}_%'] = shares[:, j]
+    result['N'] = total[:, 0].astype(np.int64)
+    return result
+
+
+if __name__ == "__main__":
+    import argparse
+
+    from lt_data.loader import read_sheet
+    from lt_data.simulate import score_histograms, student_scores
+
+    parser = argparse.ArgumentParser(description='목표 비율에 맞는 점수 컷 (레벨별, 시기별)')
+    parser.add_argument('periods', nargs='+', help='시기=학생문항별결과 CSV (예: 2024-11=2024_11월_data/2024_11월_학생문항별결과.csv)')
+    parser.add_argument('--targets', required=True, help='아래에서부터 누적 비율 (예: 30,55,75,85)')
+    parser.add_argument('--from-top', action='store_true', help='targets 가 상위 누적 비율 (예: 4,11,23,40,60,77,89,96)')
+    parser.add_argument('--tie', default='nearest', choices=TIE_RULES)
+    args = parser.parse_args()
+
+    targets = [float(t) for t in args.targets.split(',')]
+    if args.from_top:
+        targets = from_top(targets)
+    hists = {period: score_histograms(student_scores(read_sheet(path)))
+             for period, path in (p.split('=', 1) for p in args.periods)}
+    hist = pd.concat(hists, names=['Period', 'Level'])
+    print(solve_cuts(hist, targets, tie=args.tie).round(1).to_string())
@@ -0,0 +1,218 @@
+import os
+
+import numpy as np
+import pandas as pd
+
+from lt_data.catalog import scan_folder
+from lt_data.loader import read_sheet
+
+# 정규화 저장소 (star schema)
+# - campus:     campus_id, 캠퍼스
+# - student:    student_id, period, 교육과정, campus_id, 학급, 학번, 이름, 결과코드 (+ 학생별구간분류 속성)
+# - item:       item_id, period, 교육과정, 문항 순번, 시험과목, 스킬, 문항 유형, 문항난이도
+# - response:   student_id, item_id, 정답여부            (학생문항별결과 한 행 = 한 행)
+# - difficulty: student_id, 문항난이도, 퀴즈 수, 정답 수  (문항난이도별결과)
+# - partition:  period, 교육과정, campus_id -> student_id / response 행 범위
+#
+# student_id 는 (period, 교육과정, 캠퍼스, 학생 키) 순서로 부여하고 response 는 student_id 순으로 정렬하므로
+# partition 표가 (period, level, campus, student) 인덱스 역할을 한다.
+TABLES = ['campus', 'student', 'item', 'response', 'difficulty', 'partition']
+
+STUDENT_COLUMNS = ['교육과정', '캠퍼스', '학급', '학번', '이름', '결과코드']
+ITEM_COLUMNS = ['시험과목', '스킬', '문항 유형', '문항난이도']
+PROFILE_COLUMNS = [
+    '전체 문항수', '전체정답수', 'AT_RISK 여부', 'PASS_DROP_SCALE',
+    'MONTHLY_TEST_SCORE1', 'MONTHLY_TEST_SCORE2', 'ENGLISH 문항 수', 'ENGLISH 정답 수', '구간',
+]
+
+
+def _with_key(df, period):
+    # 시기 안에서 학생을 구분하는 키: 결과코드가 있으면 결과코드, 없으면 학번
+    df = df.copy()
+    df['period'] = period
+    key = df['결과코드'] if '결과코드' in df.columns else df['학번']
+    df['_key'] = key.astype('int64')
+    return df
+
+
+def _read_kind(source):
+    # 경로 하나, 또는 [(레벨, 경로), ...] 레벨별 시트를 한 프레임으로. 레벨 시트에 교육과정이 없으면 파일 이름의 레벨로 채운다
+    if isinstance(source, str):
+        return read_sheet(source)
+    frames = []
+    for level, path in source:
+        df = read_sheet(path)
+        if level is not None and '교육과정' not in df.columns:
+            df['교육과정'] = level
+        frames.append(_str_columns(df, STUDENT_COLUMNS + ITEM_COLUMNS))
+    return pd.concat(frames, ignore_index=True)
+
+
+def _str_columns(df, columns):
+    # 시기마다 category 가 달라 합칠 때 object 로 바뀌므로 미리 문자열로 맞춘다
+    for col in columns:
+        if col in df.columns and isinstance(df[col].dtype, pd.CategoricalDtype):
+            df[col] = df[col].astype(str)
+    return df
+
+
+def build_store(sources):
+    # sources: [(period, {'items': 학생문항별결과, 'students': 학생별구간분류, 'difficulty': 문항난이도별결과}), ...]
+    # 파일 자리에는 경로 하나 또는 [(레벨, 경로), ...] (2025 LT 처럼 레벨별 시트) 를 줄 수 있다
+    # 세 파일 모두 선택. 학생문항별결과가 없는 시기는 학생/난이도 테이블만 채운다
+    # 반환: {테이블 이름: DataFrame}
+    responses, profiles, difficulties = [], [], []
+    for period, files in sources:
+        if files.get('items'):
+            responses.append(_with_key(_read_kind(files['items']), period))
+        if files.get('students'):
+            profiles.append(_with_key(_read_kind(files['students']), period))
+        if files.get('difficulty'):
+            difficulties.append(_with_key(_read_kind(files['difficulty']), period))
+    frames = [_str_columns(df, STUDENT_COLUMNS + ITEM_COLUMNS) for df in responses + profiles + difficulties]
+    resp = pd.concat(frames[:len(responses)], ignore_index=True) if responses else None
+
+    # 학생 차원: 학생별로 반복되던 속성을 한 행으로 (응답 -> 구간분류 -> 난이도 파일 순으로 우선)
+    student_cols = [c for c in STUDENT_COLUMNS if any(c in df.columns for df in frames)]
+    student = pd.concat([df[['period', '_key'] + [c for c in student_cols if c in df.columns]] for df in frames],
+                        ignore_index=True).drop_duplicates(['period', '_key'])
+
+    # 캠퍼스 차원
+    campus = pd.DataFrame({'캠퍼스': np.sort(student['캠퍼스'].astype(str).unique())})
+    campus['campus_id'] = np.arange(len(campus), dtype=np.int16)
+    student['campus_id'] = campus.set_index('캠퍼스')['campus_id'].reindex(student['캠퍼스'].astype(str)).to_numpy()
+    student = (student.drop(columns=['캠퍼스'])
+               .sort_values(['period', '교육과정', 'campus_id', '_key'])
+               .reset_index(drop=True))
+    student.insert(0, 'student_id', np.arange(len(student), dtype=np.int32))
+    if profiles:
+        profile = pd.concat(profiles, ignore_index=True)
+        profile_cols = [c for c in PROFILE_COLUMNS if c in profile.columns]
+        student = student.merge(profile.drop_duplicates(['period', '_key'])[['period', '_key'] + profile_cols],
+                                on=['period', '_key'], how='left')
+    student_ids = student.set_index(['period', '_key'])['student_id']
+
+    # 문항 차원 + 응답 사실 테이블 (좁게)
+    item = None
+    response = pd.DataFrame({'student_id': np.array([], dtype=np.int32),
+                             'item_id': np.array([], dtype=np.int32),
+                             '정답여부': np.array([], dtype=bool)})
+    if resp is not None:
+        item_cols = [c for c in ITEM_COLUMNS if c in resp.columns]
+        item = (resp.drop_duplicates(['period', '교육과정', '문항 순번'])
+                [['period', '교육과정', '문항 순번'] + item_cols]
+                .sort_values(['period', '교육과정', '문항 순번'])
+                .reset_index(drop=True))
+        item.insert(0, 'item_id', np.arange(len(item), dtype=np.int32))
+        item_ids = item.set_index(['period', '교육과정', '문항 순번'])['item_id']
+        response = pd.DataFrame({
+            'student_id': student_ids.reindex(pd.MultiIndex.from_frame(resp[['period', '_key']])).to_numpy(),
+            'item_id': item_ids.reindex(pd.MultiIndex.from_frame(resp[['period', '교육과정', '문항 순번']])).to_numpy(),
+            '정답여부': resp['정답여부'].to_numpy(dtype=bool, na_value=False),
+        })
+        response = response.sort_values(['student_id', 'item_id'], kind='stable').reset_index(drop=True)
+
+    difficulty = None
+    if difficulties:
+        diff = pd.concat(frames[len(responses) + len(profiles):], ignore_index=True)
+        diff_cols = [c for c in ['문항난이도', '퀴즈 수', '정답 수'] if c in diff.columns]
+        difficulty = diff[diff_cols].copy()
+        difficulty.insert(0, 'student_id', student_ids.reindex(pd.MultiIndex.from_frame(diff[['period', '_key']])).to_numpy())
+        difficulty = difficulty.sort_values('student_id', kind='stable').reset_index(drop=True)
+
+    tables = {
+        'campus': campus[['campus_id', '캠퍼스']],
+        'student': student.drop(columns=['_key']),
+        'item': item,
+        'response': response,
+        'difficulty': difficulty,
+    }
+    tables['partition'] = build_partitions(tables['student'], response)
+    return _compact_tables(tables)
+
+
+def build_partitions(student, response):
+    # (period, 교육과정, campus_id) -> 연속된 student_id 구간과 response 행 구간
+    part = (student.groupby(['period', '교육과정', 'campus_id'], sort=False, observed=True)['student_id']
+            .agg(student_start='min', student_stop='max').reset_index())
+    part['student_stop'] += 1
+    bounds = np.searchsorted(response['student_id'].to_numpy(), part[['student_start', 'student_stop']].to_numpy())
+    part['row_start'] = bounds[:, 0]
+    part['row_stop'] = bounds[:, 1]
+    return part
+
+
+def _compact_tables(tables):
+    for name in ['student', 'item', 'difficulty']:
+        df = tables[name]
+        if df is None:
+            continue
+        for col in df.columns:
+            if df[col].dtype == object or pd.api.types.is_string_dtype(df[col].dtype):
+                if col not in ('이름',):
+                    df[col] = df[col].astype('category')
+    return {name: df for name, df in tables.items() if df is not None}
+
+
+def save_store(tables, store_dir):
+    os.makedirs(store_dir, exist_ok=True)
+    for name, df in tables.items():
+        df.to_parquet(os.path.join(store_dir, f'{name}.parquet'), index=False)
+
+
+def load_store(store_dir, tables=None):
+    tables = tables or TABLES
+    loaded = {}
+    for name in tables:
+        path = os.path.join(store_dir, f'{name}.parquet')
+        if os.path.exists(path):
+            loaded[name] = pd.read_parquet(path)
+    return loaded
+
+
+def select_responses(tables, period=None, level=None, campus=None):
+    # partition 인덱스로 response 행 구간만 잘라서 반환 (전체 스캔 없음)
+    part = tables['partition']
+    mask = np.ones(len(part), dtype=bool)
+    if period is not None:
+        mask &= (part['period'] == period).to_numpy()
+    if level is not None:
+        mask &= (part['교육과정'] == level).to_numpy()
+    if campus is not None:
+        campus_ids = tables['campus'].loc[tables['campus']['캠퍼스'] == campus, 'campus_id']
+        mask &= part['campus_id'].isin(campus_ids).to_numpy()
+    response = tables['response']
+    slices = [response.iloc[start:stop] for start, stop in part.loc[mask, ['row_start', 'row_stop']].to_numpy()]
+    if not slices:
+        return response.iloc[0:0]
+    return pd.concat(slices, ignore_index=True)
+
+
+def period_sources(data_dir, period):
+    # 시기 폴더의 CSV 를 종류별로 (Catalog 와 같은 파일 규칙)
+    # - 2024_11월_data/2024_11월_학생문항별결과.csv: 전체 레벨이 한 파일 -> 경로
+    # - 2025_LT_11월_data/2025_11월_GT2.csv ...:   레벨별 시트 -> [(레벨, 경로), ...]
+    files = {}
+    for entry in scan_folder(data_dir):
+        if entry['kind'] == 'cutoffs':
+            continue
+        files.setdefault(entry['kind'], []).append((entry['level'], entry['path']))
+    for kind, paths in files.items():
+        if len(paths) == 1 and paths[0][0] is None:
+            files[kind] = paths[0][1]
+    return period, files
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description='월별 CSV -> 정규화 저장소 (parquet)')
+    parser.add_argument('store_dir')
+    parser.add_argument('periods', nargs='+', help='기간=폴더 (예: 2024-11=2024_11월_data)')
+    args = parser.parse_args()
+
+    sources = [period_sources(folder, period) for period, folder in (p.split('=', 1) for p in args.periods)]
+    tables = build_store(sources)
+    save_store(tables, args.store_dir)
+    for name, df in tables.items():
+        print(f"{name}: {len(df):,} rows, {df.memory_usage(deep=True).sum() / 1e6:.2f} MB")
@@ -0,0 +1,142 @@
+import json
+import os
+import warnings
+
+import numpy as np
+import pandas as pd
+
+from lt_data.grading import grade_schemes, load_cuts
+from lt_data.loader import star_counts
+
+# 가중 점수
+# 가중치 정의는 score_weights.json 에 두고, 문항 사이드카 (ResponseMatrix.items) 에서 문항별 가중치 열을 만든다.
+# 가중치 열을 모으면 (문항 수 x 가중 방식) 행렬 W 가 되고, 모든 학생의 모든 가중 점수는 정답 행렬 @ W 한 번이다.
+# - by 없음:      문항당 1점
+# - by "stars":   문항난이도의 별 개수 -> weights
+# - by 문항 컬럼:  값 -> weights (없는 값은 default, 기본 1)
+# - ranges:       [[MIN, MAX, 가중치], ...] 숫자 컬럼 (문항 순번) 구간별. MAX null 은 제한 없음
+WEIGHTS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'score_weights.json')
+
+
+class MissingItemColumnWarning(UserWarning):
+    pass
+
+
+def load_weightings(path=WEIGHTS_PATH):
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def item_weights(items, spec):
+    # 문항 사이드카 + 가중치 정의 하나 -> 문항별 가중치 (float64)
+    # 기준 컬럼이 없는 시기 (예: 2024 에는 시험과목이 없다) 는 모든 문항이 default
+    by = spec.get('by')
+    default = spec.get('default', 1.0)
+    if by is None:
+        return np.ones(len(items))
+    if by == 'stars' and '문항난이도' in items.columns:
+        values = star_counts(items['문항난이도']).astype(str)
+    elif by in items.columns:
+        values = items[by].astype(str) if 'ranges' not in spec else pd.to_numeric(items[by])
+    else:
+        column = '문항난이도' if by == 'stars' else by
+        warnings.warn(f"Item column {column!r} not found, using weight {default}", MissingItemColumnWarning, stacklevel=2)
+        return np.full(len(items), default, dtype=np.float64)
+
+    if 'ranges' in spec:
+        weights = np.full(len(items), default, dtype=np.float64)
+        values = values.to_numpy(dtype=np.float64)
+        # 앞 구간부터 처음 맞는 구간
+        assigned = np.zeros(len(items), dtype=bool)
+        for lo, hi, weight in spec['ranges']:
+            mask = ~assigned & (values >= lo) & (True if hi is None else values <= hi)
+            weights[mask] = weight
+            assigned |= mask
+        return weights
+    mapping = {str(k): float(v) for k, v in spec.get('weights', {}).items()}
+    return values.map(mapping).fillna(default).to_numpy(dtype=np.float64)
+
+
+def weight_matrix(items, weightings):
+    # (문항 수 x 가중 방식) 행렬
+    return pd.DataFrame({name: item_weights(items, spec) for name, spec in weightings.items()},
+                        index=items['문항 순번'])
+
+
+def weighted_scores(matrix, weights, block_rows=65536):
+    # ResponseMatrix x W -> (학생 x 가중 방식) 점수. 행 블록 단위로 풀어서 곱한다
+    w = weights.to_numpy(dtype=np.float64)
+    scores = np.empty((matrix.n_students, w.shape[1]))
+    for start in range(0, matrix.n_students, block_rows):
+        rows = slice(start, start + block_rows)
+        scores[rows] = matrix.dense(rows) @ w
+    return pd.DataFrame(scores, columns=weights.columns)
+
+
+def regrade(matrices, weightings, max_score=60, tables=None, schemes=('수능_절대_60', '수능_상대')):
+    # matrices: {레벨: ResponseMatrix} (한 시기). 가중 방식마다 점수를 만점 max_score 로 환산하고,
+    # analyze_integrated_grades 처럼 전체 레벨을 합쳐서 등급을 다시 매긴다
+    # 반환: (학생 x 가중 방식) long 표 - Level, 학생 키/속성, Weighting, Score, Scaled, Percentile, 등급 기준...
+    tables = load_cuts() if tables is None else tables
+    students, scaled = [], []
+    for level, matrix in matrices.items():
+        weights = weight_matrix(matrix.items, weightings)
+        scores = weighted_scores(matrix, weights)
+        # 만점 환산은 곱한 뒤 나눈다 (정답수 방식은 60문항이면 원점수와 같은 값)
+        scaled.append((scores, scores * max_score / weights.sum(axis=0)))
+        students.append(matrix.students.assign(Level=level))
+    students = pd.concat(students, ignore_index=True)
+    frames = []
+    for name in weightings:
+        raw = pd.concat([s[name] for s, _ in scaled], ignore_index=True)
+        converted = pd.concat([c[name] for _, c in scaled], ignore_index=True)
+        graded = grade_schemes(converted, max_score, tables=tables, schemes=schemes)
+        frame = students.copy()
+        frame['Weighting'] = name
+        frame['Score'] = raw
+        frame['Scaled'] = converted
+        frames.append(pd.concat([frame, graded], axis=1))
+    return pd.concat(frames, ignore_index=True)
+
+
+def grade_shift(regraded, key, base='정답수', scheme='수능_상대'):
+    # 기준 방식 대비 등급 이동 (가중 방식 x 이동 칸 수 인원)
+    table = regraded.pivot_table(index=key, columns='Weighting', values=scheme, aggfunc='first', observed=True)
+    base_grade = pd.to_numeric(table[base], errors='coerce')
+    shifts = {name: (pd.to_numeric(table[name], errors='coerce') - base_grade).value_counts()
+              for name in table.columns if name != base}
+    return pd.DataFrame(shifts).T.fillna(0).astype(np.int64).sort_index(axis=1)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    from lt_data.loader import read_sheet
+    from lt_data.matrix import build_matrices
+
+    parser = argparse.ArgumentParser(description='가중 점수로 전체 학생 재등급 (시기별, 레벨별)')
+    parser.add_argument('periods', nargs='+', help='시기=학생문항별결과 CSV (예: 2024-11=2024_11월_data/2024_11월_학생문항별결과.csv)')
+    parser.add_argument('--weights', default=WEIGHTS_PATH, help='가중치 정의 JSON')
+    parser.add_argument('--max-score', type=int, default=60, help='환산 만점 (등급컷 기준)')
+    parser.add_argument('--out', default=None, help='학생별 재등급 결과 CSV')
+    args = parser.parse_args()
+
+    weightings = load_weightings(args.weights)
+    tables = load_cuts()
+    results = []
+    for period, path in (p.split('=', 1) for p in args.periods):
+        matrices = build_matrices(read_sheet(path), period)
+        regraded = regrade(matrices, weightings, max_score=args.max_score, tables=tables)
+        regraded.insert(0, 'Period', period)
+        results.append(regraded)
+        key = ['Level', next(iter(matrices.values())).students.columns[0]]
+        sizes = ', '.join(f"{level} {m.n_students:,}x{m.n_items}" for level, m in matrices.items())
+        print(f"\n=== {period} ({sizes}) ===")
+        print("상대 등급 이동 (가중 - 정답수):")
+        print(grade_shift(regraded, key).to_string())
+    result = pd.concat(results, ignore_index=True)
+    print("\n=== 가중 방식별 상대 등급 분포 ===")
+    print(pd.crosstab([result['Period'], result['Weighting']], result['수능_상대']).to_string())
+    if args.out:
+        result.to_csv(args.out, index=False, encoding='utf-8-sig')
+        print(f"\nSaved {args.out}")
@@ -1,6 +1,11 @@
 import pandas as pd
 import os
 
+from lt_data.keys import add_student_ids
+from lt_data.loader import read_levels, read_sheet
+
+REPORT_COLUMNS = ['학번', '이름', '시험과목', '문항 순번', '스킬', '정답여부']
+
 def analyze_student_performance_for_parent_report(data_folder, student_name, student_level):
     all_level_files = {
         "GT2": "2025_11월_GT2.csv",
@@ -10,27 +15,26 @@ def analyze_student_performance_for_parent_report(data_folder, student_name, stu
     }
 
     # 전국 2학년 전체 학생 데이터 로드
-    national_data_frames = []
-    for level, filename in all_level_files.items():
-        filepath = os.path.join(data_folder, filename)
-        df_level = pd.read_csv(filepath)
-        df_level['교육과정'] = level # 레벨 정보 추가
-        national_data_frames.append(df_level)
-
-    national_df = pd.concat(national_data_frames)
-    national_df['correct'] = national_df['정답여부'].apply(lambda x: 1 if x == 'Y' else 0)
+    # 레벨 정보는 '교육과정' 컬럼(category)으로 추가
+    national_df = read_levels(
+        {level: os.path.join(data_folder, filename) for level, filename in all_level_files.items()},
+        columns=REPORT_COLUMNS, level_column='교육과정')
+    national_df['correct'] = national_df['정답여부'].fillna(False).astype('int8')
+    # 정수 학생 키 (학번 -> student_id). 이름은 키 표에만 둔다
+    add_student_ids(national_df, '2025-11')
 
     # 김지우 학생 데이터 필터링 (MGT2 레벨에서 찾음)
     student_data_filepath = os.path.join(data_folder, all_level_files[student_level])
-    student_raw_df = pd.read_csv(student_data_filepath)
+    student_raw_df = read_sheet(student_data_filepath, columns=REPORT_COLUMNS)
     kim_jiwoo_df = student_raw_df[student_raw_df['이름'] == student_name]
 
     if kim_jiwoo_df.empty:
         return {f"{student_name} 학생 데이터를 찾을 수 없습니다."}
 
     kim_jiwoo_df = kim_jiwoo_df.copy()
-    kim_jiwoo_df['correct'] = kim_jiwoo_df['정답여부'].apply(lambda x: 1 if x == 'Y' else 0)
-    kim_jiwoo_df['incorrect'] = kim_jiwoo_df['정답여부'].apply(lambda x: 1 if x == 'N' else 0)
+    # 정답여부는 Y / N / 결측 세 가지. 결측 (미응답) 은 정답도 오답도 아니다
+    kim_jiwoo_df['correct'] = kim_jiwoo_df['정답여부'].fillna(False).astype('int8')
+    kim_jiwoo_df['incorrect'] = (kim_jiwoo_df['정답여부'] == False).fillna(False).astype('int8')
 
     # 과목별 세부 의견 생성
     parent_report_details = {}
@@ -48,7 +52,7 @@ def analyze_student_performance_for_parent_report(data_folder, student_name, stu
 
         # 전국 학생들의 해당 과목 점수 분포 계산
         national_subject_df = national_df[national_df['시험과목'] == subject]
-        national_student_scores = national_subject_df.groupby(['학번', '이름'])['correct'].sum().reset_index()
+        national_student_scores = national_subject_df.groupby('student_id')['correct'].sum().reset_index()
         national_scores = national_student_scores['correct'].tolist()
 
         if jiwoo_total_questions > 0 and national_scores:
@@ -56,7 +60,7 @@ def analyze_student_performance_for_parent_report(data_folder, student_name, stu
             subject_detail["national_rank_percentile"] = f"상위 {(100 - percentile):.1f}%"
 
             # 스킬별 상세 분석
-            skill_performance = jiwoo_subject_df.groupby(['스킬']).agg(
+            skill_performance = jiwoo_subject_df.groupby(['스킬'], observed=True).agg(
                 correct_count=('correct', 'sum'),
                 incorrect_count=('incorrect', 'sum')
             ).reset_index()
@@ -0,0 +1,76 @@
+import numpy as np
+import pandas as pd
+
+from lt_data.cohort import CohortState, campus_scores
+from lt_data.grading import load_cuts
+from lt_data.keys import StudentKeys, add_student_ids
+
+CUTS = load_cuts()['수능_상대']
+
+
+def rerank(students):
+    # analyze_integrated_grades 방식으로 처음부터: 석차(min, 내림차순) / 전체 * 100 -> 상대 등급
+    percentile = students['Score'].rank(method='min', ascending=False) / len(students) * 100
+    return pd.Series(CUTS.grade(percentile.to_numpy()), index=students['student_id'].to_numpy())
+
+
+def random_cohort(rng, n=300):
+    return pd.DataFrame({'student_id': np.arange(n, dtype=np.int32),
+                         'Level': rng.choice(['GT2', 'MGT2', 'S2', 'MAG2'], size=n),
+                         'Score': rng.integers(0, 61, size=n)})
+
+
+def test_incremental_delta_matches_full_rerank():
+    for seed in range(20):
+        rng = np.random.default_rng(seed)
+        before = random_cohort(rng)
+        state = CohortState(before)
+        # 새 학생 40명, 기존 학생 20명 점수 정정, 기존 학생 15명 삭제
+        added = random_cohort(rng, 40).assign(student_id=np.arange(300, 340, dtype=np.int32))
+        updated = before.sample(20, random_state=seed).assign(Score=lambda df: rng.integers(0, 61, size=len(df)))
+        removed = before.drop(updated.index).sample(15, random_state=seed + 1)
+        delta = state.apply(added=pd.concat([added, updated]), removed=removed[['student_id']])
+
+        after = pd.concat([before.drop(updated.index).drop(removed.index), updated, added])
+        old, new = rerank(before), rerank(after)
+        expected = {}
+        for sid in old.index.union(new.index):
+            was, now = old.get(sid, np.nan), new.get(sid, np.nan)
+            if pd.isna(was):
+                expected[sid] = ('added', now)
+            elif pd.isna(now):
+                expected[sid] = ('removed', np.nan)
+            elif was != now:
+                expected[sid] = ('updated' if sid in updated['student_id'].to_numpy() else 'changed', now)
+        got = {row.student_id: (row.Change, row.New_Grade) for row in delta.itertuples()}
+        assert got.keys() == expected.keys()
+        for sid, (change, grade) in expected.items():
+            assert got[sid][0] == change
+            assert (pd.isna(grade) and pd.isna(got[sid][1])) or got[sid][1] == grade
+
+        graded = state.grades().set_index('student_id')['Rel_Grade']
+        pd.testing.assert_series_equal(graded.sort_index(), new.sort_index(), check_names=False, check_dtype=False)
+        assert state.total == len(after)
+
+
+def test_save_load_and_campus_scores(tmp_path):
+    csv_path = str(tmp_path / '2025_11월_GT2.csv')
+    pd.DataFrame({'학번': [20000002, 20000002, 20000001, 20000001], '이름': ['가', '가', '나', '나'],
+                  '정답여부': ['Y', 'Y', 'N', None]}).to_csv(csv_path, index=False, encoding='utf-8-sig')
+
+    # analyze_integrated_grades 와 같은 (시기, 학번) 키
+    keys = StudentKeys()
+    frame = pd.DataFrame({'학번': [20000001, 20000002], '이름': ['나', '가']})
+    add_student_ids(frame, '2025-11', keys)
+    scores = campus_scores(csv_path, 'GT2', keys)
+    assert len(keys) == 2
+    assert scores.set_index('student_id')['Score'].to_dict() == dict(zip(frame['student_id'], [0, 2]))
+    assert (scores['Level'] == 'GT2').all()
+
+    state = CohortState(scores, keys=keys)
+    state.save(str(tmp_path / 'state'))
+    loaded = CohortState.load(str(tmp_path / 'state'))
+    pd.testing.assert_frame_equal(loaded.students, state.students)
+    labelled = loaded.labelled(loaded.grades())
+    assert labelled.columns[:4].tolist() == ['Level', '학번', '이름', 'Score']
+    assert labelled.set_index('학번')['이름'].to_dict() == {20000001: '나', 20000002: '가'}
@@ -0,0 +1,34 @@
+import os
+
+import pandas as pd
+
+from lt_data.grading import CUTS_PATH, compile_markdown, load_cuts, parse_cut_markdown
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DOCUMENTS = [os.path.join(ROOT, '등급컷(60문항)기준.md'), os.path.join(ROOT, '등급컷.md')]
+
+
+def test_compile_markdown_reproduces_grade_cuts(tmp_path):
+    out = str(tmp_path / 'grade_cuts.csv')
+    compile_markdown(DOCUMENTS, out)
+    with open(out, 'rb') as a, open(CUTS_PATH, 'rb') as b:
+        assert a.read() == b.read()
+
+
+def test_document_order_only_changes_row_order(tmp_path):
+    out = str(tmp_path / 'grade_cuts.csv')
+    compiled = compile_markdown(DOCUMENTS[::-1], out)
+    committed = pd.read_csv(CUTS_PATH, encoding='utf-8-sig', dtype={'GRADE': str})
+    key = ['SCHEME', 'ORDER']
+    pd.testing.assert_frame_equal(
+        compiled.astype({'SCALE': 'float64', 'CUT': 'float64'}).sort_values(key).reset_index(drop=True),
+        committed.astype({'CUT': 'float64'}).sort_values(key).reset_index(drop=True))
+    assert {name: table.cuts for name, table in load_cuts(out).items()} == \
+        {name: table.cuts for name, table in load_cuts().items()}
+
+
+def test_parse_cut_markdown_skips_header_rows():
+    schemes = {name: (kind, scale, cuts) for name, kind, scale, cuts in parse_cut_markdown(DOCUMENTS[1])}
+    kind, scale, cuts = schemes['수능_상대']
+    assert (kind, scale) == ('relative', None)
+    assert [grade for _, grade in cuts] == [str(g) for g in range(1, 10)]
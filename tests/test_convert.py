@@ -0,0 +1,44 @@
+import openpyxl
+import pandas as pd
+import pytest
+
+from lt_data.convert import convert_sheet, stream_sheet
+from lt_data.loader import cache_path
+
+
+def write_workbook(path):
+    # GR1 집계 시트처럼 위쪽에 제목 / 요약 행이 있고, 헤더 오른쪽 빈 칸 뒤에 별도 표가 있는 시트
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    ws.title = '학생별구간분류'
+    ws.append(['LT 11월 집계'])
+    ws.append([])
+    ws.append(['결과코드', '캠퍼스', '전체 문항수', 'MONTHLY_TEST_SCORE1', '비고', '구간', None, '참고'])
+    rows = [
+        [2401332, '대치', 60, 91.1, 'A', 'Below 1'],
+        [2400968, '목동', 60, 'NULL', None, 'Above 1'],
+        [2400903, '대치', 60.0, 80, 'B', 'On'],
+        [None, None, None, None, None, None],        # 중간 빈 행은 유지
+        [2401469, '목동', None, 77.5, 'NULL', 'On'],  # 뒤쪽 청크에서 처음 나오는 결측 -> 앞 청크의 60 도 60.0
+        [2395827, '강서', 60, 86.7, 'C', 'Below 2'],
+    ]
+    for row in rows:
+        ws.append(row)
+    ws.append([])
+    ws.append([])                                    # 끝부분 빈 행은 버린다
+    wb.save(path)
+    return ws.title
+
+
+@pytest.mark.parametrize('chunk_rows', [1, 2, 4, 100])
+def test_stream_sheet_matches_convert_sheet(tmp_path, chunk_rows):
+    pytest.importorskip('pyarrow')
+    workbook = tmp_path / 'GR1.xlsx'
+    sheet = write_workbook(workbook)
+    expected = str(tmp_path / 'excel.csv')
+    streamed = str(tmp_path / 'stream.csv')
+
+    assert convert_sheet(str(workbook), sheet, expected) == stream_sheet(str(workbook), sheet, streamed, chunk_rows=chunk_rows)
+    with open(expected, 'rb') as a, open(streamed, 'rb') as b:
+        assert a.read() == b.read()
+    pd.testing.assert_frame_equal(pd.read_parquet(cache_path(expected)), pd.read_parquet(cache_path(streamed)))
@@ -0,0 +1,55 @@
+import pandas as pd
+
+from lt_data.db import connect, ingest, query
+from lt_data.store import period_sources
+
+LEVELS = ['GT2', 'S2']
+
+
+def write_level_folder(folder, n_students=3, n_items=4):
+    # 2025 LT 처럼 레벨별 학생문항별결과 시트만 있는 폴더 (2025_11월_GT2.csv, 2025_11월_S2.csv)
+    folder.mkdir()
+    for offset, level in enumerate(LEVELS):
+        rows = []
+        for s in range(n_students):
+            for q in range(1, n_items + 1):
+                rows.append({
+                    '학번': 20000000 + offset * 100 + s,
+                    '이름': f'학생{offset}{s}',
+                    '교육과정': level,
+                    '캠퍼스': '대치' if s % 2 == 0 else '목동',
+                    '학급': f'{level}-0',
+                    '시험과목': 'Reading',
+                    '문항 순번': q,
+                    '정답여부': 'Y' if (s + q) % 2 == 0 else 'N',
+                    '스킬': f'SK{q}',
+                    '문항난이도': '★' * q,
+                })
+        pd.DataFrame(rows).to_csv(folder / f'2025_11월_{level}.csv', index=False, encoding='utf-8-sig')
+    return folder
+
+
+def test_period_sources_finds_level_sheets(tmp_path):
+    folder = write_level_folder(tmp_path / '2025_LT_11월_data')
+    period, files = period_sources(str(folder), '2025-11')
+    assert period == '2025-11'
+    assert sorted(level for level, _ in files['items']) == LEVELS
+
+
+def test_ingest_level_folder(tmp_path):
+    folder = write_level_folder(tmp_path / '2025_LT_11월_data')
+    conn = connect(str(tmp_path / 'lt.db'))
+    counts = ingest(conn, '2025-11', str(folder))
+    assert counts['student'] == 6
+    assert counts['item'] == 8
+    assert counts['response'] == 24
+
+    students = query(conn, 'SELECT "교육과정", COUNT(*) AS n FROM student GROUP BY 1 ORDER BY 1')
+    assert students.set_index('교육과정')['n'].to_dict() == {'GT2': 3, 'S2': 3}
+    stats = query(conn, 'SELECT SUM("응시인원") AS answered, SUM("정답인원") AS correct FROM campus_item_stats')
+    assert stats.loc[0, 'answered'] == 24
+    assert stats.loc[0, 'correct'] == 12
+
+    # 다시 적재해도 행이 늘지 않는다
+    ingest(conn, '2025-11', str(folder))
+    assert query(conn, 'SELECT COUNT(*) AS n FROM response').loc[0, 'n'] == 24
@@ -0,0 +1,63 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from lt_data.grading import CUTS_PATH, grade_schemes, load_cuts
+
+CUTS = pd.read_csv(CUTS_PATH, encoding='utf-8-sig', dtype={'GRADE': str})
+SCHEMES = list(CUTS['SCHEME'].unique())
+
+
+def reference_grade(scheme, value):
+    # grade_cuts.csv 를 ORDER 순서대로 훑는 기존 방식 (get_absolute_grade / get_relative_grade)
+    rows = CUTS[CUTS['SCHEME'] == scheme].sort_values('ORDER')
+    for row in rows.itertuples():
+        if (value >= row.CUT) if row.KIND == 'absolute' else (value <= row.CUT):
+            return row.GRADE
+    return rows['GRADE'].iloc[-1]
+
+
+def boundary_values(scheme):
+    cuts = CUTS.loc[CUTS['SCHEME'] == scheme, 'CUT'].to_numpy(dtype=np.float64)
+    return np.unique(np.concatenate([cuts, cuts - 1e-9, cuts + 1e-9, cuts - 0.5, cuts + 0.5, [-1, 0, 100, 101]]))
+
+
+@pytest.mark.parametrize('scheme', SCHEMES)
+def test_grade_matches_cut_table_at_every_boundary(scheme):
+    table = load_cuts()[scheme]
+    values = boundary_values(scheme)
+    expected = [reference_grade(scheme, v) for v in values]
+    assert [str(g) for g in table.grade(values)] == expected
+
+
+@pytest.mark.parametrize('scheme', SCHEMES)
+def test_exact_cut_belongs_to_its_grade(scheme):
+    table = load_cuts()[scheme]
+    rows = CUTS[CUTS['SCHEME'] == scheme].sort_values('ORDER')
+    for this, below in zip(rows.itertuples(), rows.iloc[1:].itertuples()):
+        assert str(table.grade(this.CUT)) == this.GRADE
+        # absolute: 컷 바로 아래는 다음 등급, relative: 컷 바로 위 (백분위가 더 나쁨) 는 다음 등급
+        step = -1e-9 if this.KIND == 'absolute' else 1e-9
+        assert str(table.grade(this.CUT + step)) == below.GRADE
+
+
+def test_legacy_cut_constants():
+    # analyze_integrated_grades 의 예전 ABSOLUTE_CUTS / RELATIVE_CUTS 와 같다
+    tables = load_cuts()
+    assert tables['수능_절대_60'].cuts == [(54, '1'), (48, '2'), (42, '3'), (36, '4'), (30, '5'),
+                                         (24, '6'), (18, '7'), (12, '8'), (0, '9')]
+    assert tables['수능_상대'].cuts == [(4, '1'), (11, '2'), (23, '3'), (40, '4'), (60, '5'),
+                                     (77, '6'), (89, '7'), (96, '8'), (100, '9')]
+    assert tables['수능_절대_60'].grade(np.nan) == 9
+    series = pd.Series([60, 53, 0], index=[3, 1, 2])
+    pd.testing.assert_series_equal(tables['수능_절대_60'].grade(series), pd.Series([1, 2, 9], index=[3, 1, 2]))
+
+
+def test_grade_schemes_matches_rank_percentile():
+    rng = np.random.default_rng(0)
+    scores = pd.Series(rng.integers(0, 61, size=500))
+    wide = grade_schemes(scores, max_score=60)
+    percentile = scores.rank(method='min', ascending=False) / len(scores) * 100
+    np.testing.assert_allclose(wide['Percentile'], percentile)
+    assert [str(g) for g in wide['수능_상대']] == [reference_grade('수능_상대', p) for p in percentile]
+    assert [str(g) for g in wide['수능_절대_100']] == [reference_grade('수능_절대_100', s * 100 / 60) for s in scores]
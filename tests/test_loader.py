@@ -0,0 +1,29 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from lt_data.loader import compact_frame, read_sheet, write_cache
+
+
+def test_compact_frame_keeps_missing_answers():
+    df = compact_frame(pd.DataFrame({'정답여부': ['Y', 'N', None, '', 'Y']}))
+    assert isinstance(df['정답여부'].dtype, pd.BooleanDtype)
+    assert df['정답여부'].tolist() == [True, False, pd.NA, pd.NA, True]
+    # 결측은 정답도 오답도 아니다
+    assert int(df['정답여부'].sum()) == 2
+    assert int((df['정답여부'] == False).sum()) == 1  # noqa: E712
+    # 여러 번 호출해도 같다
+    pd.testing.assert_frame_equal(compact_frame(df.copy()), df)
+    # 예전 캐시 (numpy bool) 도 같은 dtype 으로
+    assert isinstance(compact_frame(pd.DataFrame({'정답여부': np.array([True, False])}))['정답여부'].dtype, pd.BooleanDtype)
+
+
+def test_read_sheet_cache_matches_csv(tmp_path):
+    pytest.importorskip('pyarrow')
+    path = str(tmp_path / 'sheet.csv')
+    pd.DataFrame({'학번': [1, 1, 2], '문항 순번': [1, 2, 1], '정답여부': ['Y', None, 'N']}).to_csv(
+        path, index=False, encoding='utf-8-sig')
+    from_csv = read_sheet(path)
+    write_cache(from_csv, path)
+    pd.testing.assert_frame_equal(read_sheet(path), from_csv)
+    assert from_csv['정답여부'].isna().tolist() == [False, True, False]
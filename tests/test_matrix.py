@@ -0,0 +1,31 @@
+import numpy as np
+import pandas as pd
+
+from lt_data.loader import compact_frame
+from lt_data.matrix import ResponseMatrix
+
+
+def random_responses(seed=0, n_students=40, positions=(1, 2, 3, 5, 6, 9)):
+    # 4, 7, 8 번 위치는 시험에 없고, 응답 행 일부가 빠진 학생문항별결과
+    rng = np.random.default_rng(seed)
+    rows = [(s, q) for s in range(n_students) for q in positions if rng.random() > 0.1]
+    df = pd.DataFrame(rows, columns=['학번', '문항 순번'])
+    df['캠퍼스'] = np.array(['대치', '목동', '분당'])[df['학번'] % 3]
+    df['정답여부'] = rng.choice(['Y', 'N', None], size=len(df), p=[0.6, 0.35, 0.05])
+    return compact_frame(df)
+
+
+def test_position_curve_matches_groupby():
+    df = random_responses()
+    matrix = ResponseMatrix.from_frame(df)
+    correct = df['정답여부'].fillna(False).astype(bool)
+    expected = (correct.groupby([df['문항 순번'].astype(np.int64), df['캠퍼스']]).mean() * 100).unstack()
+    expected = expected.reindex(pd.RangeIndex(1, 10, name='Position'))
+
+    curve = matrix.position_curve('캠퍼스', block_rows=7)
+    np.testing.assert_allclose(curve.to_numpy(), expected.to_numpy())
+    assert list(curve.columns) == ['대치', '목동', '분당']
+    assert curve.loc[[4, 7, 8]].isna().all().all()
+
+    overall = matrix.position_curve()['Accuracy_%'].dropna()
+    np.testing.assert_allclose(overall.to_numpy(), matrix.p_values().to_numpy() * 100)
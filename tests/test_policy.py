@@ -0,0 +1,74 @@
+import numpy as np
+import pytest
+
+from lt_data.policy import SegmentPolicy, evaluate_policies, load_policies
+
+LEVELS = ['below2', 'below1', 'on', 'above1', 'above2']
+
+
+# 정책을 설정으로 옮기기 전 스크립트의 분류 함수 (reanalyze_gt1_1796 / analyze_gt1_c_or)
+def classify_a(score):
+    if score <= 6: return 'below2'
+    elif score <= 11: return 'below1'
+    elif score <= 15: return 'on'
+    elif score <= 17: return 'above1'
+    else: return 'above2'
+
+
+def classify_b(percentile):
+    if percentile < 20: return 'below2'
+    elif percentile < 40: return 'below1'
+    elif percentile < 70: return 'on'
+    elif percentile < 90: return 'above1'
+    else: return 'above2'
+
+
+def classify_b_new(percentile):
+    if percentile <= 30: return 'below2'
+    elif percentile <= 55: return 'below1'
+    elif percentile <= 75: return 'on'
+    elif percentile <= 85: return 'above1'
+    else: return 'above2'
+
+
+def classify_c(score, percentile):
+    criteria = {
+        'below2': (0, 6, 0, 30),
+        'below1': (7, 11, 30, 55),
+        'on': (12, 15, 55, 75),
+        'above1': (16, 17, 75, 85),
+        'above2': (18, 20, 85, 100),
+    }
+    for segment, (min_s, max_s, min_p, max_p) in criteria.items():
+        if min_s <= score <= max_s:
+            if segment == 'above2':
+                if min_p <= percentile <= max_p:
+                    return segment
+            elif min_p <= percentile < max_p:
+                return segment
+    return 'unclassified'
+
+
+def classify_c_or(score, percentile):
+    return LEVELS[min(LEVELS.index(classify_a(score)), LEVELS.index(classify_b_new(percentile)))]
+
+
+def test_policies_match_scripts_at_every_boundary():
+    # 점수 0..20 (와 경계 +-0.5) x 모든 백분위 경계 (와 경계 +-1e-9)
+    scores = np.arange(-1, 21.5, 0.5)
+    cuts = np.array([0, 20, 30, 40, 55, 70, 75, 85, 90, 100], dtype=np.float64)
+    percentiles = np.unique(np.concatenate([cuts, cuts - 1e-9, cuts + 1e-9]))
+    score, percentile = (grid.reshape(-1) for grid in np.meshgrid(scores, percentiles))
+
+    result = evaluate_policies(load_policies(), score=score, percentile=percentile)
+    pairs = list(zip(score, percentile))
+    assert list(result['A안']) == [classify_a(s) for s, _ in pairs]
+    assert list(result['B안']) == [classify_b(p) for _, p in pairs]
+    assert list(result['B안_New']) == [classify_b_new(p) for _, p in pairs]
+    assert list(result['C안']) == [classify_c(s, p) for s, p in pairs]
+    assert list(result['C안_OR']) == [classify_c_or(s, p) for s, p in pairs]
+
+
+def test_segment_policy_is_abstract():
+    with pytest.raises(TypeError):
+        SegmentPolicy('x', LEVELS)
@@ -0,0 +1,50 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from lt_data.ranking import METHODS, percentile, rank
+
+
+def random_scores(seed, n=300, high=61, nan_share=0.05):
+    rng = np.random.default_rng(seed)
+    values = rng.integers(0, high, size=n).astype(np.float64)
+    values[rng.random(n) < nan_share] = np.nan
+    return pd.Series(values, index=rng.permutation(n) + 1000, name='Score')
+
+
+@pytest.mark.parametrize('method', METHODS)
+@pytest.mark.parametrize('ascending', [True, False])
+@pytest.mark.parametrize('pct', [False, True])
+def test_rank_matches_series_rank(method, ascending, pct):
+    for seed in range(20):
+        scores = random_scores(seed, n=1 + seed * 37, high=1 + seed % 7 * 10)
+        expected = scores.rank(method=method, ascending=ascending, pct=pct)
+        pd.testing.assert_series_equal(rank(scores, method=method, ascending=ascending, pct=pct), expected)
+        np.testing.assert_array_equal(rank(scores.to_numpy(), method=method, ascending=ascending, pct=pct),
+                                      expected.to_numpy())
+
+
+@pytest.mark.parametrize('values', [
+    [2.5, 1.0, 2.5, np.nan, 0.25],            # 정수가 아님 -> Series.rank
+    [20240001, 20250002, 3, 20240001],        # 값 범위가 넓음 (학번) -> Series.rank
+    [np.nan, np.nan],
+    [],
+])
+def test_rank_fallback_and_edge_cases(values):
+    series = pd.Series(values, dtype=np.float64)
+    for method in METHODS:
+        pd.testing.assert_series_equal(rank(series, method=method, ascending=False),
+                                       series.rank(method=method, ascending=False))
+
+
+def test_percentile_and_integrated_grades_rank():
+    scores = random_scores(99, n=1000, nan_share=0)
+    pd.testing.assert_series_equal(percentile(scores), scores.rank(pct=True) * 100)
+    # analyze_integrated_grades 의 Rank (동점은 같은 석차, 높은 점수가 1등)
+    pd.testing.assert_series_equal(rank(scores, method='min', ascending=False),
+                                   scores.rank(method='min', ascending=False))
+
+
+def test_rank_rejects_unknown_method():
+    with pytest.raises(ValueError):
+        rank([1, 2], method='top')
@@ -0,0 +1,63 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from lt_data.simulate import CutSimulator, candidate_grid, score_histograms, student_scores
+
+
+def random_students(seed=0, n=500, max_score=20):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({'Level': rng.choice(['GT1', 'MGT1', 'S1'], size=n),
+                         'Score': rng.integers(0, max_score + 1, size=n)})
+
+
+def segment(score, cuts, side):
+    # 학생 한 명씩: 넘은 경계 수
+    return sum(score >= c if side == 'lower' else score > c for c in cuts)
+
+
+@pytest.mark.parametrize('side', ['lower', 'upper'])
+def test_simulator_matches_per_student_brute_force(side):
+    students = random_students()
+    hist = score_histograms(students)
+    current = [6, 11, 15, 17]
+    simulator = CutSimulator(hist, current, side=side)
+    rng = np.random.default_rng(1)
+    candidates = np.sort(rng.choice(np.arange(0, 21, 0.5), size=(50, 4), replace=True), axis=1)
+
+    counts, moved = simulator.run(candidates, batch=7)
+    for k, cuts in enumerate(candidates):
+        now = students['Score'].map(lambda s: segment(s, current, side))
+        new = students['Score'].map(lambda s: segment(s, cuts, side))
+        for j, level in enumerate(simulator.levels):
+            mine = students['Level'] == level
+            assert list(counts[k, j]) == list(np.bincount(new[mine], minlength=5))
+            assert moved[k, j] == int((now[mine] != new[mine]).sum())
+        crosstab = pd.crosstab(now, new).reindex(index=range(5), columns=range(5), fill_value=0)
+        np.testing.assert_array_equal(simulator.crosstab(cuts).to_numpy(), crosstab.to_numpy())
+
+
+def test_summary_shares():
+    students = random_students(seed=2)
+    simulator = CutSimulator(score_histograms(students), [6, 11, 15, 17], side='upper',
+                             labels=['below2', 'below1', 'on', 'above1', 'above2'])
+    summary = simulator.summary(candidate_grid([6, 11, 15, 17], spread=1))
+    sizes = students['Level'].value_counts()
+    assert (summary[['below2', 'below1', 'on', 'above1', 'above2']].sum(axis=1).to_numpy()
+            == summary['Level'].map(sizes).to_numpy()).all()
+    # 현재 컷 자신은 아무도 움직이지 않는다
+    assert (summary.loc[summary['Cuts'] == '6/11/15/17', 'Moved'] == 0).all()
+
+
+def test_candidate_grid_is_every_ascending_vector():
+    grid = candidate_grid([3, 4, 8], spread=1)
+    expected = [c for c in np.array(np.meshgrid([2, 3, 4], [3, 4, 5], [7, 8, 9], indexing='ij')).reshape(3, -1).T
+                if c[0] < c[1] < c[2]]
+    assert sorted(map(tuple, grid)) == sorted(map(tuple, expected))
+
+
+def test_student_scores_counts_correct_answers():
+    df = pd.DataFrame({'교육과정': ['GT1'] * 4 + ['S1'] * 2, '학번': [1, 1, 2, 2, 3, 3],
+                       '정답여부': pd.array([True, True, False, None, True, False], dtype='boolean')})
+    scores = student_scores(df).set_index('학번')['Score']
+    assert scores.to_dict() == {1: 2, 2: 0, 3: 1}
@@ -0,0 +1,70 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from lt_data.solver import TIE_RULES, from_top, solve_cuts
+
+
+def random_hist(seed, levels=('GT1', 'MGT1', 'S1'), max_score=20):
+    rng = np.random.default_rng(seed)
+    counts = rng.integers(0, 30, size=(len(levels), max_score + 1))
+    counts[:, rng.random(max_score + 1) < 0.2] = 0      # 아무도 받지 않은 점수
+    return pd.DataFrame(counts, index=pd.Index(levels, name='Level'),
+                        columns=pd.RangeIndex(max_score + 1, name='Score'))
+
+
+def brute_force_cut(scores_counts, target, tie):
+    # 모든 컷 후보 t (0..최고점+1) 를 하나씩: 컷 아래 (점수 < t) 인원과 목표 인원
+    total = scores_counts.sum()
+    goal = target / 100 * total
+    thresholds = range(len(scores_counts) + 1)
+    below = {t: int(scores_counts[:t].sum()) for t in thresholds}
+    under = max((t for t in thresholds if below[t] <= goal + 1e-9), default=0)
+    over = min((t for t in thresholds if below[t] >= goal - 1e-9), default=len(scores_counts))
+    if tie == 'under':
+        return under
+    if tie == 'over':
+        return over
+    return over if abs(below[over] - goal) < abs(below[under] - goal) else under
+
+
+@pytest.mark.parametrize('tie', TIE_RULES)
+def test_solve_cuts_matches_exhaustive_search(tie):
+    targets = [30, 55, 75, 85]
+    for seed in range(30):
+        hist = random_hist(seed)
+        result = solve_cuts(hist, targets, tie=tie)
+        for level, counts in hist.iterrows():
+            counts = counts.to_numpy()
+            cuts = [brute_force_cut(counts, t, tie) for t in targets]
+            assert result.loc[level, ['Cut1', 'Cut2', 'Cut3', 'Cut4']].tolist() == cuts
+            for j, (cut, target) in enumerate(zip(cuts, targets), start=1):
+                achieved = counts[:cut].sum() / counts.sum() * 100
+                assert result.loc[level, f'Achieved{j}_%'] == pytest.approx(achieved)
+                if tie == 'under':
+                    assert achieved <= target + 1e-9
+                elif tie == 'over':
+                    assert achieved >= target - 1e-9
+
+
+def test_nearest_is_closest_over_whole_cut_grid():
+    for seed in range(30):
+        hist = random_hist(seed + 100)
+        result = solve_cuts(hist, [20, 40, 70, 90])
+        for level, counts in hist.iterrows():
+            counts = counts.to_numpy()
+            shares = np.concatenate([[0], counts.cumsum()]) / counts.sum() * 100
+            for j, target in enumerate([20, 40, 70, 90], start=1):
+                assert abs(result.loc[level, f'Achieved{j}_%'] - target) == pytest.approx(np.abs(shares - target).min())
+
+
+def test_from_top_and_per_level_targets():
+    assert from_top([4, 11, 23, 40, 60, 77, 89, 96, 100]) == [4, 11, 23, 40, 60, 77, 89, 96]
+    hist = random_hist(7)
+    targets = {'GT1': [30, 55], 'MGT1': [20, 40], 'S1': [50, 90]}
+    result = solve_cuts(hist, targets)
+    for level, goals in targets.items():
+        assert result.loc[level, ['Target1_%', 'Target2_%']].tolist() == goals
+        assert result.loc[level, 'N'] == hist.loc[level].sum()
+    with pytest.raises(ValueError):
+        solve_cuts(hist, [55, 30])
@@ -2,6 +2,13 @@ import pandas as pd
 import matplotlib.pyplot as plt
 import numpy as np
 import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from lt_data.keys import add_student_ids
+from lt_data.loader import read_sheet
+from lt_data.policy import SEGMENT_ORDER, evaluate_policies, load_policies
+from lt_data.ranking import percentile
 
 # Set Korean font
 plt.rcParams['font.family'] = 'Malgun Gothic'
@@ -22,67 +29,45 @@ print("=" * 80)
 # Load data
 print("\n[1] 데이터 로딩...")
 # 각 월별 데이터 CSV 파일 경로
-df_items = pd.read_csv(csv_file_path, encoding='utf-8-sig')
-df_gt1 = df_items[df_items['레벨'] == 'GT1'].copy()
+df_items = read_sheet(csv_file_path, columns=['결과코드', '교육과정', '이름', '정답여부'])
+df_gt1 = df_items[df_items['교육과정'] == 'GT1'].copy()
 
-# 고유 식별자 생성 (학생명 + 코드)
-# 코드는 첫 번째 컬럼
-df_gt1['학생_ID'] = df_gt1['학생명'].astype(str) + '_' + df_gt1.iloc[:, 0].astype(str)
+# 학생 대리키 (int32): (시기, 결과코드) -> student_id
+# 이름은 dimension 표에만 두고 groupby 는 정수 키로 한다
+keys = add_student_ids(df_gt1, '2024-11')
 
 # 학생별 총점 계산
-student_scores = df_gt1.groupby('학생_ID').agg({
-    '학생명': 'first',
-    '정답 여부': lambda x: (x == 'Y').sum()
-}).reset_index()
-student_scores.columns = ['학생_ID', '학생명', '전체_정답_수']
+scores = df_gt1.groupby('student_id')['정답여부'].sum()
+students = keys.dimension.set_index('student_id').loc[scores.index]
+
+# 학생_ID (학생명 + 코드) 는 출력용으로 학생당 한 번만 만든다
+student_scores = pd.DataFrame({
+    '학생_ID': students['이름'] + '_' + students['key'].astype(str),
+    '학생명': students['이름'],
+    '전체_정답_수': scores.to_numpy(),
+}).sort_values('학생_ID').reset_index(drop=True)
 
 total_students = len(student_scores)
 print(f"   GT1 학생 수: {total_students:,}명")
 
 # Calculate percentile (Rank pct)
-student_scores['백분위'] = student_scores['전체_정답_수'].rank(pct=True) * 100
+student_scores['백분위'] = percentile(student_scores['전체_정답_수'])
 
 # ============================================================================
 # 분류 로직 정의
 # ============================================================================
 
 # 레벨 순서 (낮은 순)
-level_order = ['below2', 'below1', 'on', 'above1', 'above2']
-level_rank = {lvl: i for i, lvl in enumerate(level_order)}
-
-# A안 (절대평가)
-def classify_a(score):
-    if score <= 6: return 'below2'
-    elif score <= 11: return 'below1'
-    elif score <= 15: return 'on'
-    elif score <= 17: return 'above1'
-    else: return 'above2'
-
-# B안 (새로운 백분위 기준 for C안)
-# 0~30 / 30~55 / 55~75 / 75~85 / 85~100
-def classify_b_new(percentile):
-    if percentile <= 30: return 'below2'
-    elif percentile <= 55: return 'below1'
-    elif percentile <= 75: return 'on'
-    elif percentile <= 85: return 'above1'
-    else: return 'above2'
-
-# C안 (하향 OR)
-def classify_c_or(row):
-    level_a = classify_a(row['전체_정답_수'])
-    level_b = classify_b_new(row['백분위'])
-    
-    # 둘 중 더 낮은 레벨 선택 (Min)
-    rank_a = level_rank[level_a]
-    rank_b = level_rank[level_b]
-    
-    final_rank = min(rank_a, rank_b)
-    return level_order[final_rank]
+level_order = SEGMENT_ORDER
+
+# A안 (절대평가), B안_New (새로운 백분위 기준 0~30 / 30~55 / 55~75 / 75~85 / 85~100)
+# C안_OR (하향 OR): A안과 B안_New 중 더 낮은 레벨 (lt_data/segment_policies.json)
+POLICIES = load_policies()
 
 # 분류 적용
-student_scores['A안'] = student_scores['전체_정답_수'].apply(classify_a)
-student_scores['B안_New'] = student_scores['백분위'].apply(classify_b_new)
-student_scores['C안_OR'] = student_scores.apply(classify_c_or, axis=1)
+segments = evaluate_policies(POLICIES, ['A안', 'B안_New', 'C안_OR'],
+                             score=student_scores['전체_정답_수'], percentile=student_scores['백분위'])
+student_scores = student_scores.join(segments)
 
 # ============================================================================
 # 분포 분석
@@ -2,6 +2,11 @@ import pandas as pd
 import matplotlib.pyplot as plt
 import numpy as np
 import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from lt_data.loader import read_sheet
+from lt_data.matrix import ResponseMatrix
 
 # Set Korean font
 plt.rcParams['font.family'] = 'Malgun Gothic'
@@ -21,13 +26,14 @@ print("=" * 80)
 # Load data
 print("\n[1] 데이터 로딩...")
 # 각 월별 데이터 CSV 파일 경로
-df_items = pd.read_csv(csv_file_path, encoding='utf-8-sig')
-df_gt1 = df_items[df_items['레벨'] == 'GT1'].copy()
+# 표준 스키마로 읽는다 (레벨 -> 교육과정, 정답 여부 -> 정답여부 bool)
+df_items = read_sheet(csv_file_path)
+df_gt1 = df_items[df_items['교육과정'] == 'GT1']
 
-# 고유 식별자 생성
-df_gt1['학생_ID'] = df_gt1['학생명'].astype(str) + '_' + df_gt1.iloc[:, 0].astype(str)
+# 학생(결과코드) x 문항 정답 행렬
+matrix = ResponseMatrix.from_frame(df_gt1, student_key='결과코드')
 
-total_students = df_gt1['학생_ID'].nunique()
+total_students = matrix.n_students
 print(f"   GT1 학생 수: {total_students:,}명")
 
 # Skill 매핑
@@ -51,15 +57,17 @@ for difficulty, item_nums in difficulty_mapping.items():
 print("\n[2] Skill별 정답률 계산...")
 skill_results = []
 
-for item_num in range(1, 21):
-    item_data = df_gt1[df_gt1['문항 순번'] == item_num]
-    
-    if len(item_data) == 0:
+# 문항별 정답 수 / 응답 수를 행렬의 열 합으로 한 번에 계산
+correct_counts, attempt_counts = matrix.item_counts()
+
+for item_num, total_attempts, correct_count in zip(matrix.items['문항 순번'], attempt_counts, correct_counts):
+    item_num = int(item_num)
+    if total_attempts == 0:
         continue
     
-    total_attempts = len(item_data)
-    correct_count = len(item_data[item_data['정답 여부'] == 'Y'])
-    wrong_count = len(item_data[item_data['정답 여부'] == 'N'])
+    total_attempts = int(total_attempts)
+    correct_count = int(correct_count)
+    wrong_count = total_attempts - correct_count
     
     correct_rate = (correct_count / total_attempts * 100) if total_attempts > 0 else 0
     wrong_rate = (wrong_count / total_attempts * 100) if total_attempts > 0 else 0
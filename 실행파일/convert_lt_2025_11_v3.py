@@ -1,42 +1,74 @@
 import pandas as pd
+import argparse
 import os
+import sys
 
-def convert_excel_sheets_to_csv():
-    # Define file paths
-    # Using absolute paths as per instructions
-    input_file = r'c:\Users\user\projects\LT_data_analysis\raw_data\2025년_11월_Gr2_LT_문항데이터_v3.xlsx'
-    output_dir = r'c:\Users\user\projects\LT_data_analysis\2025_LT_11월_data'
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from lt_data.convert import convert_jobs
+from lt_data.manifest import load_manifest, record, save_manifest, stale_sheets
 
-    # Ensure output directory exists
-    if not os.path.exists(output_dir):
-        os.makedirs(output_dir)
-        print(f"Created directory: {output_dir}")
+# (입력 통합문서, 출력 폴더, 출력 파일 접두어)
+# Using absolute paths as per instructions
+WORKBOOKS = [
+    (r'c:\Users\user\projects\LT_data_analysis\raw_data\2025년_11월_Gr2_LT_문항데이터_v3.xlsx',
+     r'c:\Users\user\projects\LT_data_analysis\2025_LT_11월_data', '2025_11월'),
+    (r'c:\Users\user\projects\LT_data_analysis\raw_data\LT_데이터집계_2024년_11월_GR1_251028.xlsx',
+     r'c:\Users\user\projects\LT_data_analysis\2024_11월_data', '2024_11월'),
+]
 
+def convert_excel_sheets_to_csv(force=False, workers=None, stream=False, workbooks=WORKBOOKS):
     try:
-        print(f"Reading Excel file: {input_file}")
-        # Read the Excel file
-        xls = pd.ExcelFile(input_file)
-
-        # Iterate through each sheet
-        for sheet_name in xls.sheet_names:
-            print(f"Processing sheet: {sheet_name}")
-            
-            # Read the sheet into a DataFrame
-            df = pd.read_excel(xls, sheet_name=sheet_name)
-            
-            # Construct the output CSV filename
-            # Naming convention: 2025_11월_[SheetName].csv
-            output_filename = f'2025_11월_{sheet_name}.csv'
-            output_path = os.path.join(output_dir, output_filename)
-            
-            # Save to CSV
-            df.to_csv(output_path, index=False, encoding='utf-8-sig')
-            print(f"Saved {output_filename} to {output_dir}")
-            
-        print("All sheets converted successfully.")
+        jobs = []
+        pending = []
+        manifests = {}
+
+        for input_file, output_dir, prefix in workbooks:
+            # Ensure output directory exists
+            if not os.path.exists(output_dir):
+                os.makedirs(output_dir)
+                print(f"Created directory: {output_dir}")
+
+            print(f"Reading Excel file: {input_file}")
+            sheet_names = pd.ExcelFile(input_file).sheet_names
+
+            # Construct the output CSV filenames
+            # Naming convention: [prefix]_[SheetName].csv
+            outputs = {
+                sheet_name: os.path.join(output_dir, f'{prefix}_{sheet_name}.csv')
+                for sheet_name in sheet_names
+            }
+
+            # Skip sheets whose source content is unchanged since the last run
+            manifest = manifests.setdefault(output_dir, load_manifest(output_dir))
+            source_hash, digests, stale = stale_sheets(input_file, outputs, manifest, force=force)
+
+            for sheet_name in sheet_names:
+                if sheet_name not in stale:
+                    print(f"Unchanged sheet: {sheet_name} (keeping {os.path.basename(outputs[sheet_name])})")
+                    continue
+                jobs.append((input_file, sheet_name, outputs[sheet_name]))
+                pending.append((manifest, source_hash, digests[sheet_name]))
+
+        # Convert every stale sheet of every workbook in one process pool
+        # (stream=True walks rows in read-only mode and writes fixed-size chunks)
+        print(f"Converting {len(jobs)} sheet(s)...")
+        row_counts = convert_jobs(jobs, workers=workers, stream=stream)
+
+        for (input_file, sheet_name, output_path), (manifest, source_hash, sheet_hash), rows in zip(jobs, pending, row_counts):
+            record(manifest, input_file, source_hash, sheet_name, sheet_hash, output_path)
+            print(f"Saved {os.path.basename(output_path)} ({rows:,} rows)")
+
+        for output_dir, manifest in manifests.items():
+            save_manifest(output_dir, manifest)
+        print(f"All sheets converted successfully. ({len(jobs)} re-converted)")
 
     except Exception as e:
         print(f"An error occurred: {e}")
 
 if __name__ == "__main__":
-    convert_excel_sheets_to_csv()
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--force', action='store_true', help='re-convert every sheet')
+    parser.add_argument('--workers', type=int, default=None, help='process count (default: CPU count, 1 = serial)')
+    parser.add_argument('--stream', action='store_true', help='bounded-memory row streaming for very large sheets')
+    args = parser.parse_args()
+    convert_excel_sheets_to_csv(force=args.force, workers=args.workers, stream=args.stream)
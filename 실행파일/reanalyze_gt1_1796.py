@@ -3,6 +3,13 @@ import matplotlib.pyplot as plt
 import numpy as np
 from scipy import stats
 import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from lt_data.keys import add_student_ids
+from lt_data.loader import read_sheet
+from lt_data.policy import SEGMENT_ORDER, evaluate_policies, load_policies
+from lt_data.ranking import percentile
 
 # Set Korean font
 plt.rcParams['font.family'] = 'Malgun Gothic'
@@ -22,19 +29,23 @@ print("=" * 80)
 # Load student-item data
 print("\n[1] 데이터 로딩...")
 # 각 월별 데이터 CSV 파일 경로
-df_items = pd.read_csv(csv_file_path, encoding='utf-8-sig')
-df_gt1 = df_items[df_items['레벨'] == 'GT1'].copy()
+df_items = read_sheet(csv_file_path, columns=['결과코드', '교육과정', '이름', '정답여부'])
+df_gt1 = df_items[df_items['교육과정'] == 'GT1'].copy()
 
-# 고유 식별자 생성 (학생명 + 코드)
-# 코드는 첫 번째 컬럼
-df_gt1['학생_ID'] = df_gt1['학생명'].astype(str) + '_' + df_gt1.iloc[:, 0].astype(str)
+# 학생 대리키 (int32): (시기, 결과코드) -> student_id
+# 이름은 dimension 표에만 두고 groupby 는 정수 키로 한다
+keys = add_student_ids(df_gt1, '2024-11')
 
 # 학생별 총점 계산
-student_scores = df_gt1.groupby('학생_ID').agg({
-    '학생명': 'first',
-    '정답 여부': lambda x: (x == 'Y').sum()
-}).reset_index()
-student_scores.columns = ['학생_ID', '학생명', '전체_정답_수']
+scores = df_gt1.groupby('student_id')['정답여부'].sum()
+students = keys.dimension.set_index('student_id').loc[scores.index]
+
+# 학생_ID (학생명 + 코드) 는 출력용으로 학생당 한 번만 만든다
+student_scores = pd.DataFrame({
+    '학생_ID': students['이름'] + '_' + students['key'].astype(str),
+    '학생명': students['이름'],
+    '전체_정답_수': scores.to_numpy(),
+}).sort_values('학생_ID').reset_index(drop=True)
 
 total_students = len(student_scores)
 print(f"   GT1 학생 수: {total_students:,}명")
@@ -42,58 +53,21 @@ print(f"   평균 점수: {student_scores['전체_정답_수'].mean():.2f}점")
 print(f"   표준편차: {student_scores['전체_정답_수'].std():.2f}")
 
 # Calculate percentile
-student_scores['백분위'] = student_scores['전체_정답_수'].rank(pct=True) * 100
+student_scores['백분위'] = percentile(student_scores['전체_정답_수'])
 
 # ============================================================================
 # A안, B안, C안 분류
 # ============================================================================
 print("\n[2] A/B/C안 기준으로 분류...")
 
-# A안 절대평가
-def classify_a(score):
-    if score <= 6: return 'below2'
-    elif score <= 11: return 'below1'
-    elif score <= 15: return 'on'
-    elif score <= 17: return 'above1'
-    else: return 'above2'
-
-# B안 상대평가
-def classify_b(percentile):
-    if percentile < 20: return 'below2'
-    elif percentile < 40: return 'below1'
-    elif percentile < 70: return 'on'
-    elif percentile < 90: return 'above1'
-    else: return 'above2'
-
-# C안 절대+상대
-def classify_c(row):
-    score = row['전체_정답_수']
-    percentile = row['백분위']
-    
-    criteria = {
-        'below2': (0, 6, 0, 30),
-        'below1': (7, 11, 30, 55),
-        'on': (12, 15, 55, 75),
-        'above1': (16, 17, 75, 85),
-        'above2': (18, 20, 85, 100)
-    }
-    
-    for segment, (min_s, max_s, min_p, max_p) in criteria.items():
-        if min_s <= score <= max_s:
-            if segment == 'above2':
-                if min_p <= percentile <= max_p:
-                    return segment
-            else:
-                if min_p <= percentile < max_p:
-                    return segment
-    return 'unclassified'
-
-student_scores['A안'] = student_scores['전체_정답_수'].apply(classify_a)
-student_scores['B안'] = student_scores['백분위'].apply(classify_b)
-student_scores['C안'] = student_scores.apply(classify_c, axis=1)
+# A안 절대평가 / B안 상대평가 / C안 절대+상대 (lt_data/segment_policies.json)
+POLICIES = load_policies()
+segments = evaluate_policies(POLICIES, ['A안', 'B안', 'C안'],
+                             score=student_scores['전체_정답_수'], percentile=student_scores['백분위'])
+student_scores = student_scores.join(segments)
 
 # 분포 계산
-segment_order = ['below2', 'below1', 'on', 'above1', 'above2']
+segment_order = SEGMENT_ORDER
 
 print("\nA안 (절대평가) 분포:")
 a_dist = student_scores['A안'].value_counts().reindex(segment_order, fill_value=0)
@@ -142,9 +116,8 @@ segment_colors = {
     'above2': '#2f855a'
 }
 
-for patch, left_edge in zip(patches, bins[:-1]):
-    score = int(left_edge)
-    segment = classify_a(score)
+bin_segments = POLICIES['A안'].classify(score=bins[:-1].astype(int))
+for patch, segment in zip(patches, bin_segments):
     patch.set_facecolor(segment_colors[segment])
     patch.set_alpha(0.7)
 